@@ -518,7 +518,7 @@ async def run_analytics(request: AnalyticsRequest):
     ```
     """
     try:
-        result = kg.analyze_graph(
+        result = await kg.analyze_graph(
             algorithm=request.algorithm,
             filters=request.filters,
             parameters=request.parameters
@@ -550,7 +550,7 @@ async def analyze_impact(request: ImpactAnalysisRequest):
         from shapely.geometry import shape
         geometry = shape(request.event_geometry)
         
-        result = kg.find_impacts(
+        result = await kg.find_impacts(
             event_geometry=geometry,
             event_type=request.event_type,
             max_hops=request.max_hops,
@@ -577,7 +577,7 @@ async def search_entities(
     """
     try:
         types = entity_types.split(',') if entity_types else None
-        results = kg.search_entities(
+        results = await kg.search_entities(
             search_term=q,
             entity_types=types,
             limit=limit
@@ -1597,6 +1597,7 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown."""
     print("👋 Tijara Knowledge Graph API (ORM) shutting down...")
+    await kg.graphiti.close()
 
 
 if __name__ == "__main__":
@@ -48,7 +48,7 @@ async def main():
     
     print("\n1. Finding most important trade network nodes (PageRank)...")
     try:
-        exporters = kg.analyze_graph(
+        exporters = await kg.analyze_graph(
             algorithm="pagerank",
             filters=None,
             parameters={"node_label": "Geography", "relationship_type": "TRADES_WITH"}
@@ -74,7 +74,7 @@ async def main():
     
     print("\n3. Community detection on trade networks...")
     try:
-        communities = kg.analyze_graph(
+        communities = await kg.analyze_graph(
             algorithm="community",
             filters=None,
             parameters={"relationship_type": "TRADES_WITH"}
@@ -110,7 +110,7 @@ async def main():
     
     print("\n2. Searching for French regions...")
     try:
-        search_results = kg.search_entities(
+        search_results = await kg.search_entities(
             search_term="France",
             entity_types=["Geography"],
             limit=5
@@ -130,7 +130,7 @@ async def main():
             (2.0, 48.5), (4.0, 48.5), (4.0, 50.5), (2.0, 50.5), (2.0, 48.5)
         ])
         
-        impacts = kg.find_impacts(
+        impacts = await kg.find_impacts(
             event_geometry=france_wheat_polygon,
             event_type="drought",
             max_hops=5,
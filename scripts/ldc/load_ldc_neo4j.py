@@ -3,20 +3,34 @@ Load LDC Dataset into Neo4j
 Parallel loader that creates the same graph structure in Neo4j as in FalkorDB
 """
 
-import csv
 import os
 import sys
-from typing import Dict, List, Any
-from neo4j import GraphDatabase
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Iterable, Optional
+import pandas as pd
+from neo4j import GraphDatabase, Result, RoutingControl
 import yaml
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-# Load configuration
+# libyaml-backed loader when available; same results as yaml.safe_load
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# Configuration
 CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'config', 'config.yaml')
-with open(CONFIG_PATH, 'r') as f:
-    config = yaml.safe_load(f)
+
+
+@lru_cache(maxsize=1)
+def load_config() -> Dict[str, Any]:
+    """Load configuration (parsed once per process, on first use)."""
+    with open(CONFIG_PATH, 'r') as f:
+        return yaml.load(f, Loader=YamlLoader)
+
 
 # Input data directory
 INPUT_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'ldc', 'input')
@@ -27,6 +41,291 @@ NEO4J_USER = "neo4j"
 NEO4J_PASSWORD = "six666six"
 NEO4J_DATABASE = "neo4j"
 
+# Driver tuning: enough pooled connections for the concurrent index DDL,
+# and large fetches so reads come back in as few Bolt round trips as possible
+NEO4J_DRIVER_OPTIONS = {
+    'max_connection_pool_size': 16,
+    'connection_acquisition_timeout': 60,
+    'keep_alive': True,
+    'fetch_size': 10000,
+    'user_agent': 'ldc-loader/1.0',
+    'telemetry_disabled': True,
+}
+
+# Rows sent per UNWIND write; each batch commits as one transaction
+BATCH_SIZE = 1000
+
+# MERGE/SET clauses for each entity, reading one input row as `row`. The
+# UNWIND batches and the server-side LOAD CSV queries both run these, so
+# the two load modes create the same nodes, labels and properties. Where
+# the row-by-row loader keeps the first row for a key, so do ON CREATE SET
+COMMODITY_CATEGORY_CLAUSES = """
+MERGE (c:Commodity:Category {name: row.name})
+ON CREATE SET c.level = 0, c.category = row.name
+"""
+
+COMMODITY_CLAUSES = """
+MERGE (c:Commodity {name: row.name})
+ON CREATE SET c.level = 1, c.category = row.category
+WITH c, row
+MATCH (parent:Commodity {name: row.parent})
+MERGE (c)-[:SUBCLASS_OF]->(parent)
+"""
+
+COMMODITY_VARIETY_CLAUSES = """
+MERGE (c:Commodity:Variety {name: row.name})
+ON CREATE SET c.level = 2, c.category = row.category, c.parent_commodity = row.parent
+WITH c, row
+MATCH (parent:Commodity {name: row.parent})
+MERGE (c)-[:SUBCLASS_OF]->(parent)
+"""
+
+COMMODITY_TYPE_CLAUSES = """
+MERGE (c:Commodity:Type {name: row.name})
+ON CREATE SET c.level = 3, c.category = row.category, c.parent_commodity = row.parent
+WITH c, row
+MATCH (parent:Commodity {name: row.parent})
+MERGE (c)-[:SUBCLASS_OF]->(parent)
+"""
+
+# One set of clauses per hierarchy level, indexed Level0..Level3
+COMMODITY_LEVEL_CLAUSES = [
+    COMMODITY_CATEGORY_CLAUSES,
+    COMMODITY_CLAUSES,
+    COMMODITY_VARIETY_CLAUSES,
+    COMMODITY_TYPE_CLAUSES,
+]
+
+GEOGRAPHY_CLAUSES = """
+MERGE (g:Geography {gid_code: row.gid_code})
+SET g.name = row.name, g.level = row.level
+FOREACH (_ IN CASE WHEN row.level = 0 THEN [1] ELSE [] END | SET g:Country)
+FOREACH (_ IN CASE WHEN row.level = 1 THEN [1] ELSE [] END | SET g:Region)
+FOREACH (_ IN CASE WHEN row.level = 2 THEN [1] ELSE [] END | SET g:SubRegion)
+WITH g, row
+MATCH (parent:Geography {gid_code: row.parent_gid})
+MERGE (g)-[:LOCATED_IN]->(parent)
+"""
+
+INDICATOR_CLAUSES = """
+MERGE (i:Indicator:WeatherIndicator {indicator_id: row.indicator_id})
+SET i.name = row.name,
+    i.indicator_type = row.indicator_type,
+    i.source_name = row.source_name,
+    i.forecast_days = row.forecast_days,
+    i.forecast_type = row.forecast_type,
+    i.unit = row.unit
+"""
+
+PRODUCTION_AREA_CLAUSES = """
+MERGE (p:ProductionArea {production_area_id: row.prod_area_id})
+ON CREATE SET p.crop_mask_id = row.crop_mask_id,
+    p.commodity = row.commodity,
+    p.season = row.season
+WITH p, row
+MATCH (c:Commodity {name: row.commodity})
+MERGE (p)-[:PRODUCES]->(c)
+"""
+
+PRODUCTION_AREA_GEOGRAPHY_CLAUSES = """
+MATCH (p:ProductionArea {production_area_id: row.prod_id})
+MATCH (g:Geography {gid_code: row.gid_code})
+MERGE (p)-[:LOCATED_IN]->(g)
+"""
+
+BALANCE_SHEET_CLAUSES = """
+MERGE (b:BalanceSheet {balance_sheet_id: row.bs_id})
+SET b.gid = row.gid,
+    b.product_name = row.product_name,
+    b.season = row.season
+WITH b, row
+CALL {
+    WITH b, row
+    MATCH (g:Geography {gid_code: row.gid})
+    MERGE (b)-[:FOR_GEOGRAPHY]->(g)
+}
+CALL {
+    WITH b, row
+    MATCH (c:Commodity {name: row.product_name})
+    MERGE (b)-[:FOR_COMMODITY]->(c)
+}
+"""
+
+COMPONENT_CLAUSES = """
+MERGE (c:Component {component_id: row.component_id})
+SET c.component_type = row.component_type
+WITH c, row
+MATCH (b:BalanceSheet {balance_sheet_id: row.bs_id})
+MERGE (b)-[:HAS_COMPONENT]->(c)
+"""
+
+TRADE_FLOW_CLAUSES = """
+MATCH (source:Geography {gid_code: row.source_country})
+MATCH (dest:Geography {gid_code: row.dest_country})
+MERGE (source)-[f:TRADES_WITH]->(dest)
+SET f.commodity = row.commodity,
+    f.season = row.season,
+    f.source_ts_id = row.source_ts_id,
+    f.destination_ts_id = row.dest_ts_id,
+    f.flow_type = 'export_import'
+"""
+
+
+def unwind_query(clauses: str) -> str:
+    """UNWIND write query running clauses for each row of the $rows batch."""
+    return "UNWIND $rows AS row" + clauses
+
+
+# Cypher queries, kept as constants so every batch sends identical text
+# and hits the server-side plan cache
+MERGE_COMMODITY_LEVELS = [unwind_query(clauses) for clauses in COMMODITY_LEVEL_CLAUSES]
+MERGE_GEOGRAPHY = unwind_query(GEOGRAPHY_CLAUSES)
+MERGE_INDICATOR = unwind_query(INDICATOR_CLAUSES)
+MERGE_PRODUCTION_AREA = unwind_query(PRODUCTION_AREA_CLAUSES)
+LINK_PRODUCTION_AREA_GEOGRAPHY = unwind_query(PRODUCTION_AREA_GEOGRAPHY_CLAUSES)
+MERGE_BALANCE_SHEET = unwind_query(BALANCE_SHEET_CLAUSES)
+MERGE_COMPONENT = unwind_query(COMPONENT_CLAUSES)
+MERGE_TRADE_FLOW = unwind_query(TRADE_FLOW_CLAUSES)
+
+# Delete in chunks so a large graph never sits in one transaction's state
+CLEAR_GRAPH = """
+MATCH (n)
+CALL {
+    WITH n
+    DETACH DELETE n
+} IN TRANSACTIONS OF 10000 ROWS
+"""
+
+COUNT_NODES_BY_LABEL = """
+MATCH (n)
+RETURN labels(n)[0] as type, count(n) as count
+ORDER BY count DESC
+"""
+
+COUNT_RELATIONSHIPS_BY_TYPE = """
+MATCH ()-[r]->()
+RETURN type(r) as type, count(r) as count
+ORDER BY count DESC
+"""
+
+CREATE_INDEXES = [
+    "CREATE INDEX commodity_name IF NOT EXISTS FOR (c:Commodity) ON (c.name)",
+    "CREATE INDEX geography_gid IF NOT EXISTS FOR (g:Geography) ON (g.gid_code)",
+    "CREATE INDEX geography_name IF NOT EXISTS FOR (g:Geography) ON (g.name)",
+    "CREATE INDEX production_area_id IF NOT EXISTS FOR (p:ProductionArea) ON (p.production_area_id)",
+    "CREATE INDEX balance_sheet_id IF NOT EXISTS FOR (b:BalanceSheet) ON (b.balance_sheet_id)",
+    "CREATE INDEX indicator_id IF NOT EXISTS FOR (i:Indicator) ON (i.indicator_id)",
+]
+
+# Server-side LOAD CSV queries (used with --import-url). The server reads
+# the file at $url itself and commits every 10000 rows, so no row data
+# crosses Bolt. Each CSV record is projected to the row the UNWIND path
+# builds, with empty fields normalised the same way read_csv does.
+def csv_text(column: str) -> str:
+    """Cypher expression for a stripped CSV field, '' when missing."""
+    return f"trim(coalesce(record.{column}, ''))"
+
+
+def csv_optional(column: str) -> str:
+    """Cypher expression for a stripped CSV field, null when empty."""
+    return f"CASE WHEN {csv_text(column)} = '' THEN null ELSE {csv_text(column)} END"
+
+
+def csv_int(column: str) -> str:
+    """Cypher expression for an integer CSV field, 0 when empty or invalid."""
+    return f"coalesce(toInteger({csv_text(column)}), 0)"
+
+
+def load_csv_query(row: str, clauses: str, where: str = "true") -> str:
+    """
+    LOAD CSV query running clauses for each CSV record.
+    
+    row is a Cypher map expression building the clauses' row from record;
+    rows not matching where are skipped.
+    """
+    return f"""
+LOAD CSV WITH HEADERS FROM $url AS record
+WITH {row} AS row
+WHERE {where}
+CALL {{
+    WITH row{clauses}}} IN TRANSACTIONS OF 10000 ROWS
+"""
+
+
+# Commodity rows of each level, as load_commodity_hierarchy builds them
+COMMODITY_LEVEL_ROWS = [
+    f"{{name: {csv_text('Level0')}}}",
+    f"{{name: {csv_text('Level1')}, category: {csv_text('Level0')}, parent: {csv_optional('Level0')}}}",
+    f"{{name: {csv_text('Level2')}, category: {csv_text('Level0')}, parent: {csv_optional('Level1')}}}",
+    f"{{name: {csv_text('Level3')}, category: {csv_text('Level0')}, "
+    f"parent: coalesce({csv_optional('Level2')}, {csv_optional('Level1')})}}",
+]
+
+# Levels load in order and a name keeps the first level it was loaded at,
+# as load_commodity_hierarchy's seen set does
+LOAD_CSV_COMMODITY_LEVELS = [
+    load_csv_query(
+        row, clauses,
+        f"row.name <> '' AND NOT EXISTS {{ MATCH (c:Commodity {{name: row.name}}) WHERE c.level <> {level} }}"
+    )
+    for level, (row, clauses) in enumerate(zip(COMMODITY_LEVEL_ROWS, COMMODITY_LEVEL_CLAUSES))
+]
+
+LOAD_CSV_GEOGRAPHY = load_csv_query(
+    f"{{gid_code: {csv_text('gid_code')}, name: {csv_text('name')}, level: {csv_int('level')}, "
+    f"parent_gid: {csv_optional('parent_gid_code')}}}",
+    GEOGRAPHY_CLAUSES
+)
+
+LOAD_CSV_INDICATOR = load_csv_query(
+    f"{{indicator_id: {csv_text('id')}, name: {csv_text('name')}, indicator_type: {csv_text('indicator')}, "
+    f"source_name: {csv_text('sourceName')}, forecast_days: {csv_int('forecastDays')}, "
+    f"forecast_type: {csv_text('forecastType')}, unit: {csv_text('unit')}}}",
+    INDICATOR_CLAUSES
+)
+
+LOAD_CSV_PRODUCTION_AREA = load_csv_query(
+    f"{{prod_area_id: {csv_text('production_area_id')}, crop_mask_id: {csv_text('crop_mask_id')}, "
+    f"commodity: {csv_text('commodity_name')}, season: {csv_optional('season')}}}",
+    PRODUCTION_AREA_CLAUSES
+)
+
+LOAD_CSV_PRODUCTION_AREA_GEOGRAPHY = load_csv_query(
+    f"{{prod_id: {csv_text('production_area_id')}, gid_code: {csv_text('gid_code')}}}",
+    PRODUCTION_AREA_GEOGRAPHY_CLAUSES
+)
+
+LOAD_CSV_BALANCE_SHEET = load_csv_query(
+    f"{{bs_id: {csv_text('id')}, gid: {csv_text('gid')}, product_name: {csv_text('product_name')}, "
+    f"season: {csv_optional('product_season')}}}",
+    BALANCE_SHEET_CLAUSES
+)
+
+LOAD_CSV_COMPONENT = load_csv_query(
+    f"{{bs_id: {csv_text('balancesheet_id')}, component_id: {csv_text('component_id')}, "
+    f"component_type: {csv_text('component_type')}}}",
+    COMPONENT_CLAUSES
+)
+
+LOAD_CSV_TRADE_FLOW = load_csv_query(
+    f"{{source_country: {csv_text('source_country')}, dest_country: {csv_text('destination_country')}, "
+    f"commodity: {csv_text('commodity')}, season: {csv_optional('commodity_season')}, "
+    f"source_ts_id: {csv_text('source_country_ts_id')}, dest_ts_id: {csv_text('destination_country_ts_id')}}}",
+    TRADE_FLOW_CLAUSES
+)
+
+# (description, file, queries) in dependency order for server-side loading
+LOAD_CSV_STEPS = [
+    ("📦 commodity hierarchy", 'commodity_hierarchy.csv', LOAD_CSV_COMMODITY_LEVELS),
+    # Run twice so geographies listed before their parent are linked too
+    ("🌍 geographic hierarchy", 'geometries.csv', [LOAD_CSV_GEOGRAPHY, LOAD_CSV_GEOGRAPHY]),
+    ("🌡️  weather indicator definitions", 'indicator_definition.csv', [LOAD_CSV_INDICATOR]),
+    ("🌾 production areas", 'production_areas.csv', [LOAD_CSV_PRODUCTION_AREA, LOAD_CSV_PRODUCTION_AREA_GEOGRAPHY]),
+    ("📊 balance sheets", 'balance_sheet.csv', [LOAD_CSV_BALANCE_SHEET]),
+    ("📈 balance sheet components", 'balance_sheet_component.csv', [LOAD_CSV_COMPONENT]),
+    ("🔄 trade flows", 'flows.csv', [LOAD_CSV_TRADE_FLOW]),
+]
+
 
 class Neo4jLDCLoader:
     """Loads LDC commodity data from CSV files into Neo4j."""
@@ -35,41 +334,90 @@ class Neo4jLDCLoader:
         """Initialize connection to Neo4j."""
         self.driver = GraphDatabase.driver(
             NEO4J_URI,
-            auth=(NEO4J_USER, NEO4J_PASSWORD)
+            auth=(NEO4J_USER, NEO4J_PASSWORD),
+            **NEO4J_DRIVER_OPTIONS
         )
         print(f"✓ Connected to Neo4j at {NEO4J_URI}")
         
-        # Track created entities for relationship linking
+        # Track created entity keys for relationship linking
         self.entities = {
-            'commodities': {},      # commodity_name -> node_id
-            'geographies': {},      # gid_code -> node_id
-            'balance_sheets': {},   # balance_sheet_id -> node_id
-            'components': {},       # component_id -> node_id
-            'indicators': {},       # indicator_id -> node_id
-            'production_areas': {}  # production_area_id -> node_id
+            'commodities': set(),      # commodity_name
+            'geographies': set(),      # gid_code
+            'balance_sheets': set(),   # balance_sheet_id
+            'components': set(),       # component_id
+            'indicators': set(),       # indicator_id
+            'production_areas': set()  # production_area_id
         }
     
     def close(self):
         """Close Neo4j connection."""
         self.driver.close()
     
+    def run_query(self, query: str, routing=RoutingControl.READ, **params):
+        """Run a read query through the driver-managed transaction API."""
+        records, _, _ = self.driver.execute_query(
+            query,
+            parameters_=params,
+            database_=NEO4J_DATABASE,
+            routing_=routing,
+            bookmark_manager_=None
+        )
+        return records
+    
+    def run_write(self, query: str, **params):
+        """Run a write query, returning only its summary (no records)."""
+        return self.driver.execute_query(
+            query,
+            parameters_=params,
+            database_=NEO4J_DATABASE,
+            routing_=RoutingControl.WRITE,
+            bookmark_manager_=None,
+            result_transformer_=Result.consume
+        )
+    
+    def run_batched(self, query: str, rows: List[Dict[str, Any]]):
+        """
+        Run an UNWIND write query over rows, one transaction per batch.
+        
+        The query receives each batch as the $rows parameter.
+        """
+        for start in range(0, len(rows), BATCH_SIZE):
+            self.run_write(query, rows=rows[start:start + BATCH_SIZE])
+    
+    def run_auto_commit(self, query: str, **params):
+        """
+        Run a query in an auto-commit transaction and return its summary.
+        
+        Needed for CALL { ... } IN TRANSACTIONS, which cannot run inside
+        a driver-managed transaction.
+        """
+        with self.driver.session(database=NEO4J_DATABASE) as session:
+            return session.run(query, params).consume()
+    
     def clear_graph(self):
         """Clear the existing graph data."""
         print(f"\n🗑️  Clearing existing data in Neo4j...")
-        with self.driver.session(database=NEO4J_DATABASE) as session:
-            session.run("MATCH (n) DETACH DELETE n")
+        self.run_auto_commit(CLEAR_GRAPH)
         print("✓ Graph cleared")
     
-    def read_csv(self, filename: str) -> List[Dict[str, str]]:
-        """Read CSV file and return list of dictionaries."""
+    def read_csv(self, filename: str, numeric_columns: Iterable[str] = ()) -> List[Dict[str, Any]]:
+        """
+        Read CSV file and return list of dictionaries.
+        
+        All fields are stripped once per column; numeric_columns are cast
+        to int with empty or invalid values defaulting to 0.
+        """
         filepath = os.path.join(INPUT_DIR, filename)
         if not os.path.exists(filepath):
             print(f"⚠️  Warning: {filename} not found")
             return []
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            return list(reader)
+        df = pd.read_csv(filepath, dtype=str, keep_default_na=False, encoding='utf-8')
+        for column in df.columns:
+            df[column] = df[column].str.strip()
+        for column in numeric_columns:
+            df[column] = pd.to_numeric(df[column], errors='coerce').fillna(0).astype('int64')
+        return df.to_dict(orient='records')
     
     def load_commodity_hierarchy(self):
         """Load commodity hierarchy from CSV."""
@@ -80,160 +428,89 @@ class Neo4jLDCLoader:
             print("⚠️  No commodity data found")
             return
         
-        with self.driver.session(database=NEO4J_DATABASE) as session:
-            # Create hierarchy: Level0 -> Level1 -> Level2 -> Level3
-            for row in rows:
-                level0 = row['Level0'].strip() if row.get('Level0') else ''
-                level1 = row['Level1'].strip() if row.get('Level1') else ''
-                level2 = row['Level2'].strip() if row.get('Level2') else ''
-                level3 = row['Level3'].strip() if row.get('Level3') else ''
-                
-                # Create or get Level0 (root category)
-                if level0 and level0 not in self.entities['commodities']:
-                    result = session.run("""
-                        MERGE (c:Commodity:Category {name: $name})
-                        SET c.level = 0, c.category = $name
-                        RETURN id(c) as node_id
-                    """, name=level0)
-                    self.entities['commodities'][level0] = result.single()['node_id']
-                
-                # Create Level1 (main commodity)
-                if level1 and level1 not in self.entities['commodities']:
-                    result = session.run("""
-                        MERGE (c:Commodity {name: $name})
-                        SET c.level = 1, c.category = $category
-                        RETURN id(c) as node_id
-                    """, name=level1, category=level0)
-                    node_id = result.single()['node_id']
-                    self.entities['commodities'][level1] = node_id
-                    
-                    # Link to parent
-                    if level0:
-                        session.run("""
-                            MATCH (parent:Commodity {name: $parent_name})
-                            MATCH (child:Commodity {name: $child_name})
-                            MERGE (child)-[:SUBCLASS_OF]->(parent)
-                        """, parent_name=level0, child_name=level1)
-                
-                # Create Level2 (variety)
-                if level2 and level2 not in self.entities['commodities']:
-                    result = session.run("""
-                        MERGE (c:Commodity:Variety {name: $name})
-                        SET c.level = 2, c.category = $category, c.parent_commodity = $parent
-                        RETURN id(c) as node_id
-                    """, name=level2, category=level0, parent=level1)
-                    node_id = result.single()['node_id']
-                    self.entities['commodities'][level2] = node_id
-                    
-                    # Link to parent
-                    if level1:
-                        session.run("""
-                            MATCH (parent:Commodity {name: $parent_name})
-                            MATCH (child:Commodity {name: $child_name})
-                            MERGE (child)-[:SUBCLASS_OF]->(parent)
-                        """, parent_name=level1, child_name=level2)
-                
-                # Create Level3 (specific type)
-                if level3 and level3 not in self.entities['commodities']:
-                    result = session.run("""
-                        MERGE (c:Commodity:Type {name: $name})
-                        SET c.level = 3, c.category = $category, c.parent_commodity = $parent
-                        RETURN id(c) as node_id
-                    """, name=level3, category=level0, parent=level2 or level1)
-                    node_id = result.single()['node_id']
-                    self.entities['commodities'][level3] = node_id
-                    
-                    # Link to parent
-                    parent_name = level2 or level1
-                    if parent_name:
-                        session.run("""
-                            MATCH (parent:Commodity {name: $parent_name})
-                            MATCH (child:Commodity {name: $child_name})
-                            MERGE (child)-[:SUBCLASS_OF]->(parent)
-                        """, parent_name=parent_name, child_name=level3)
+        # Collect each level first (first occurrence of a name wins)
+        levels = [[], [], [], []]
+        seen = set()
+        for row in rows:
+            level0 = row.get('Level0', '')
+            level1 = row.get('Level1', '')
+            level2 = row.get('Level2', '')
+            level3 = row.get('Level3', '')
+            
+            candidates = [
+                (level0, {'name': level0}),
+                (level1, {'name': level1, 'category': level0, 'parent': level0 or None}),
+                (level2, {'name': level2, 'category': level0, 'parent': level1 or None}),
+                (level3, {'name': level3, 'category': level0, 'parent': level2 or level1 or None}),
+            ]
+            for level, (name, node) in enumerate(candidates):
+                if name and name not in seen:
+                    seen.add(name)
+                    levels[level].append(node)
+        
+        # Create hierarchy: Level0 -> Level1 -> Level2 -> Level3,
+        # linking each child to its parent in the same query
+        for level, query in enumerate(MERGE_COMMODITY_LEVELS):
+            level_rows = levels[level]
+            self.run_batched(query, level_rows)
+            self.entities['commodities'].update(row['name'] for row in level_rows)
         
         print(f"✓ Loaded {len(self.entities['commodities'])} commodity nodes")
     
     def load_geometries(self):
         """Load geographic hierarchy from CSV."""
         print("\n🌍 Loading geographic hierarchy...")
-        rows = self.read_csv('geometries.csv')
+        rows = self.read_csv('geometries.csv', numeric_columns=['level'])
         
         if not rows:
             print("⚠️  No geometry data found")
             return
         
-        # Sort by level to ensure parents are created first
-        rows_sorted = sorted(rows, key=lambda x: int(x['level']))
-        
-        with self.driver.session(database=NEO4J_DATABASE) as session:
-            for row in rows_sorted:
-                gid_code = row['gid_code'].strip()
-                level = int(row['level'])
-                name = row['name'].strip()
-                parent_gid = row['parent_gid_code'].strip() if row['parent_gid_code'] else None
-                
-                # Determine geography type based on level
-                if level == 0:
-                    geo_type = "Country"
-                elif level == 1:
-                    geo_type = "Region"
-                elif level == 2:
-                    geo_type = "SubRegion"
-                else:
-                    geo_type = "Geography"
-                
-                # Create geography node
-                result = session.run(f"""
-                    MERGE (g:Geography:{geo_type} {{gid_code: $gid_code}})
-                    SET g.name = $name, g.level = $level
-                    RETURN id(g) as node_id
-                """, gid_code=gid_code, name=name, level=level)
-                node_id = result.single()['node_id']
-                self.entities['geographies'][gid_code] = node_id
-                
-                # Link to parent geography
-                if parent_gid and parent_gid in self.entities['geographies']:
-                    session.run("""
-                        MATCH (parent:Geography {gid_code: $parent_gid})
-                        MATCH (child:Geography {gid_code: $child_gid})
-                        MERGE (child)-[:LOCATED_IN]->(parent)
-                    """, parent_gid=parent_gid, child_gid=gid_code)
+        # Group by level so parents are created before their children
+        by_level: Dict[int, List[Dict[str, Any]]] = {}
+        for row in rows:
+            level = row['level']
+            by_level.setdefault(level, []).append({
+                'gid_code': row['gid_code'],
+                'name': row['name'],
+                'level': level,
+                'parent_gid': row['parent_gid_code'] or None
+            })
+        
+        for level in sorted(by_level):
+            level_rows = by_level[level]
+            
+            # Create geography nodes and link them to their parent geography
+            self.run_batched(MERGE_GEOGRAPHY, level_rows)
+            self.entities['geographies'].update(row['gid_code'] for row in level_rows)
         
         print(f"✓ Loaded {len(self.entities['geographies'])} geography nodes")
     
     def load_indicator_definitions(self):
         """Load weather indicator definitions from CSV."""
         print("\n🌡️  Loading weather indicator definitions...")
-        rows = self.read_csv('indicator_definition.csv')
+        rows = self.read_csv('indicator_definition.csv', numeric_columns=['forecastDays'])
         
         if not rows:
             print("⚠️  No indicator definitions found")
             return
         
-        with self.driver.session(database=NEO4J_DATABASE) as session:
-            for row in rows:
-                indicator_id = row['id'].strip()
-                
-                session.run("""
-                    MERGE (i:Indicator:WeatherIndicator {indicator_id: $indicator_id})
-                    SET i.name = $name,
-                        i.indicator_type = $indicator_type,
-                        i.source_name = $source_name,
-                        i.forecast_days = $forecast_days,
-                        i.forecast_type = $forecast_type,
-                        i.unit = $unit
-                    RETURN id(i) as node_id
-                """, 
-                    indicator_id=indicator_id,
-                    name=row['name'].strip(),
-                    indicator_type=row['indicator'].strip(),
-                    source_name=row['sourceName'].strip(),
-                    forecast_days=int(row['forecastDays']) if row['forecastDays'] else 0,
-                    forecast_type=row['forecastType'].strip(),
-                    unit=row['unit'].strip()
-                )
-                self.entities['indicators'][indicator_id] = indicator_id
+        indicators = [
+            {
+                'indicator_id': row['id'],
+                'name': row['name'],
+                'indicator_type': row['indicator'],
+                'source_name': row['sourceName'],
+                'forecast_days': row['forecastDays'],
+                'forecast_type': row['forecastType'],
+                'unit': row['unit']
+            }
+            for row in rows
+        ]
+        
+        self.run_batched(MERGE_INDICATOR, indicators)
+        for indicator in indicators:
+            self.entities['indicators'].add(indicator['indicator_id'])
         
         print(f"✓ Loaded {len(self.entities['indicators'])} indicator definitions")
     
@@ -247,46 +524,32 @@ class Neo4jLDCLoader:
             return
         
         unique_areas = {}
+        geography_links = []
+        
+        for row in rows:
+            prod_area_id = row['production_area_id']
+            crop_mask_id = row['crop_mask_id']
+            gid_code = row['gid_code']
+            commodity_name = row['commodity_name']
+            season = row['season'] or None
+            
+            # Create production area node (once per unique ID)
+            if prod_area_id not in unique_areas:
+                unique_areas[prod_area_id] = {
+                    'prod_area_id': prod_area_id,
+                    'crop_mask_id': crop_mask_id,
+                    'commodity': commodity_name,
+                    'season': season
+                }
+                self.entities['production_areas'].add(prod_area_id)
+            
+            # Link production area to geography
+            if gid_code in self.entities['geographies']:
+                geography_links.append({'prod_id': prod_area_id, 'gid_code': gid_code})
         
-        with self.driver.session(database=NEO4J_DATABASE) as session:
-            for row in rows:
-                prod_area_id = row['production_area_id'].strip()
-                crop_mask_id = row['crop_mask_id'].strip()
-                gid_code = row['gid_code'].strip()
-                commodity_name = row['commodity_name'].strip()
-                season = row['season'].strip() if row['season'] else None
-                
-                # Create production area node (once per unique ID)
-                if prod_area_id not in unique_areas:
-                    session.run("""
-                        MERGE (p:ProductionArea {production_area_id: $prod_area_id})
-                        SET p.crop_mask_id = $crop_mask_id,
-                            p.commodity = $commodity,
-                            p.season = $season
-                    """,
-                        prod_area_id=prod_area_id,
-                        crop_mask_id=crop_mask_id,
-                        commodity=commodity_name,
-                        season=season
-                    )
-                    unique_areas[prod_area_id] = True
-                    self.entities['production_areas'][prod_area_id] = prod_area_id
-                    
-                    # Link to commodity
-                    if commodity_name in self.entities['commodities']:
-                        session.run("""
-                            MATCH (p:ProductionArea {production_area_id: $prod_id})
-                            MATCH (c:Commodity {name: $commodity_name})
-                            MERGE (p)-[:PRODUCES]->(c)
-                        """, prod_id=prod_area_id, commodity_name=commodity_name)
-                
-                # Link production area to geography
-                if gid_code in self.entities['geographies']:
-                    session.run("""
-                        MATCH (p:ProductionArea {production_area_id: $prod_id})
-                        MATCH (g:Geography {gid_code: $gid_code})
-                        MERGE (p)-[:LOCATED_IN]->(g)
-                    """, prod_id=prod_area_id, gid_code=gid_code)
+        self.run_batched(MERGE_PRODUCTION_AREA, list(unique_areas.values()))
+        
+        self.run_batched(LINK_PRODUCTION_AREA_GEOGRAPHY, geography_links)
         
         print(f"✓ Loaded {len(unique_areas)} unique production areas")
     
@@ -299,36 +562,18 @@ class Neo4jLDCLoader:
             print("⚠️  No balance sheet data found")
             return
         
-        with self.driver.session(database=NEO4J_DATABASE) as session:
-            for row in rows:
-                bs_id = row['id'].strip()
-                gid = row['gid'].strip()
-                product_name = row['product_name'].strip()
-                season = row['product_season'].strip() if row['product_season'] else None
-                
-                session.run("""
-                    MERGE (b:BalanceSheet {balance_sheet_id: $bs_id})
-                    SET b.gid = $gid,
-                        b.product_name = $product_name,
-                        b.season = $season
-                """, bs_id=bs_id, gid=gid, product_name=product_name, season=season)
-                self.entities['balance_sheets'][bs_id] = bs_id
-                
-                # Link to geography
-                if gid in self.entities['geographies']:
-                    session.run("""
-                        MATCH (b:BalanceSheet {balance_sheet_id: $bs_id})
-                        MATCH (g:Geography {gid_code: $gid})
-                        MERGE (b)-[:FOR_GEOGRAPHY]->(g)
-                    """, bs_id=bs_id, gid=gid)
-                
-                # Link to commodity
-                if product_name in self.entities['commodities']:
-                    session.run("""
-                        MATCH (b:BalanceSheet {balance_sheet_id: $bs_id})
-                        MATCH (c:Commodity {name: $product_name})
-                        MERGE (b)-[:FOR_COMMODITY]->(c)
-                    """, bs_id=bs_id, product_name=product_name)
+        sheets = []
+        for row in rows:
+            bs_id = row['id']
+            sheets.append({
+                'bs_id': bs_id,
+                'gid': row['gid'],
+                'product_name': row['product_name'],
+                'season': row['product_season'] or None
+            })
+            self.entities['balance_sheets'].add(bs_id)
+        
+        self.run_batched(MERGE_BALANCE_SHEET, sheets)
         
         print(f"✓ Loaded {len(self.entities['balance_sheets'])} balance sheets")
     
@@ -341,26 +586,18 @@ class Neo4jLDCLoader:
             print("⚠️  No balance sheet component data found")
             return
         
-        with self.driver.session(database=NEO4J_DATABASE) as session:
-            for row in rows:
-                bs_id = row['balancesheet_id'].strip()
-                component_id = row['component_id'].strip()
-                component_type = row['component_type'].strip()
-                
-                # Create component node
-                session.run("""
-                    MERGE (c:Component {component_id: $component_id})
-                    SET c.component_type = $component_type
-                """, component_id=component_id, component_type=component_type)
-                self.entities['components'][component_id] = component_id
-                
-                # Link component to balance sheet
-                if bs_id in self.entities['balance_sheets']:
-                    session.run("""
-                        MATCH (b:BalanceSheet {balance_sheet_id: $bs_id})
-                        MATCH (c:Component {component_id: $component_id})
-                        MERGE (b)-[:HAS_COMPONENT]->(c)
-                    """, bs_id=bs_id, component_id=component_id)
+        components = []
+        for row in rows:
+            component_id = row['component_id']
+            components.append({
+                'bs_id': row['balancesheet_id'],
+                'component_id': component_id,
+                'component_type': row['component_type']
+            })
+            self.entities['components'].add(component_id)
+        
+        # Create component nodes and link them to their balance sheet
+        self.run_batched(MERGE_COMPONENT, components)
         
         print(f"✓ Loaded {len(self.entities['components'])} balance sheet components")
     
@@ -373,59 +610,35 @@ class Neo4jLDCLoader:
             print("⚠️  No flow data found")
             return
         
-        flow_count = 0
-        with self.driver.session(database=NEO4J_DATABASE) as session:
-            for row in rows:
-                source_country = row['source_country'].strip()
-                dest_country = row['destination_country'].strip()
-                commodity = row['commodity'].strip()
-                season = row['commodity_season'].strip() if row['commodity_season'] else None
-                source_ts_id = row['source_country_ts_id'].strip()
-                dest_ts_id = row['destination_country_ts_id'].strip()
-                
-                # Create flow relationship
-                if source_country in self.entities['geographies'] and dest_country in self.entities['geographies']:
-                    session.run("""
-                        MATCH (source:Geography {gid_code: $source_country})
-                        MATCH (dest:Geography {gid_code: $dest_country})
-                        MERGE (source)-[f:TRADES_WITH]->(dest)
-                        SET f.commodity = $commodity,
-                            f.season = $season,
-                            f.source_ts_id = $source_ts_id,
-                            f.destination_ts_id = $dest_ts_id,
-                            f.flow_type = 'export_import'
-                    """,
-                        source_country=source_country,
-                        dest_country=dest_country,
-                        commodity=commodity,
-                        season=season,
-                        source_ts_id=source_ts_id,
-                        dest_ts_id=dest_ts_id
-                    )
-                    flow_count += 1
-        
-        print(f"✓ Loaded {flow_count} trade flows")
+        flows = []
+        for row in rows:
+            source_country = row['source_country']
+            dest_country = row['destination_country']
+            
+            # Create flow relationship
+            if source_country in self.entities['geographies'] and dest_country in self.entities['geographies']:
+                flows.append({
+                    'source_country': source_country,
+                    'dest_country': dest_country,
+                    'commodity': row['commodity'],
+                    'season': row['commodity_season'] or None,
+                    'source_ts_id': row['source_country_ts_id'],
+                    'dest_ts_id': row['destination_country_ts_id']
+                })
+        
+        self.run_batched(MERGE_TRADE_FLOW, flows)
+        
+        print(f"✓ Loaded {len(flows)} trade flows")
     
     def create_indexes(self):
         """Create indexes for better query performance."""
         print("\n🔍 Creating indexes...")
         
-        with self.driver.session(database=NEO4J_DATABASE) as session:
-            indexes = [
-                "CREATE INDEX commodity_name IF NOT EXISTS FOR (c:Commodity) ON (c.name)",
-                "CREATE INDEX geography_gid IF NOT EXISTS FOR (g:Geography) ON (g.gid_code)",
-                "CREATE INDEX geography_name IF NOT EXISTS FOR (g:Geography) ON (g.name)",
-                "CREATE INDEX production_area_id IF NOT EXISTS FOR (p:ProductionArea) ON (p.production_area_id)",
-                "CREATE INDEX balance_sheet_id IF NOT EXISTS FOR (b:BalanceSheet) ON (b.balance_sheet_id)",
-                "CREATE INDEX indicator_id IF NOT EXISTS FOR (i:Indicator) ON (i.indicator_id)",
-            ]
-            
-            for idx_query in indexes:
-                try:
-                    session.run(idx_query)
-                except Exception as e:
-                    # Index might already exist
-                    pass
+        # IF NOT EXISTS already covers existing indexes; population happens
+        # on the server, so issue all statements at once and wait for them
+        with ThreadPoolExecutor(max_workers=len(CREATE_INDEXES)) as executor:
+            list(executor.map(self.run_write, CREATE_INDEXES))
+        self.run_write("CALL db.awaitIndexes()")
         
         print("✓ Indexes created")
     
@@ -435,63 +648,84 @@ class Neo4jLDCLoader:
         print("📊 Neo4j Graph Statistics")
         print("="*60)
         
-        with self.driver.session(database=NEO4J_DATABASE) as session:
-            # Node counts
-            result = session.run("""
-                MATCH (n)
-                RETURN labels(n)[0] as type, count(n) as count
-                ORDER BY count DESC
-            """)
-            
-            print("\nNodes:")
-            total_nodes = 0
-            for record in result:
-                node_type = record['type']
-                count = record['count']
-                total_nodes += count
-                print(f"  {node_type}: {count}")
-            print(f"  TOTAL: {total_nodes}")
-            
-            # Relationship counts
-            result = session.run("""
-                MATCH ()-[r]->()
-                RETURN type(r) as type, count(r) as count
-                ORDER BY count DESC
-            """)
-            
-            print("\nRelationships:")
-            total_rels = 0
-            for record in result:
-                rel_type = record['type']
-                count = record['count']
-                total_rels += count
-                print(f"  {rel_type}: {count}")
-            print(f"  TOTAL: {total_rels}")
+        # Node counts
+        result = self.run_query(COUNT_NODES_BY_LABEL)
+        
+        print("\nNodes:")
+        total_nodes = 0
+        for record in result:
+            node_type = record['type']
+            count = record['count']
+            total_nodes += count
+            print(f"  {node_type}: {count}")
+        print(f"  TOTAL: {total_nodes}")
+        
+        # Relationship counts
+        result = self.run_query(COUNT_RELATIONSHIPS_BY_TYPE)
+        
+        print("\nRelationships:")
+        total_rels = 0
+        for record in result:
+            rel_type = record['type']
+            count = record['count']
+            total_rels += count
+            print(f"  {rel_type}: {count}")
+        print(f"  TOTAL: {total_rels}")
         
         print("\n" + "="*60)
     
-    def load_all(self):
-        """Load all data from CSV files."""
+    def load_server_side(self, import_url: str):
+        """
+        Load all CSVs with server-side LOAD CSV.
+        
+        The files must be readable by the Neo4j server under import_url,
+        e.g. file:/// after copying them into the server's import/ directory.
+        """
+        if not import_url.endswith('/'):
+            import_url += '/'
+        
+        for description, filename, queries in LOAD_CSV_STEPS:
+            print(f"\n{description} (LOAD CSV {filename})...")
+            nodes_created = 0
+            relationships_created = 0
+            for query in queries:
+                summary = self.run_auto_commit(query, url=import_url + filename)
+                nodes_created += summary.counters.nodes_created
+                relationships_created += summary.counters.relationships_created
+            print(f"✓ Created {nodes_created} nodes, {relationships_created} relationships")
+    
+    def load_all(self, import_url: Optional[str] = None):
+        """
+        Load all data from CSV files.
+        
+        When import_url is given the server reads the CSVs itself via
+        LOAD CSV; otherwise rows are parsed here and sent in UNWIND batches.
+        """
         print("\n" + "="*60)
         print("🚀 Neo4j LDC Data Loader")
         print("="*60)
-        print(f"Input directory: {INPUT_DIR}")
+        print(f"Input directory: {import_url or INPUT_DIR}")
         print(f"Target database: {NEO4J_DATABASE}")
         
         # Clear existing data
         self.clear_graph()
         
-        # Load data in order (respecting dependencies)
-        self.load_commodity_hierarchy()
-        self.load_geometries()
-        self.load_indicator_definitions()
-        self.load_production_areas()
-        self.load_balance_sheets()
-        self.load_balance_sheet_components()
-        self.load_flows()
-        
-        # Create indexes
-        self.create_indexes()
+        if import_url:
+            # MERGE lookups during LOAD CSV rely on the indexes being present
+            self.create_indexes()
+            self.load_server_side(import_url)
+        else:
+            # Load data in order (respecting dependencies)
+            self.load_commodity_hierarchy()
+            self.load_geometries()
+            self.load_indicator_definitions()
+            self.load_production_areas()
+            self.load_balance_sheets()
+            self.load_balance_sheet_components()
+            self.load_flows()
+            
+            # Create indexes
+            self.create_indexes()
         
         # Print statistics
         self.print_statistics()
@@ -501,8 +735,14 @@ class Neo4jLDCLoader:
 
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description='Load LDC data into Neo4j')
+    parser.add_argument('--import-url', default=None,
+                        help="Load CSVs server-side with LOAD CSV from this URL (e.g. file:///)")
+    args = parser.parse_args()
+    
     loader = Neo4jLDCLoader()
     try:
-        loader.load_all()
+        loader.load_all(args.import_url)
     finally:
         loader.close()
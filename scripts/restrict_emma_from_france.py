@@ -6,6 +6,8 @@ This script creates a DENY permission for France data and assigns it to emma.
 """
 
 import sys
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 # Add project root to path
@@ -15,12 +17,19 @@ sys.path.insert(0, str(project_root))
 import yaml
 from falkordb import FalkorDB
 
+# libyaml-backed loader when available; same results as yaml.safe_load
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 
+
+@lru_cache(maxsize=1)
 def load_config():
-    """Load configuration."""
+    """Load configuration (parsed once per process)."""
     config_path = project_root / 'config' / 'config.yaml'
     with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YamlLoader)
 
 
 def connect_to_rbac_graph(config):
@@ -32,112 +41,60 @@ def connect_to_rbac_graph(config):
     return db.select_graph(config['rbac']['graph_name'])
 
 
-def create_france_deny_permission(graph):
+def restrict_emma_from_france(graph):
     """
-    Create a DENY permission that blocks access to France data.
+    Create the France DENY permission and 'no_france' role, and assign
+    the role to emma, all in one query.
     
-    This uses DENY with a property_filter to block any Geography node
-    where country = "France".
+    The DENY permission uses a property_filter to block any Geography node
+    where country = "France". The query starts by matching emma, so if the
+    user does not exist nothing is created and False is returned.
     """
-    print("Creating France DENY permission...")
+    print("Creating France DENY permission and 'no_france' role for emma...")
     
     permission_name = 'node:deny:france_data'
-    
-    # Check if permission already exists
-    check_query = "MATCH (p:Permission {name: $name}) RETURN p"
-    result = graph.query(check_query, {'name': permission_name})
-    
-    if result.result_set:
-        print(f"  ✓ Permission '{permission_name}' already exists")
-        return permission_name
-    
-    # Create DENY permission for France
-    query = """
-    CREATE (p:Permission {
-        name: $name,
-        resource: 'node',
-        action: 'read',
-        description: 'Deny access to France geography data',
-        node_label: 'Geography',
-        property_filter: '{"country": "France"}',
-        grant_type: 'DENY',
-        created_at: datetime()
-    })
-    RETURN p
-    """
-    
-    graph.query(query, {'name': permission_name})
-    print(f"  ✓ Created permission '{permission_name}'")
-    print(f"    - Resource: node")
-    print(f"    - Action: read")
-    print(f"    - Node Label: Geography")
-    print(f"    - Filter: country = 'France'")
-    print(f"    - Grant Type: DENY")
-    
-    return permission_name
-
-
-def create_no_france_role(graph, permission_name):
-    """Create a role that blocks France data."""
-    print("\nCreating 'no_france' role...")
-    
     role_name = 'no_france'
+    username = 'emma'
     
-    # Check if role exists
-    check_query = "MATCH (r:Role {name: $name}) RETURN r"
-    result = graph.query(check_query, {'name': role_name})
-    
-    if result.result_set:
-        print(f"  ✓ Role '{role_name}' already exists")
-    else:
-        # Create role
-        query = """
-        CREATE (r:Role {
-            name: $name,
-            description: 'Role that blocks access to France data',
-            is_system: false,
-            created_at: datetime()
-        })
-        RETURN r
-        """
-        graph.query(query, {'name': role_name})
-        print(f"  ✓ Created role '{role_name}'")
-    
-    # Link permission to role
-    link_query = """
-    MATCH (r:Role {name: $role_name})
-    MATCH (p:Permission {name: $perm_name})
+    query = """
+    MATCH (u:User {username: $username})
+    MERGE (p:Permission {name: $perm_name})
+    ON CREATE SET p.resource = 'node',
+                  p.action = 'read',
+                  p.description = 'Deny access to France geography data',
+                  p.node_label = 'Geography',
+                  p.property_filter = '{"country": "France"}',
+                  p.grant_type = 'DENY',
+                  p.created_at = $created_at
+    MERGE (r:Role {name: $role_name})
+    ON CREATE SET r.description = 'Role that blocks access to France data',
+                  r.is_system = false,
+                  r.created_at = $created_at
     MERGE (r)-[:HAS_PERMISSION]->(p)
+    MERGE (u)-[:HAS_ROLE]->(r)
+    RETURN u.username
     """
-    graph.query(link_query, {'role_name': role_name, 'perm_name': permission_name})
-    print(f"  ✓ Linked permission '{permission_name}' to role '{role_name}'")
-    
-    return role_name
-
-
-def assign_role_to_emma(graph, role_name):
-    """Assign the no_france role to emma user."""
-    print("\nAssigning role to emma user...")
-    
-    username = 'emma'
-    
-    # Check if emma exists
-    check_query = "MATCH (u:User {username: $username}) RETURN u"
-    result = graph.query(check_query, {'username': username})
+    result = graph.query(query, {
+        'username': username,
+        'perm_name': permission_name,
+        'role_name': role_name,
+        'created_at': datetime.now().isoformat()
+    })
     
     if not result.result_set:
         print(f"  ⚠️  User '{username}' does not exist!")
         print(f"     You need to create the emma user first.")
         return False
     
-    # Assign role to emma
-    assign_query = """
-    MATCH (u:User {username: $username})
-    MATCH (r:Role {name: $role_name})
-    MERGE (u)-[:HAS_ROLE]->(r)
-    """
-    graph.query(assign_query, {'username': username, 'role_name': role_name})
+    print(f"  ✓ Permission '{permission_name}' in place")
+    print(f"    - Resource: node")
+    print(f"    - Action: read")
+    print(f"    - Node Label: Geography")
+    print(f"    - Filter: country = 'France'")
+    print(f"    - Grant Type: DENY")
+    print(f"  ✓ Linked permission '{permission_name}' to role '{role_name}'")
     print(f"  ✓ Assigned role '{role_name}' to user '{username}'")
+    print(f"    ({result.nodes_created} nodes, {result.relationships_created} relationships created)")
     
     return True
 
@@ -176,14 +133,8 @@ def main():
     config = load_config()
     graph = connect_to_rbac_graph(config)
     
-    # Create France DENY permission
-    permission_name = create_france_deny_permission(graph)
-    
-    # Create role with this permission
-    role_name = create_no_france_role(graph, permission_name)
-    
-    # Assign role to emma
-    success = assign_role_to_emma(graph, role_name)
+    # Create permission and role, and assign them to emma atomically
+    success = restrict_emma_from_france(graph)
     
     if success:
         # Verify
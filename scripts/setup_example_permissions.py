@@ -9,8 +9,11 @@ This script creates sample Permission entities that demonstrate:
 - Attribute-based filtering (high-value trades)
 """
 
+import asyncio
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from pathlib import Path
 
 # Add project root to path
@@ -23,6 +26,98 @@ from src.models.security import Permission, Role, User, PERMISSION_DEFINITIONS
 from src.security.auth import hash_password
 
 
+# Cypher is kept in module constants and every call sends the same
+# parameter keys, so FalkorDB reuses one cached plan per statement
+CREATE_PERMISSIONS_QUERY = """
+UNWIND $perms AS perm
+MERGE (p:Permission {name: perm.name})
+ON CREATE SET p += perm, p.created_at = $created_at
+RETURN p.name, p.created_at = $created_at AS created
+"""
+
+CREATE_ROLES_QUERY = """
+UNWIND $roles AS role
+MERGE (r:Role {name: role.name})
+ON CREATE SET r.description = role.description,
+              r.is_system = false,
+              r.created_at = $created_at
+RETURN r.name, r.created_at = $created_at AS created
+"""
+
+LINK_ROLE_PERMISSIONS_QUERY = """
+UNWIND $links AS link
+MATCH (r:Role {name: link.role}), (p:Permission {name: link.perm})
+MERGE (r)-[:HAS_PERMISSION]->(p)
+"""
+
+CREATE_USERS_QUERY = """
+UNWIND $users AS user
+MERGE (u:User {username: user.username})
+ON CREATE SET u += user,
+              u.is_active = true,
+              u.is_superuser = false,
+              u.created_at = $created_at
+RETURN u.username, u.created_at = $created_at AS created
+"""
+
+EXISTING_USERS_QUERY = """
+UNWIND $usernames AS username
+MATCH (u:User {username: username})
+RETURN u.username
+"""
+
+LINK_USER_ROLES_QUERY = """
+UNWIND $links AS link
+MATCH (u:User {username: link.username}), (r:Role {name: link.role})
+MERGE (u)-[:HAS_ROLE]->(r)
+"""
+
+# Lookup keys used by the MERGE and link queries above
+CREATE_INDEXES = [
+    "CREATE INDEX FOR (p:Permission) ON (p.name)",
+    "CREATE INDEX FOR (r:Role) ON (r.name)",
+    "CREATE INDEX FOR (u:User) ON (u.username)",
+]
+
+# Fresh-graph variants: plain CREATE skips MERGE's per-row existence check,
+# so they must only be used when the graph is known to be empty
+FRESH_PERMISSIONS_QUERY = """
+UNWIND $perms AS perm
+CREATE (p:Permission)
+SET p += perm, p.created_at = $created_at
+RETURN p.name, true AS created
+"""
+
+FRESH_ROLES_QUERY = """
+UNWIND $roles AS role
+CREATE (r:Role {name: role.name, description: role.description,
+                is_system: false, created_at: $created_at})
+RETURN r.name, true AS created
+"""
+
+FRESH_ROLE_PERMISSIONS_QUERY = """
+UNWIND $links AS link
+MATCH (r:Role {name: link.role}), (p:Permission {name: link.perm})
+CREATE (r)-[:HAS_PERMISSION]->(p)
+"""
+
+FRESH_USERS_QUERY = """
+UNWIND $users AS user
+CREATE (u:User)
+SET u += user,
+    u.is_active = true,
+    u.is_superuser = false,
+    u.created_at = $created_at
+RETURN u.username, true AS created
+"""
+
+FRESH_USER_ROLES_QUERY = """
+UNWIND $links AS link
+MATCH (u:User {username: link.username}), (r:Role {name: link.role})
+CREATE (u)-[:HAS_ROLE]->(r)
+"""
+
+
 def load_config():
     """Load configuration."""
     config_path = project_root / 'config' / 'config.yaml'
@@ -39,7 +134,18 @@ def connect_to_rbac_graph(config):
     return db.select_graph(config['rbac']['graph_name'])
 
 
-def create_sample_permissions(graph):
+def create_indexes(graph):
+    """Create indexes for the RBAC lookup keys."""
+    for index_query in CREATE_INDEXES:
+        try:
+            graph.query(index_query)
+        except Exception as e:
+            # Index might already exist
+            if 'already indexed' not in str(e):
+                raise
+
+
+async def create_sample_permissions(graph, fresh=False):
     """Create sample permissions for testing."""
     
     print("Creating example permissions...")
@@ -122,56 +228,33 @@ def create_sample_permissions(graph):
         }
     ]
     
+    # Only send properties that are set; FalkorDB does not store nulls and
+    # the query text does not depend on which keys each row carries
+    perms = [
+        {key: value for key, value in perm_data.items() if value is not None}
+        for perm_data in permissions
+    ]
+    
+    # Create all missing permissions in one round trip; only rows created
+    # by this query carry this run's created_at timestamp
+    query = FRESH_PERMISSIONS_QUERY if fresh else CREATE_PERMISSIONS_QUERY
+    result = await asyncio.to_thread(
+        graph.query, query, {'perms': perms, 'created_at': datetime.now().isoformat()}
+    )
+    
     created_count = 0
-    for perm_data in permissions:
-        # Check if exists
-        check_query = "MATCH (p:Permission {name: $name}) RETURN p"
-        result = graph.query(check_query, {'name': perm_data['name']})
-        
-        if result.result_set:
-            print(f"  ✓ Permission '{perm_data['name']}' already exists")
-            continue
-        
-        # Create permission
-        query = """
-        CREATE (p:Permission {
-            name: $name,
-            resource: $resource,
-            action: $action,
-            description: $description,
-            node_label: $node_label,
-            edge_type: $edge_type,
-            property_name: $property_name,
-            property_filter: $property_filter,
-            attribute_conditions: $attribute_conditions,
-            grant_type: $grant_type,
-            created_at: datetime()
-        })
-        RETURN p
-        """
-        
-        params = {
-            'name': perm_data['name'],
-            'resource': perm_data['resource'],
-            'action': perm_data['action'],
-            'description': perm_data.get('description'),
-            'node_label': perm_data.get('node_label'),
-            'edge_type': perm_data.get('edge_type'),
-            'property_name': perm_data.get('property_name'),
-            'property_filter': perm_data.get('property_filter'),
-            'attribute_conditions': perm_data.get('attribute_conditions'),
-            'grant_type': perm_data['grant_type']
-        }
-        
-        graph.query(query, params)
-        print(f"  ✓ Created permission '{perm_data['name']}'")
-        created_count += 1
+    for name, created in result.result_set:
+        if created:
+            print(f"  ✓ Created permission '{name}'")
+            created_count += 1
+        else:
+            print(f"  ✓ Permission '{name}' already exists")
     
     print(f"\nCreated {created_count} new permissions")
     return created_count
 
 
-def create_test_roles(graph):
+async def create_test_roles(graph, fresh=False):
     """Create test roles with permissions."""
     
     print("\nCreating test roles...")
@@ -199,53 +282,40 @@ def create_test_roles(graph):
         }
     ]
     
+    # Create all missing roles in one round trip
+    result = await asyncio.to_thread(graph.query, FRESH_ROLES_QUERY if fresh else CREATE_ROLES_QUERY, {
+        'roles': [{'name': r['name'], 'description': r['description']} for r in roles],
+        'created_at': datetime.now().isoformat()
+    })
+    
+    created = {name for name, was_created in result.result_set if was_created}
+    
+    # Link permissions of the newly created roles in one round trip; roles
+    # that already existed keep the permissions they have
+    link_query = FRESH_ROLE_PERMISSIONS_QUERY if fresh else LINK_ROLE_PERMISSIONS_QUERY
+    await asyncio.to_thread(graph.query, link_query, {
+        'links': [
+            {'role': role_data['name'], 'perm': perm_name}
+            for role_data in roles if role_data['name'] in created
+            for perm_name in role_data['permissions']
+        ]
+    })
+    
+    permission_counts = {role_data['name']: len(role_data['permissions']) for role_data in roles}
     created_count = 0
-    for role_data in roles:
-        # Check if exists
-        check_query = "MATCH (r:Role {name: $name}) RETURN r"
-        result = graph.query(check_query, {'name': role_data['name']})
-        
-        if result.result_set:
-            print(f"  ✓ Role '{role_data['name']}' already exists")
-            continue
-        
-        # Create role
-        query = """
-        CREATE (r:Role {
-            name: $name,
-            description: $description,
-            is_system: false,
-            created_at: datetime()
-        })
-        RETURN r
-        """
-        
-        graph.query(query, {
-            'name': role_data['name'],
-            'description': role_data['description']
-        })
-        
-        # Link permissions
-        for perm_name in role_data['permissions']:
-            link_query = """
-            MATCH (r:Role {name: $role_name})
-            MATCH (p:Permission {name: $perm_name})
-            MERGE (r)-[:HAS_PERMISSION]->(p)
-            """
-            graph.query(link_query, {
-                'role_name': role_data['name'],
-                'perm_name': perm_name
-            })
-        
-        print(f"  ✓ Created role '{role_data['name']}' with {len(role_data['permissions'])} permissions")
-        created_count += 1
+    for name, _ in result.result_set:
+        if name in created:
+            print(f"  ✓ Created role '{name}' with {permission_counts[name]} permissions")
+            created_count += 1
+        else:
+            print(f"  ✓ Role '{name}' already exists")
     
     print(f"\nCreated {created_count} new roles")
     return created_count
 
 
-def create_test_users(graph):
-    """Create test users."""
+async def create_test_users(graph, roles_ready, fresh=False):
+    """Create test users, linking their roles once roles_ready is set."""
     
     print("\nCreating test users...")
     
@@ -273,59 +343,86 @@ def create_test_users(graph):
         }
     ]
     
-    created_count = 0
-    for user_data in users:
-        # Check if exists
-        check_query = "MATCH (u:User {username: $username}) RETURN u"
-        result = graph.query(check_query, {'username': user_data['username']})
-        
-        if result.result_set:
-            print(f"  ✓ User '{user_data['username']}' already exists")
-            continue
-        
-        # Create user
-        password_hash = hash_password(user_data['password'])
-        
-        query = """
-        CREATE (u:User {
-            username: $username,
-            email: $email,
-            full_name: $full_name,
-            password_hash: $password_hash,
-            is_active: true,
-            is_superuser: false,
-            created_at: datetime()
-        })
-        RETURN u
-        """
-        
-        graph.query(query, {
-            'username': user_data['username'],
-            'email': user_data['email'],
-            'full_name': user_data['full_name'],
-            'password_hash': password_hash
+    # Only users the graph doesn't have yet need a password hash; an empty
+    # graph has none of them
+    if fresh:
+        existing = set()
+    else:
+        result = await asyncio.to_thread(graph.query, EXISTING_USERS_QUERY, {
+            'usernames': [u['username'] for u in users]
         })
+        existing = {username for (username,) in result.result_set}
+    missing = [u for u in users if u['username'] not in existing]
+    
+    # Password hashing is deliberately CPU-heavy, so hash the missing users'
+    # passwords in parallel while permissions and roles are written, then
+    # create them all at once
+    created = set()
+    if missing:
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor() as executor:
+            password_hashes = await asyncio.gather(*[
+                loop.run_in_executor(executor, hash_password, u['password']) for u in missing
+            ])
         
-        # Link roles
-        for role_name in user_data['roles']:
-            link_query = """
-            MATCH (u:User {username: $username})
-            MATCH (r:Role {name: $role_name})
-            MERGE (u)-[:HAS_ROLE]->(r)
-            """
-            graph.query(link_query, {
+        payload = [
+            {
                 'username': user_data['username'],
-                'role_name': role_name
-            })
+                'email': user_data['email'],
+                'full_name': user_data['full_name'],
+                'password_hash': password_hash
+            }
+            for user_data, password_hash in zip(missing, password_hashes)
+        ]
         
-        print(f"  ✓ Created user '{user_data['username']}' (password: {user_data['password']})")
-        created_count += 1
+        query = FRESH_USERS_QUERY if fresh else CREATE_USERS_QUERY
+        result = await asyncio.to_thread(
+            graph.query, query, {'users': payload, 'created_at': datetime.now().isoformat()}
+        )
+        created = {username for username, was_created in result.result_set if was_created}
+    
+    # Link roles of the newly created users in one round trip
+    await roles_ready.wait()
+    link_query = FRESH_USER_ROLES_QUERY if fresh else LINK_USER_ROLES_QUERY
+    await asyncio.to_thread(graph.query, link_query, {
+        'links': [
+            {'username': user_data['username'], 'role': role_name}
+            for user_data in users if user_data['username'] in created
+            for role_name in user_data['roles']
+        ]
+    })
+    
+    created_count = 0
+    for user_data in users:
+        if user_data['username'] in created:
+            print(f"  ✓ Created user '{user_data['username']}' (password: {user_data['password']})")
+            created_count += 1
+        else:
+            print(f"  ✓ User '{user_data['username']}' already exists")
     
     print(f"\nCreated {created_count} new users")
     return created_count
 
 
-def main():
+async def create_all(graph, fresh=False):
+    """Create permissions, roles, and users, overlapping independent work."""
+    roles_ready = asyncio.Event()
+    users_task = asyncio.create_task(create_test_users(graph, roles_ready, fresh))
+    
+    # Roles link to permissions, so these two run in order
+    try:
+        perms_created = await create_sample_permissions(graph, fresh)
+        roles_created = await create_test_roles(graph, fresh)
+    except BaseException:
+        users_task.cancel()
+        raise
+    
+    roles_ready.set()
+    users_created = await users_task
+    return perms_created, roles_created, users_created
+
+
+def main(fresh=False):
     """Main setup function."""
     print("=" * 60)
     print("Setting up example permissions for data-level security")
@@ -334,11 +431,10 @@ def main():
     # Load config and connect
     config = load_config()
     graph = connect_to_rbac_graph(config)
+    create_indexes(graph)
     
     # Create permissions, roles, and users
-    perms_created = create_sample_permissions(graph)
-    roles_created = create_test_roles(graph)
-    users_created = create_test_users(graph)
+    perms_created, roles_created, users_created = asyncio.run(create_all(graph, fresh))
     
     print("\n" + "=" * 60)
     print("Setup complete!")
@@ -357,4 +453,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+    parser = argparse.ArgumentParser(description='Setup example permissions for data-level security')
+    parser.add_argument('--fresh', action='store_true',
+                        help='Seed an empty graph with plain CREATE, skipping existence checks')
+    args = parser.parse_args()
+    
+    main(args.fresh)
@@ -5,10 +5,11 @@ Provides graph algorithms, spatial operations, and dimensional extraction
 
 from .graph_algorithms import GraphAnalytics
 from .spatial_ops import SpatialOperations
-from .dimensional_extract import DimensionalExtractor
+from .dimensional_extract import DimensionalExtractor, BatchedExtractor
 
 __all__ = [
     'GraphAnalytics',
     'SpatialOperations',
-    'DimensionalExtractor'
+    'DimensionalExtractor',
+    'BatchedExtractor'
 ]
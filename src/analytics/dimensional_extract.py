@@ -2,12 +2,58 @@
 Dimensional Extraction - Convert graph data to tabular format
 """
 
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, Hashable, Iterator, List, Optional, Any, Tuple
 import logging
+import os
+import re
+import tempfile
+import time
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Labels, relationship types and property names cannot be passed as query
+# parameters, so they are checked against this pattern before interpolation
+IDENTIFIER_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+# Aggregations with no Cypher equivalent, computed client-side with pandas
+CLIENT_AGGREGATIONS = {'median', 'std', 'var'}
+
+RELATIONSHIP_COLUMNS = ['source_id', 'target_id', 'source_type', 'target_type']
+
+
+def validate_identifier(name: str) -> str:
+    """Reject labels and property names that are unsafe to interpolate"""
+    if not isinstance(name, str) or not IDENTIFIER_PATTERN.fullmatch(name):
+        raise ValueError(f"Invalid identifier: {name!r}")
+    return name
+
+
+def ensure_indexes(db, indexed_properties: Dict[str, List[str]]):
+    """
+    Create range indexes for properties used in equality filters.
+    
+    FalkorDB picks an index automatically for equality filters on a labelled
+    node, so filtered queries become index scans instead of label scans.
+    
+    Args:
+        db: FalkorDB client instance
+        indexed_properties: Property names to index, keyed by label
+    """
+    for label, properties in indexed_properties.items():
+        validate_identifier(label)
+        for prop in properties:
+            validate_identifier(prop)
+            try:
+                db.execute_query(f"CREATE INDEX FOR (n:{label}) ON (n.{prop})")
+            except Exception as e:
+                # Index might already exist; anything else leaves filters on
+                # label scans, so it is worth surfacing
+                if 'already indexed' not in str(e):
+                    logger.warning(f"Index on {label}.{prop} not created: {e}")
+
 
 class DimensionalExtractor:
     """
@@ -15,21 +61,47 @@ class DimensionalExtractor:
     Useful for analytics, reporting, and integration with BI tools.
     """
     
-    def __init__(self, falkordb_client):
+    def __init__(
+        self,
+        falkordb_client,
+        cache_size: int = 128,
+        cache_ttl: float = 60.0,
+        indexed_properties: Optional[Dict[str, List[str]]] = None
+    ):
         """
         Initialize dimensional extractor.
         
         Args:
             falkordb_client: FalkorDB client instance
+            cache_size: Maximum number of cached extraction results
+            cache_ttl: Seconds a cached result stays valid
+            indexed_properties: Filter properties to index, keyed by label
         """
         self.db = falkordb_client
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        # LRU of (stored_at, DataFrame) keyed on the call arguments
+        self._result_cache: OrderedDict[Hashable, Tuple[float, pd.DataFrame]] = OrderedDict()
+        
+        if indexed_properties:
+            self.ensure_indexes(indexed_properties)
+    
+    def ensure_indexes(self, indexed_properties: Dict[str, List[str]]):
+        """
+        Create range indexes for properties used in extraction filters.
+        
+        Args:
+            indexed_properties: Property names to index, keyed by label
+        """
+        ensure_indexes(self.db, indexed_properties)
     
     def extract_to_dataframe(
         self,
         entity_type: str,
         dimensions: List[str],
         filters: Optional[Dict[str, Any]] = None,
-        limit: int = 10000
+        limit: int = 10000,
+        page_size: int = 5000
     ) -> pd.DataFrame:
         """
         Extract graph data to pandas DataFrame.
@@ -39,31 +111,82 @@ class DimensionalExtractor:
             dimensions: List of properties/dimensions to include
             filters: Optional filters to apply
             limit: Maximum number of rows
+            page_size: Number of rows fetched per query
             
         Returns:
             pandas DataFrame with extracted data
         """
         logger.info(f"Extracting {entity_type} to DataFrame with dimensions: {dimensions}")
         
+        cache_key = self._cache_key('extract', entity_type, tuple(dimensions), filters, limit)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            # Build Cypher query
-            query = self._build_extraction_query(entity_type, dimensions, filters, limit)
-            
-            # Execute query
-            results = self.db.execute_query(query) if hasattr(self.db, 'execute_query') else []
+            pages = list(self.extract_pages(entity_type, dimensions, filters, limit, page_size))
             
             # Convert to DataFrame
-            if results:
-                df = pd.DataFrame(results)
-                return df
+            if pages:
+                df = pd.concat(pages, ignore_index=True)
             else:
                 # Return empty DataFrame with correct columns
-                return pd.DataFrame(columns=dimensions)
+                df = pd.DataFrame(columns=dimensions)
+            return self._store_cached(cache_key, df)
         
         except Exception as e:
             logger.error(f"Error extracting to DataFrame: {e}")
             return pd.DataFrame(columns=dimensions)
     
+    def extract_pages(
+        self,
+        entity_type: str,
+        dimensions: List[str],
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 10000,
+        page_size: int = 5000
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Extract graph data as a sequence of DataFrames.
+        
+        Rows are fetched in node ID order with SKIP/LIMIT, so pages neither
+        overlap nor miss rows, and at most one page is buffered by the
+        client at a time.
+        
+        Args:
+            entity_type: Type of entity to extract
+            dimensions: List of properties/dimensions to include
+            filters: Optional filters to apply
+            limit: Maximum number of rows
+            page_size: Number of rows fetched per query
+        
+        Yields:
+            pandas DataFrame for each non-empty page
+        """
+        skip = 0
+        while skip < limit:
+            query, params = self._build_extraction_query(
+                entity_type, dimensions, filters, min(page_size, limit - skip), skip
+            )
+            results = self.db.execute_query(query, params) if hasattr(self.db, 'execute_query') else []
+            if not results:
+                return
+            
+            yield pd.DataFrame.from_records(results, columns=dimensions)
+            
+            if len(results) < page_size:
+                return
+            skip += page_size
+    
+    def batch(self) -> 'BatchedExtractor':
+        """
+        Start a batch of extractions that run in a single round trip.
+        
+        Returns:
+            BatchedExtractor context manager bound to this extractor
+        """
+        return BatchedExtractor(self)
+    
     def extract_time_series(
         self,
         entity_id: str,
@@ -85,23 +208,32 @@ class DimensionalExtractor:
         """
         logger.info(f"Extracting time series for entity {entity_id}")
         
+        # Only empty results are cached, to skip repeated lookups that match nothing
+        cache_key = self._cache_key('time_series', entity_id, value_property, time_property)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
+            validate_identifier(time_property)
+            validate_identifier(value_property)
+            
             query = f"""
             MATCH (n)-[:HAS_DATA]->(d)
-            WHERE id(n) = '{entity_id}'
+            WHERE id(n) = $entity_id
             RETURN d.{time_property} as time, d.{value_property} as value
             ORDER BY d.{time_property}
             """
             
-            results = self.db.execute_query(query) if hasattr(self.db, 'execute_query') else []
+            params = {'entity_id': int(entity_id)}
+            results = self.db.execute_query(query, params) if hasattr(self.db, 'execute_query') else []
             
             if results:
-                df = pd.DataFrame(results)
-                if 'time' in df.columns:
-                    df['time'] = pd.to_datetime(df['time'])
+                df = pd.DataFrame.from_records(results, columns=['time', 'value'])
+                df['time'] = pd.to_datetime(df['time'])
                 return df
             else:
-                return pd.DataFrame(columns=['time', 'value'])
+                return self._store_cached(cache_key, pd.DataFrame(columns=['time', 'value']))
         
         except Exception as e:
             logger.error(f"Error extracting time series: {e}")
@@ -113,7 +245,8 @@ class DimensionalExtractor:
         source_type: Optional[str] = None,
         target_type: Optional[str] = None,
         filters: Optional[Dict[str, Any]] = None,
-        limit: int = 10000
+        limit: int = 10000,
+        edge_properties: Optional[List[str]] = None
     ) -> pd.DataFrame:
         """
         Extract relationships as a DataFrame.
@@ -124,34 +257,49 @@ class DimensionalExtractor:
             target_type: Optional target entity type filter
             filters: Optional filters
             limit: Maximum number of relationships
+            edge_properties: Relationship properties to return, one column
+                each; ['*'] returns the full property map as 'properties'
             
         Returns:
             DataFrame with relationship data
         """
         logger.info(f"Extracting {relationship_type} relationships")
         
+        edge_properties = edge_properties or []
+        if edge_properties == ['*']:
+            columns = RELATIONSHIP_COLUMNS + ['properties']
+        else:
+            columns = RELATIONSHIP_COLUMNS + list(edge_properties)
+        
         try:
-            source_filter = f":{source_type}" if source_type else ""
-            target_filter = f":{target_type}" if target_type else ""
+            validate_identifier(relationship_type)
+            source_filter = f":{validate_identifier(source_type)}" if source_type else ""
+            target_filter = f":{validate_identifier(target_type)}" if target_type else ""
+            
+            # Project scalar columns rather than a per-row property map
+            if edge_properties == ['*']:
+                extra = ", properties(r) as properties"
+            else:
+                extra = "".join(f", r.{validate_identifier(p)} as {p}" for p in edge_properties)
             
             query = f"""
             MATCH (a{source_filter})-[r:{relationship_type}]->(b{target_filter})
             RETURN id(a) as source_id, id(b) as target_id, 
-                   labels(a)[0] as source_type, labels(b)[0] as target_type,
-                   properties(r) as properties
-            LIMIT {limit}
+                   labels(a)[0] as source_type, labels(b)[0] as target_type{extra}
+            LIMIT $limit
             """
             
-            results = self.db.execute_query(query) if hasattr(self.db, 'execute_query') else []
+            results = self.db.execute_query(query, {'limit': limit}) if hasattr(self.db, 'execute_query') else []
             
             if results:
-                return pd.DataFrame(results)
+                df = pd.DataFrame.from_records(results, columns=columns)
+                return df.astype({'source_id': 'int64', 'target_id': 'int64'})
             else:
-                return pd.DataFrame(columns=['source_id', 'target_id', 'source_type', 'target_type'])
+                return pd.DataFrame(columns=columns)
         
         except Exception as e:
             logger.error(f"Error extracting relationships: {e}")
-            return pd.DataFrame(columns=['source_id', 'target_id', 'source_type', 'target_type'])
+            return pd.DataFrame(columns=columns)
     
     def pivot_by_geography(
         self,
@@ -172,6 +320,11 @@ class DimensionalExtractor:
         """
         logger.info(f"Creating pivot table for {indicator}")
         
+        cache_key = self._cache_key('pivot', indicator, commodity, year)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             filters = {'indicator': indicator}
             if commodity:
@@ -179,24 +332,27 @@ class DimensionalExtractor:
             if year:
                 filters['year'] = year
             
-            # Extract data
-            df = self.extract_to_dataframe(
-                entity_type=indicator,
-                dimensions=['geography', 'commodity', 'year', 'value'],
-                filters=filters
-            )
+            validate_identifier(indicator)
+            where_clause, params = self._build_where_clause(filters)
             
-            if not df.empty and 'geography' in df.columns:
-                # Create pivot table
-                pivot = df.pivot_table(
-                    values='value',
-                    index='geography',
-                    columns='commodity' if 'commodity' in df.columns else None,
-                    aggfunc='sum'
-                )
-                return pivot
+            # Sum in Cypher so only one row per geography/commodity is returned
+            query = f"""
+            MATCH (n:{indicator})
+            {where_clause}
+            RETURN n.geography as geography, n.commodity as commodity, sum(n.value) as value
+            """
+            
+            results = self.db.execute_query(query, params) if hasattr(self.db, 'execute_query') else []
+            
+            if results:
+                # Rows are already aggregated, so a plain pivot is enough
+                df = pd.DataFrame.from_records(results, columns=['geography', 'commodity', 'value'])
+                # Reshape on integer category codes instead of hashing strings
+                df = df.astype({'geography': 'category', 'commodity': 'category'})
+                pivot = df.pivot(index='geography', columns='commodity', values='value')
             else:
-                return pd.DataFrame()
+                pivot = pd.DataFrame()
+            return self._store_cached(cache_key, pivot)
         
         except Exception as e:
             logger.error(f"Error creating pivot table: {e}")
@@ -216,7 +372,8 @@ class DimensionalExtractor:
         Args:
             entity_type: Type of entity
             dimension: Dimension to group by
-            aggregation: Aggregation function (sum, avg, count, min, max)
+            aggregation: Aggregation function (sum, avg, count, min, max,
+                or median, std, var computed client-side)
             value_property: Property to aggregate
             filters: Optional filters
             
@@ -225,6 +382,12 @@ class DimensionalExtractor:
         """
         logger.info(f"Aggregating {entity_type} by {dimension}")
         
+        # Only empty results are cached, to skip repeated lookups that match nothing
+        cache_key = self._cache_key('aggregate', entity_type, dimension, aggregation, value_property, filters)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             # Map aggregation to Cypher function
             agg_func_map = {
@@ -236,8 +399,20 @@ class DimensionalExtractor:
             }
             cypher_func = agg_func_map.get(aggregation, 'sum')
             
+            validate_identifier(entity_type)
+            validate_identifier(dimension)
+            validate_identifier(value_property)
+            
             # Build filter clause
-            where_clause = self._build_where_clause(filters)
+            where_clause, params = self._build_where_clause(filters)
+            
+            if aggregation in CLIENT_AGGREGATIONS:
+                df = self._aggregate_client_side(
+                    entity_type, dimension, aggregation, value_property, where_clause, params
+                )
+                if df.empty:
+                    return self._store_cached(cache_key, df)
+                return df
             
             query = f"""
             MATCH (n:{entity_type})
@@ -246,56 +421,133 @@ class DimensionalExtractor:
             ORDER BY aggregated_value DESC
             """
             
-            results = self.db.execute_query(query) if hasattr(self.db, 'execute_query') else []
+            results = self.db.execute_query(query, params) if hasattr(self.db, 'execute_query') else []
             
             if results:
-                return pd.DataFrame(results)
+                return pd.DataFrame.from_records(results, columns=[dimension, 'aggregated_value'])
             else:
-                return pd.DataFrame(columns=[dimension, 'aggregated_value'])
+                return self._store_cached(cache_key, pd.DataFrame(columns=[dimension, 'aggregated_value']))
         
         except Exception as e:
             logger.error(f"Error aggregating data: {e}")
             return pd.DataFrame(columns=[dimension, 'aggregated_value'])
     
+    def _aggregate_client_side(
+        self,
+        entity_type: str,
+        dimension: str,
+        aggregation: str,
+        value_property: str,
+        where_clause: str,
+        params: Dict[str, Any]
+    ) -> pd.DataFrame:
+        """Fetch raw values and aggregate them with pandas' vectorized groupby"""
+        query = f"""
+        MATCH (n:{entity_type})
+        {where_clause}
+        RETURN n.{dimension} as {dimension}, n.{value_property} as value
+        """
+        
+        results = self.db.execute_query(query, params) if hasattr(self.db, 'execute_query') else []
+        if not results:
+            return pd.DataFrame(columns=[dimension, 'aggregated_value'])
+        
+        df = pd.DataFrame.from_records(results, columns=[dimension, 'value'])
+        aggregated = (
+            df.groupby(dimension, sort=False)['value']
+            .agg(aggregation)
+            .rename('aggregated_value')
+            .sort_values(ascending=False)
+        )
+        return aggregated.reset_index()
+    
     def _build_extraction_query(
         self,
         entity_type: str,
         dimensions: List[str],
         filters: Optional[Dict[str, Any]],
-        limit: int
-    ) -> str:
-        """Build Cypher query for data extraction"""
+        limit: int,
+        skip: int = 0
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build parameterized Cypher query for one page of data extraction"""
+        validate_identifier(entity_type)
+        
         # Build RETURN clause
-        return_parts = [f"n.{dim} as {dim}" for dim in dimensions]
+        return_parts = [f"n.{dim} as {dim}" for dim in map(validate_identifier, dimensions)]
         return_clause = ", ".join(return_parts)
         
         # Build WHERE clause
-        where_clause = self._build_where_clause(filters)
+        where_clause, params = self._build_where_clause(filters)
+        params['skip'] = skip
+        params['limit'] = limit
         
         query = f"""
         MATCH (n:{entity_type})
         {where_clause}
         RETURN {return_clause}
-        LIMIT {limit}
+        ORDER BY id(n)
+        SKIP $skip
+        LIMIT $limit
         """
         
-        return query
+        return query, params
     
-    def _build_where_clause(self, filters: Optional[Dict[str, Any]]) -> str:
-        """Build WHERE clause from filters"""
+    def _build_where_clause(
+        self,
+        filters: Optional[Dict[str, Any]],
+        prefix: str = "f_"
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build WHERE clause and its parameters from filters"""
         if not filters:
-            return ""
+            return "", {}
         
         conditions = []
+        params = {}
         for key, value in filters.items():
-            if isinstance(value, str):
-                conditions.append(f"n.{key} = '{value}'")
-            else:
-                conditions.append(f"n.{key} = {value}")
+            validate_identifier(key)
+            conditions.append(f"n.{key} = ${prefix}{key}")
+            params[f"{prefix}{key}"] = value
+        
+        return "WHERE " + " AND ".join(conditions), params
+    
+    def clear_cache(self):
+        """Clear cached extraction results."""
+        self._result_cache.clear()
+    
+    def _cache_key(self, *parts: Any) -> Optional[Hashable]:
+        """Build a cache key, or None if the arguments are not hashable"""
+        try:
+            key = tuple(
+                frozenset(part.items()) if isinstance(part, dict) else part
+                for part in parts
+            )
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def _get_cached(self, key: Optional[Hashable]) -> Optional[pd.DataFrame]:
+        """Return a cached result if present and not expired"""
+        if key is None or key not in self._result_cache:
+            return None
         
-        if conditions:
-            return "WHERE " + " AND ".join(conditions)
-        return ""
+        stored_at, df = self._result_cache[key]
+        if time.monotonic() - stored_at > self.cache_ttl:
+            del self._result_cache[key]
+            return None
+        
+        self._result_cache.move_to_end(key)
+        # Shallow copy so callers cannot mutate the cached frame in place
+        return df.copy(deep=False)
+    
+    def _store_cached(self, key: Optional[Hashable], df: pd.DataFrame) -> pd.DataFrame:
+        """Cache a result, evicting the least recently used entry when full"""
+        if key is not None and self.cache_size > 0:
+            self._result_cache[key] = (time.monotonic(), df)
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.cache_size:
+                self._result_cache.popitem(last=False)
+        return df.copy(deep=False)
     
     def export_to_csv(
         self,
@@ -303,28 +555,205 @@ class DimensionalExtractor:
         dimensions: List[str],
         output_path: str,
         filters: Optional[Dict[str, Any]] = None,
-        limit: int = 10000
+        limit: int = 10000,
+        chunk_size: int = 10000
     ) -> bool:
         """
         Export graph data to CSV file.
         
+        Rows are fetched and written one page at a time, so only one page
+        is held in memory. Pages go to a temporary file next to output_path
+        that replaces it only once every page is written, so a failed export
+        never leaves a partial file behind.
+        Prefer export_to_parquet for BI pipelines.
+        
         Args:
             entity_type: Type of entity to extract
             dimensions: List of properties to include
             output_path: Path to output CSV file
             filters: Optional filters
             limit: Maximum number of rows
+            chunk_size: Number of rows fetched and written per page
             
         Returns:
             True if successful, False otherwise
         """
         logger.info(f"Exporting {entity_type} to CSV: {output_path}")
         
+        tmp_path = None
+        try:
+            row_count = 0
+            output_dir = os.path.dirname(os.path.abspath(output_path))
+            with tempfile.NamedTemporaryFile(
+                'w', newline='', dir=output_dir, suffix='.tmp', delete=False
+            ) as f:
+                tmp_path = f.name
+                # Always write the header, even when there are no rows
+                pd.DataFrame(columns=dimensions).to_csv(f, index=False)
+                for page in self.extract_pages(entity_type, dimensions, filters, limit, chunk_size):
+                    page.to_csv(f, header=False, index=False)
+                    row_count += len(page)
+            os.replace(tmp_path, output_path)
+            
+            logger.info(f"Successfully exported {row_count} rows to {output_path}")
+            return True
+        except Exception as e:
+            logger.error(f"Error exporting to CSV: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+    
+    def export_to_parquet(
+        self,
+        entity_type: str,
+        dimensions: List[str],
+        output_path: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 10000,
+        compression: str = "zstd"
+    ) -> bool:
+        """
+        Export graph data to a Parquet file.
+        
+        Preferred over CSV for BI pipelines: columns are stored as typed
+        binary with compression, so files are smaller and faster to read.
+        
+        Args:
+            entity_type: Type of entity to extract
+            dimensions: List of properties to include
+            output_path: Path to output Parquet file
+            filters: Optional filters
+            limit: Maximum number of rows
+            compression: Parquet compression codec
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        logger.info(f"Exporting {entity_type} to Parquet: {output_path}")
+        
         try:
             df = self.extract_to_dataframe(entity_type, dimensions, filters, limit)
-            df.to_csv(output_path, index=False)
+            df.to_parquet(output_path, engine='pyarrow', compression=compression, index=False)
             logger.info(f"Successfully exported {len(df)} rows to {output_path}")
             return True
         except Exception as e:
-            logger.error(f"Error exporting to CSV: {e}")
+            logger.error(f"Error exporting to Parquet: {e}")
             return False
+
+
+class BatchedExtractor:
+    """
+    Collects extract_to_dataframe calls and runs them as one UNION ALL query.
+    
+    Example:
+        with extractor.batch() as batch:
+            wheat = batch.add('Production', ['geography', 'value'], {'commodity': 'Wheat'})
+            corn = batch.add('Production', ['geography', 'value'], {'commodity': 'Corn'})
+        wheat_df = wheat.result()
+    """
+    
+    def __init__(self, extractor: DimensionalExtractor):
+        """
+        Initialize batched extractor.
+        
+        Args:
+            extractor: DimensionalExtractor used to run the batch
+        """
+        self.extractor = extractor
+        self.queue: List[Tuple[str, List[str], Optional[Dict[str, Any]], int, Future]] = []
+    
+    def __enter__(self) -> 'BatchedExtractor':
+        self.queue = []
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+        else:
+            # The batch never runs, so cancel its futures rather than leave
+            # result() blocked on them
+            for *_, future in self.queue:
+                future.cancel()
+            self.queue = []
+        return False
+    
+    def add(
+        self,
+        entity_type: str,
+        dimensions: List[str],
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 10000
+    ) -> Future:
+        """
+        Queue an extraction.
+        
+        Args:
+            entity_type: Type of entity to extract
+            dimensions: List of properties/dimensions to include
+            filters: Optional filters to apply
+            limit: Maximum number of rows
+        
+        Returns:
+            Future resolved with the DataFrame once the batch is flushed
+        """
+        future = Future()
+        self.queue.append((entity_type, list(dimensions), filters, limit, future))
+        return future
+    
+    def flush(self):
+        """Run all queued extractions and resolve their futures."""
+        queue, self.queue = self.queue, []
+        extractor = self.extractor
+        
+        pending = []
+        for entity_type, dimensions, filters, limit, future in queue:
+            cache_key = extractor._cache_key('extract', entity_type, tuple(dimensions), filters, limit)
+            cached = extractor._get_cached(cache_key)
+            if cached is not None:
+                future.set_result(cached)
+            else:
+                pending.append((entity_type, dimensions, filters, limit, future, cache_key))
+        
+        if not pending:
+            return
+        
+        logger.info(f"Running {len(pending)} batched extractions")
+        
+        try:
+            # Each branch returns its queue position and the row as a list, so
+            # extractions with different dimensions share one result schema
+            parts = []
+            params: Dict[str, Any] = {}
+            for i, (entity_type, dimensions, filters, limit, _, _) in enumerate(pending):
+                validate_identifier(entity_type)
+                row = ", ".join(f"n.{dim}" for dim in map(validate_identifier, dimensions))
+                where_clause, part_params = extractor._build_where_clause(filters, prefix=f"q{i}_")
+                params.update(part_params)
+                params[f"q{i}_limit"] = limit
+                parts.append(f"""
+                MATCH (n:{entity_type})
+                {where_clause}
+                RETURN {i} as origin, [{row}] as row
+                LIMIT $q{i}_limit
+                """)
+            
+            query = "UNION ALL".join(parts)
+            results = extractor.db.execute_query(query, params) if hasattr(extractor.db, 'execute_query') else []
+        
+        except Exception as e:
+            # Fall back to one round trip per extraction
+            logger.warning(f"Batched extraction failed, running individually: {e}")
+            for entity_type, dimensions, filters, limit, future, _ in pending:
+                try:
+                    future.set_result(extractor.extract_to_dataframe(entity_type, dimensions, filters, limit))
+                except Exception as extraction_error:
+                    future.set_exception(extraction_error)
+            return
+        
+        rows_by_origin: Dict[int, List[List[Any]]] = {}
+        for result in results:
+            rows_by_origin.setdefault(result['origin'], []).append(result['row'])
+        
+        for i, (_, dimensions, _, _, future, cache_key) in enumerate(pending):
+            df = pd.DataFrame.from_records(rows_by_origin.get(i, []), columns=dimensions)
+            future.set_result(extractor._store_cached(cache_key, df))
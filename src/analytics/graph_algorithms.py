@@ -3,11 +3,62 @@ Graph Analytics - Algorithms for analyzing the knowledge graph
 Uses FalkorDB native algorithms for optimal performance.
 """
 
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, Union
+import asyncio
 import logging
+import time
+
+import numpy as np
+
+from .dimensional_extract import ensure_indexes, validate_identifier
 
 logger = logging.getLogger(__name__)
 
+# Analytics that run_all / run_all_async can dispatch by name
+CONCURRENT_ANALYTICS = {'pagerank', 'centrality', 'community_detection', 'shortest_path'}
+
+# BFS from a node matched by ID; node objects cannot be passed as parameters.
+# Only IDs are projected, so no node or edge objects are serialized
+SHORTEST_PATH_QUERY = """
+MATCH (source)
+WHERE id(source) = $source_id
+CALL algo.BFS(source, $max_depth, $relationship_type)
+YIELD nodes, edges
+RETURN [n IN nodes | id(n)] as node_ids, [e IN edges | id(e)] as edge_ids
+"""
+
+# Node properties that materialized scores are written back to
+MATERIALIZED_SCORE_PROPERTIES = {'pagerank': '_pagerank', 'betweenness': '_betweenness'}
+DEFAULT_SCORE_TTL_SECONDS = 300
+
+
+def _sort_by_score(scores: Dict[str, float]) -> Dict[str, float]:
+    """Order a node score mapping by descending score"""
+    return dict(sorted(scores.items(), key=lambda item: item[1], reverse=True))
+
+
+def _format_scores(
+    rows: List[Dict[str, Any]],
+    parameters: Dict[str, Any]
+) -> Union[Dict[str, float], Tuple[np.ndarray, np.ndarray]]:
+    """
+    Convert (node_id, score) rows to the shape requested in parameters.
+    
+    With 'as_arrays' set, returns an int64 ID array and a float32 score
+    array instead of a dict, avoiding a Python object per node.
+    """
+    if parameters.get('as_arrays'):
+        ids = np.fromiter((row['node_id'] for row in rows), dtype=np.int64, count=len(rows))
+        scores = np.fromiter((row['score'] for row in rows), dtype=np.float32, count=len(rows))
+        if parameters.get('sort'):
+            order = np.argsort(-scores, kind='stable')
+            ids, scores = ids[order], scores[order]
+        return ids, scores
+    
+    scores = {str(row['node_id']): row['score'] for row in rows}
+    return _sort_by_score(scores) if parameters.get('sort') else scores
+
 
 class GraphAnalytics:
     """
@@ -23,12 +74,16 @@ class GraphAnalytics:
             falkordb_client: FalkorDB client instance
         """
         self.db = falkordb_client
+        # Time (ms) of the last invalidate_materialized_scores call; runs
+        # computed at or before it are stale. Kept in memory so invalidating
+        # on every ingest costs no query
+        self._invalidated_at = 0
     
     def pagerank(
         self,
         filters: Optional[Dict[str, Any]] = None,
         parameters: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, float]:
+    ) -> Union[Dict[str, float], Tuple[np.ndarray, np.ndarray]]:
         """
         Calculate PageRank centrality using FalkorDB's native algorithm.
         
@@ -39,9 +94,20 @@ class GraphAnalytics:
             parameters: Algorithm parameters:
                 - node_label: Node label to compute PageRank on (default: '' for all)
                 - relationship_type: Relationship type to traverse (default: '')
+                - sort: Order results by descending score (default: False)
+                - materialize: Persist scores as node properties and reuse
+                  them on later calls (default: False)
+                - cache_ttl_seconds: How long materialized scores stay valid
+                - force_recompute: Ignore materialized scores
+                - top_k: Return only the K highest-scoring nodes, in
+                  descending order (default: None for the full distribution)
+                - min_score: Drop nodes scoring below this threshold
+                - as_arrays: Return (node ID int64 array, float32 score
+                  array) instead of a dict (default: False)
             
         Returns:
-            Dictionary mapping node IDs to PageRank scores
+            Dictionary mapping node IDs to PageRank scores, or an
+            (ids, scores) array pair when as_arrays is set
         """
         logger.info("Calculating PageRank using FalkorDB native algorithm")
         
@@ -59,23 +125,36 @@ class GraphAnalytics:
             if not relationship_type:
                 relationship_type = 'HAS_COMMODITY'  # Default to commodity relationships
         
+        parameters = parameters or {}
+        materialize = parameters.get('materialize', False)
+        params_key = f"{node_label}|{relationship_type}"
+        
         try:
-            # Build query with proper FalkorDB PageRank signature
-            query = f"CALL algo.pageRank('{node_label}', '{relationship_type}') YIELD node, score RETURN id(node) as node_id, score ORDER BY score DESC"
+            if materialize and not parameters.get('force_recompute'):
+                rows = self._read_materialized_scores('pagerank', params_key, parameters)
+                if rows is not None:
+                    logger.info(f"Using materialized PageRank for {len(rows)} nodes")
+                    return _format_scores(rows, parameters)
+            
+            # Build query with proper FalkorDB PageRank signature; a null
+            # label or relationship type means all of them
+            query = "CALL algo.pageRank($node_label, $relationship_type) YIELD node, score"
+            params = {'node_label': node_label or None, 'relationship_type': relationship_type or None}
+            if materialize:
+                self._clear_materialized_scores('pagerank')
+                query += " " + self._materialize_clause('pagerank')
+                params['computed_at'] = int(time.time() * 1000)
+                params['params_key'] = params_key
+            query += " WITH id(node) as node_id, score" + self._score_return_clause(parameters, params)
             
             logger.info(f"Running PageRank on label='{node_label}' relationship='{relationship_type}'")
             
             # Execute PageRank
-            result = self.db.execute_query(query)
+            result = self.db.execute_query(query, params)
             
-            # Convert to dict
-            pagerank_scores = {}
-            for row in result:
-                node_id = str(row['node_id'])
-                score = row['score']
-                pagerank_scores[node_id] = score
+            pagerank_scores = _format_scores(result, parameters)
             
-            logger.info(f"PageRank calculated for {len(pagerank_scores)} nodes")
+            logger.info(f"PageRank calculated for {len(result)} nodes")
             return pagerank_scores
         
         except Exception as e:
@@ -90,7 +169,7 @@ class GraphAnalytics:
         algorithm: str = "betweenness",
         filters: Optional[Dict[str, Any]] = None,
         parameters: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, float]:
+    ) -> Union[Dict[str, float], Tuple[np.ndarray, np.ndarray]]:
         """
         Calculate betweenness centrality using FalkorDB's native algorithm.
         
@@ -99,10 +178,14 @@ class GraphAnalytics:
         Args:
             algorithm: Type of centrality (currently only 'betweenness' supported)
             filters: Not used for native algorithm
-            parameters: Algorithm parameters (node_collection for filtering)
+            parameters: Algorithm parameters:
+                - sort: Order results by descending score (default: False)
+                - materialize, cache_ttl_seconds, force_recompute, top_k,
+                  min_score, as_arrays: As for pagerank
             
         Returns:
-            Dictionary mapping node IDs to centrality scores
+            Dictionary mapping node IDs to centrality scores, or an
+            (ids, scores) array pair when as_arrays is set
         """
         logger.info(f"Calculating {algorithm} centrality using FalkorDB native algorithm")
         
@@ -110,23 +193,34 @@ class GraphAnalytics:
             logger.warning(f"Only betweenness centrality is supported, got: {algorithm}")
             return {}
         
+        parameters = parameters or {}
+        materialize = parameters.get('materialize', False)
+        
         try:
+            if materialize and not parameters.get('force_recompute'):
+                rows = self._read_materialized_scores('betweenness', '', parameters)
+                if rows is not None:
+                    logger.info(f"Using materialized betweenness for {len(rows)} nodes")
+                    return _format_scores(rows, parameters)
+            
             # FalkorDB betweenness takes an empty dict {} as parameter for all nodes
-            query = "CALL algo.betweenness({}) YIELD node, score RETURN id(node) as node_id, score ORDER BY score DESC"
+            query = "CALL algo.betweenness({}) YIELD node, score"
+            params = {}
+            if materialize:
+                self._clear_materialized_scores('betweenness')
+                query += " " + self._materialize_clause('betweenness')
+                params['computed_at'] = int(time.time() * 1000)
+                params['params_key'] = ''
+            query += " WITH id(node) as node_id, score" + self._score_return_clause(parameters, params)
             
             logger.info("Running betweenness centrality on all nodes")
             
             # Execute betweenness
-            result = self.db.execute_query(query)
+            result = self.db.execute_query(query, params)
             
-            # Convert to dict
-            centrality_scores = {}
-            for row in result:
-                node_id = str(row['node_id'])
-                score = row['score']
-                centrality_scores[node_id] = score
+            centrality_scores = _format_scores(result, parameters)
             
-            logger.info(f"Betweenness centrality calculated for {len(centrality_scores)} nodes")
+            logger.info(f"Betweenness centrality calculated for {len(result)} nodes")
             return centrality_scores
         
         except Exception as e:
@@ -170,11 +264,7 @@ class GraphAnalytics:
             result = self.db.execute_query(query)
             
             # Convert to dict
-            communities = {}
-            for row in result:
-                node_id = str(row['node_id'])
-                community_id = row['communityId']
-                communities[node_id] = community_id
+            communities = {str(row['node_id']): row['communityId'] for row in result}
             
             logger.info(f"Label propagation found communities for {len(communities)} nodes")
             return communities
@@ -215,58 +305,27 @@ class GraphAnalytics:
         relationship_type = parameters.get('relationship_type', '') if parameters else ''
         
         try:
-            # First get the source node
-            source_query = f"MATCH (n) WHERE id(n) = {source} RETURN n"
-            source_result = self.db.execute_query(source_query)
-            
-            if not source_result:
-                logger.warning(f"Source node {source} not found")
-                return {'nodes': [], 'edges': []}
-            
-            source_node = source_result[0]['n']
-            
-            # Build BFS query - need to pass the actual node object
-            # Since we can't pass node objects via execute_query, we'll use a different approach
-            # Use inline MATCH to get the source node
-            if relationship_type:
-                query = f"""
-                MATCH (source)
-                WHERE id(source) = {source}
-                CALL algo.BFS(source, {max_depth}, '{relationship_type}')
-                YIELD nodes, edges
-                RETURN nodes, edges
-                """
-            else:
-                query = f"""
-                MATCH (source)
-                WHERE id(source) = {source}
-                CALL algo.BFS(source, {max_depth}, '')
-                YIELD nodes, edges
-                RETURN nodes, edges
-                """
+            # Node objects can't be passed as parameters, so match the source
+            # inline; a null relationship type traverses all relationships
+            query = SHORTEST_PATH_QUERY
+            params = {
+                'source_id': int(source),
+                'max_depth': int(max_depth),
+                'relationship_type': relationship_type or None
+            }
             
             logger.info(f"Running BFS with max_depth={max_depth}, relationship_type='{relationship_type}'")
             
             # Execute BFS
-            result = self.db.execute_query(query)
+            result = self.db.execute_query(query, params)
             
+            # No row means the source is missing or reaches no other node
             if not result:
+                logger.warning(f"Source node {source} not found or has no reachable nodes")
                 return {'nodes': [], 'edges': []}
             
-            # Extract nodes and edges
-            nodes_list = result[0].get('nodes', [])
-            edges_list = result[0].get('edges', [])
-            
-            # Convert to node IDs
-            node_ids = []
-            for node in nodes_list:
-                if hasattr(node, 'id'):
-                    node_ids.append(str(node.id))
-            
-            edge_ids = []
-            for edge in edges_list:
-                if hasattr(edge, 'id'):
-                    edge_ids.append(str(edge.id))
+            node_ids = [str(node_id) for node_id in result[0]['node_ids']]
+            edge_ids = [str(edge_id) for edge_id in result[0]['edge_ids']]
             
             logger.info(f"BFS found {len(node_ids)} nodes and {len(edge_ids)} edges")
             return {'nodes': node_ids, 'edges': edge_ids}
@@ -277,41 +336,200 @@ class GraphAnalytics:
             logger.error(traceback.format_exc())
             return {'nodes': [], 'edges': []}
     
+    def invalidate_materialized_scores(self):
+        """
+        Mark all materialized scores as stale.
+        
+        Call this after ingesting or deleting nodes or relationships so the
+        next materialized pagerank/centrality call recomputes. Only this
+        instance's reads see the invalidation; nothing is written to the graph.
+        """
+        self._invalidated_at = int(time.time() * 1000)
+    
+    def _clear_materialized_scores(self, analytic: str):
+        """Expire an analytic's materialized run so only one is live at a time"""
+        prop = MATERIALIZED_SCORE_PROPERTIES[analytic]
+        self.db.execute_query(f"MATCH (n) WHERE n.{prop}_ts IS NOT NULL SET n.{prop}_ts = NULL")
+    
+    def _materialize_clause(self, analytic: str) -> str:
+        """
+        SET clause writing a yielded score back onto its node.
+        
+        The run's timestamp and arguments are stored next to the score rather
+        than on a separate metadata node, which the all-node algorithms would
+        otherwise pick up and score.
+        """
+        prop = MATERIALIZED_SCORE_PROPERTIES[analytic]
+        return f"SET node.{prop} = score, node.{prop}_ts = $computed_at, node.{prop}_params = $params_key"
+    
+    def _score_return_clause(self, parameters: Dict[str, Any], params: Dict[str, Any]) -> str:
+        """
+        Build the RETURN clause for (node_id, score) rows, pushing the
+        min_score threshold and top_k limit down to the server.
+        """
+        clause = ""
+        if parameters.get('min_score') is not None:
+            clause += " WHERE score >= $min_score"
+            params['min_score'] = float(parameters['min_score'])
+        clause += " RETURN node_id, score"
+        if parameters.get('top_k') is not None:
+            clause += " ORDER BY score DESC LIMIT $top_k"
+            params['top_k'] = int(parameters['top_k'])
+        return clause
+    
+    def _read_materialized_scores(
+        self,
+        analytic: str,
+        params_key: str,
+        parameters: Dict[str, Any]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Read scores persisted by the live materialized run.
+        
+        Returns:
+            (node_id, score) rows, or None when they are missing, were
+            computed with other arguments, have expired or were invalidated
+        """
+        prop = MATERIALIZED_SCORE_PROPERTIES[analytic]
+        ttl = parameters.get('cache_ttl_seconds', DEFAULT_SCORE_TTL_SECONDS)
+        min_computed_at = max(int((time.time() - ttl) * 1000), self._invalidated_at + 1)
+        query = f"""
+        MATCH (n)
+        WHERE n.{prop}_params = $params_key AND n.{prop}_ts >= $min_computed_at
+        WITH id(n) as node_id, n.{prop} as score
+        """
+        params = {'params_key': params_key, 'min_computed_at': min_computed_at}
+        query += self._score_return_clause(parameters, params)
+        result = self.db.execute_query(query, params)
+        return result or None
+    
+    async def pagerank_async(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        parameters: Optional[Dict[str, Any]] = None
+    ) -> Union[Dict[str, float], Tuple[np.ndarray, np.ndarray]]:
+        """Async variant of pagerank, run in a worker thread."""
+        return await asyncio.to_thread(self.pagerank, filters, parameters)
+    
+    async def centrality_async(
+        self,
+        algorithm: str = "betweenness",
+        filters: Optional[Dict[str, Any]] = None,
+        parameters: Optional[Dict[str, Any]] = None
+    ) -> Union[Dict[str, float], Tuple[np.ndarray, np.ndarray]]:
+        """Async variant of centrality, run in a worker thread."""
+        return await asyncio.to_thread(self.centrality, algorithm, filters, parameters)
+    
+    async def community_detection_async(
+        self,
+        algorithm: str = "label_propagation",
+        filters: Optional[Dict[str, Any]] = None,
+        parameters: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, int]:
+        """Async variant of community_detection, run in a worker thread."""
+        return await asyncio.to_thread(self.community_detection, algorithm, filters, parameters)
+    
+    async def run_all_async(self, specs: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Run independent analytics concurrently.
+        
+        Args:
+            specs: List of (analytic name, keyword arguments) pairs, e.g.
+                [('pagerank', {}), ('centrality', {'algorithm': 'betweenness'})]
+        
+        Returns:
+            Results in the same order as specs
+        """
+        calls = [self._resolve_analytic(name) for name, _ in specs]
+        return await asyncio.gather(*(
+            asyncio.to_thread(call, **kwargs) for call, (_, kwargs) in zip(calls, specs)
+        ))
+    
+    def run_all(self, specs: List[Tuple[str, Dict[str, Any]]], max_workers: int = 4) -> List[Any]:
+        """
+        Run independent analytics concurrently from synchronous code.
+        
+        Each analytic is a separate FalkorDB round trip, so running them on a
+        thread pool overlaps their latency; the client's connection pool gives
+        each worker its own connection.
+        
+        Args:
+            specs: List of (analytic name, keyword arguments) pairs
+            max_workers: Maximum number of concurrent queries
+        
+        Returns:
+            Results in the same order as specs
+        """
+        calls = [self._resolve_analytic(name) for name, _ in specs]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(call, **kwargs) for call, (_, kwargs) in zip(calls, specs)]
+            return [future.result() for future in futures]
+    
+    def _resolve_analytic(self, name: str):
+        """Look up an analytic method by name"""
+        if name not in CONCURRENT_ANALYTICS:
+            raise ValueError(f"Unknown analytic: {name}")
+        return getattr(self, name)
+    
+    def ensure_indexes(self, indexed_properties: Dict[str, List[str]]):
+        """
+        Create range indexes for properties used in analytics filters.
+        
+        Args:
+            indexed_properties: Property names to index, keyed by label
+        """
+        ensure_indexes(self.db, indexed_properties)
     
-    def _build_filter_query(self, filters: Optional[Dict[str, Any]] = None) -> str:
+    def _build_filter_query(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        label: Optional[str] = None
+    ) -> Tuple[str, Dict[str, Any]]:
         """
-        Build a Cypher query based on filters.
+        Build a parameterized Cypher query based on filters.
+        
+        A relationship matches when either endpoint has any of the filter
+        values. Each (property, endpoint) pair is its own UNION branch rather
+        than one OR chain, so the planner can use an index per branch.
         
         Args:
             filters: Filter conditions
+            label: Label of the filtered endpoint; needed for index scans
             
         Returns:
-            Cypher query string
+            Tuple of Cypher query string and its parameters
         """
         if not filters:
-            return "MATCH (a)-[r]->(b) RETURN a, r, b LIMIT 1000"
+            return "MATCH (a)-[r]->(b) RETURN a, r, b LIMIT 1000", {}
         
-        # Build WHERE clause from filters
-        where_clauses = []
-        for key, value in filters.items():
-            where_clauses.append(f"a.{key} = '{value}' OR b.{key} = '{value}'")
+        node_label = f":{validate_identifier(label)}" if label else ""
         
-        where_clause = " OR ".join(where_clauses) if where_clauses else "true"
+        # One branch per filtered endpoint; UNION drops duplicate rows
+        branches = []
+        params = {}
+        for key, value in filters.items():
+            validate_identifier(key)
+            branches.append(f"MATCH (a{node_label})-[r]->(b) WHERE a.{key} = $f_{key} RETURN a, r, b")
+            branches.append(f"MATCH (a)-[r]->(b{node_label}) WHERE b.{key} = $f_{key} RETURN a, r, b")
+            params[f"f_{key}"] = value
         
+        union = "\n            UNION\n            ".join(branches)
         query = f"""
-        MATCH (a)-[r]->(b)
-        WHERE {where_clause}
+        CALL {{
+            {union}
+        }}
         RETURN a, r, b
         LIMIT 1000
         """
         
-        return query
+        return query, params
     
     def get_subgraph(
         self,
         node_id: str,
         depth: int = 2,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        max_paths: int = 100
     ) -> Dict[str, Any]:
         """
         Extract a subgraph around a specific node.
@@ -319,35 +537,49 @@ class GraphAnalytics:
         Args:
             node_id: Central node ID
             depth: Depth of traversal
-            filters: Filters to apply
+            filters: Property values every node past the central one must have
+            max_paths: Cap on expanded paths, guarding against hub nodes
             
         Returns:
-            Dictionary with nodes and relationships
+            Dictionary with distinct node IDs and relationship IDs
         """
         logger.info(f"Extracting subgraph around {node_id} with depth {depth}")
         
-        query = f"""
-        MATCH path = (n)-[*1..{depth}]-(m)
-        WHERE id(n) = '{node_id}'
-        RETURN path
-        LIMIT 100
-        """
-        
         try:
-            result = self.db.execute_query(query) if hasattr(self.db, 'execute_query') else []
-            
-            nodes = set()
-            relationships = []
+            # Filters restrict the subgraph to nodes past the centre whose
+            # properties equal the filter values
+            params = {'node_id': int(node_id), 'max_paths': int(max_paths)}
+            conditions = []
+            for key, value in (filters or {}).items():
+                validate_identifier(key)
+                conditions.append(f"v.{key} = $f_{key}")
+                params[f"f_{key}"] = value
+            filter_clause = f"\n            AND all(v IN nodes(path)[1..] WHERE {' AND '.join(conditions)})" if conditions else ""
+            
+            # Variable-length bounds can't be parameters, so depth is
+            # interpolated as an int. Deduplication happens server-side so only
+            # IDs come back rather than full path objects; rel_ids is built
+            # before rels is unwound so it is one list, not a grouping key per row.
+            query = f"""
+            MATCH path = (n)-[*1..{int(depth)}]-(m)
+            WHERE id(n) = $node_id{filter_clause}
+            WITH path LIMIT $max_paths
+            UNWIND relationships(path) AS rel
+            WITH collect(DISTINCT rel) AS rels
+            WITH rels, [rel IN rels | id(rel)] AS rel_ids
+            UNWIND rels AS r
+            UNWIND [startNode(r), endNode(r)] AS x
+            RETURN collect(DISTINCT id(x)) AS node_ids, rel_ids
+            """
+            
+            result = self.db.execute_query(query, params) if hasattr(self.db, 'execute_query') else []
             
-            for record in result:
-                if 'path' in record:
-                    # Extract nodes and relationships from path
-                    # This is simplified - actual implementation depends on result format
-                    pass
+            if not result:
+                return {'nodes': [], 'relationships': []}
             
             return {
-                'nodes': list(nodes),
-                'relationships': relationships
+                'nodes': result[0]['node_ids'],
+                'relationships': result[0]['rel_ids']
             }
         
         except Exception as e:
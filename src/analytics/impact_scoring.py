@@ -0,0 +1,157 @@
+"""
+Impact Scoring - Entities an event reaches through affected geographies and their scores
+"""
+
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+# Impact score added to the 0.5 base for each LDC entity type
+IMPACT_TYPE_BONUS = {
+    'BalanceSheet': 0.3,  # Balance sheets track critical supply/demand data
+    'ProductionArea': 0.35,  # Production areas directly affected by weather
+    'Trade': 0.2,  # Trade flows can be disrupted
+}
+
+# Further impact score for (event type, entity type) pairs
+IMPACT_EVENT_BONUS = {
+    # Weather events heavily impact production
+    **{(event, 'ProductionArea'): 0.3 for event in ('drought', 'flood', 'storm')},
+    # Weather affects supply tracked in balance sheets
+    **{(event, 'BalanceSheet'): 0.2 for event in ('drought', 'flood')},
+    # Policy events affect trade flows
+    **{(event, 'Trade'): 0.3 for event in ('policy', 'tariff', 'embargo')},
+}
+
+# Integer code of each scored entity type; other types get code 0
+IMPACT_TYPE_CODES = {entity_type: code for code, entity_type in enumerate(IMPACT_TYPE_BONUS, start=1)}
+
+# Maximum number of connected data nodes considered per geography
+IMPACTS_PER_GEOGRAPHY = 50
+
+# Number of connected data nodes scored together while streaming impacts
+IMPACT_SCORE_CHUNK_SIZE = 1024
+
+# Columns of the DataFrame find_impacts returns with as_dicts=False
+IMPACT_COLUMNS = [
+    'entity_id', 'entity_type', 'commodity', 'season', 'trade_info', 'impact_score', 'affected_geography'
+]
+
+# One further hop outward through trade flows. Each geography is expanded
+# once; an empty frontier is unwound as [null] so no geography loses its row
+_TRADE_HOP = """
+UNWIND CASE WHEN size(frontier) = 0 THEN [null] ELSE frontier END AS f
+OPTIONAL MATCH (f)-[:TRADES_WITH]->(n:Geography)
+WHERE NOT n IN reached
+WITH geo_id, balance_sheets, reached, collect(DISTINCT n) AS frontier
+WITH geo_id, balance_sheets, reached + frontier AS reached, frontier"""
+
+
+@lru_cache(maxsize=None)
+def geography_impacts_query(max_hops: int) -> str:
+    """
+    Query returning (geo_id, entity) rows for data nodes near each of $geo_ids.
+    
+    Data nodes are connected to each geography via various relationships:
+    FOR_GEOGRAPHY: BalanceSheet -> Geography, one hop away
+    TRADES_WITH: Geography -> Geography, followed outward so that trade
+    flows leaving geographies up to max_hops - 1 trade hops away are included
+    
+    At most $limit data nodes are returned per geography, nearest first.
+    
+    Args:
+        max_hops: Maximum relationship hops from a geography, at least 1
+    """
+    if max_hops < 1:
+        raise ValueError(f"max_hops must be at least 1, got {max_hops}")
+    
+    return f"""
+UNWIND $geo_ids AS geo_id
+MATCH (g:Geography)
+WHERE id(g) = geo_id
+OPTIONAL MATCH (bs:BalanceSheet)-[:FOR_GEOGRAPHY]->(g)
+WITH geo_id, g, collect(DISTINCT bs)[0..$limit] as balance_sheets
+WITH geo_id, balance_sheets, [g] AS reached, [g] AS frontier{_TRADE_HOP * (max_hops - 1)}
+UNWIND reached AS source
+OPTIONAL MATCH (source)-[t:TRADES_WITH]->(:Geography)
+WITH geo_id, balance_sheets, collect(DISTINCT t)[0..$limit - size(balance_sheets)] as trades
+WITH geo_id,
+     [bs IN balance_sheets | {{type: 'BalanceSheet', id: id(bs), product: bs.product_name, season: bs.season}}] +
+     [t IN trades | {{type: 'Trade', from: startNode(t).name, to: endNode(t).name, commodity: t.commodity}}] as all_entities
+UNWIND all_entities as entity
+RETURN geo_id, entity
+"""
+
+
+def impact_dict(geo_id: str, entity: Dict[str, Any], score: float) -> Dict[str, Any]:
+    """Impacted entity as returned by find_impacts and iter_impacts."""
+    return {
+        'entity_id': entity.get('id'),
+        'entity_type': entity.get('type'),
+        'commodity': entity.get('commodity') or entity.get('product'),
+        'season': entity.get('season'),
+        'trade_info': f"{entity.get('from')} -> {entity.get('to')}" if entity.get('from') else None,
+        'impact_score': score,
+        'affected_geography': geo_id,
+        'path': [geo_id]
+    }
+
+
+def impact_scores(entity_types: List[str], event_type: str) -> np.ndarray:
+    """
+    Impact score of each entity type for an event, computed in one pass.
+    
+    An entity scores 0.5 plus its IMPACT_TYPE_BONUS and IMPACT_EVENT_BONUS,
+    capped at 1.0. Entity types are coded as integers so both bonuses are
+    read with array indexing.
+    
+    Args:
+        entity_types: Entity type of each impacted entity
+        event_type: Type of event
+    
+    Returns:
+        float64 array of impact scores, capped at 1.0
+    """
+    codes = np.fromiter(
+        (IMPACT_TYPE_CODES.get(entity_type, 0) for entity_type in entity_types),
+        dtype=np.intp,
+        count=len(entity_types)
+    )
+    
+    # Bonus tables indexed by type code, code 0 scoring no bonus
+    type_bonus = np.zeros(len(IMPACT_TYPE_CODES) + 1)
+    event_bonus = np.zeros(len(IMPACT_TYPE_CODES) + 1)
+    for entity_type, code in IMPACT_TYPE_CODES.items():
+        type_bonus[code] = IMPACT_TYPE_BONUS[entity_type]
+        event_bonus[code] = IMPACT_EVENT_BONUS.get((event_type, entity_type), 0.0)
+    
+    return np.minimum(0.5 + type_bonus[codes] + event_bonus[codes], 1.0)
+
+
+def scored_impacts(
+    rows: Iterable[Dict[str, Any]],
+    event_type: str,
+    impact_threshold: float
+) -> Iterator[Tuple[str, Dict[str, Any], float]]:
+    """
+    Yield (geography id, entity, score) for entities above the threshold.
+    
+    Rows of geography_impacts_query are consumed lazily and scored in
+    chunks of IMPACT_SCORE_CHUNK_SIZE.
+    """
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, IMPACT_SCORE_CHUNK_SIZE))
+        if not chunk:
+            return
+        
+        connected = [(str(row['geo_id']), row['entity']) for row in chunk if row.get('entity')]
+        scores = impact_scores(
+            [entity.get('type', entity.get('entity_type', '')) for _, entity in connected],
+            event_type
+        )
+        for (geo_id, entity), score, keep in zip(connected, scores.tolist(), scores >= impact_threshold):
+            if keep:
+                yield geo_id, entity, score
@@ -2,13 +2,159 @@
 Spatial Operations - Geographic and spatial analysis for the knowledge graph
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Optional, Any, Tuple
+import json
 import logging
+import math
+import numpy as np
+import shapely
 from shapely.geometry import Point, Polygon, shape
-from shapely import ops
+from shapely import affinity, ops
+
+from .dimensional_extract import validate_identifier
 
 logger = logging.getLogger(__name__)
 
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE_LAT = 111.0
+
+# Fixed, parameterized queries issued on hot paths; keeping them as constants
+# means every call sends a byte-identical string and hits the plan cache
+CONNECTED_ENTITIES_QUERY = """
+UNWIND $ids AS eid
+MATCH (n)-[r]-(m)
+WHERE id(n) = eid
+WITH eid, collect(id(m))[..$limit] AS connected
+RETURN eid as source, connected
+"""
+
+ENTITY_GEOMETRY_QUERY = """
+MATCH (n)-[:has_geometry]->(g)
+WHERE id(n) = $entity_id
+RETURN g.geometry as geometry
+"""
+
+
+def to_geometries(values: List[Any], on_invalid: str = 'raise') -> np.ndarray:
+    """
+    Convert stored geometries (GeoJSON dicts or strings, or WKT) to Shapely.
+    
+    Each format is parsed in one vectorized shapely call rather than one
+    shape() call per value.
+    
+    Args:
+        values: Stored geometry values
+        on_invalid: 'raise', 'warn' or 'ignore'; ignored values become None
+    
+    Returns:
+        NumPy object array of Shapely geometries
+    """
+    texts = np.array([
+        value.strip() if isinstance(value, str) else json.dumps(getattr(value, '__geo_interface__', value))
+        for value in values
+    ], dtype=object)
+    is_geojson = np.array([text.startswith('{') for text in texts], dtype=bool)
+    
+    geometries = np.empty(len(texts), dtype=object)
+    if is_geojson.any():
+        geometries[is_geojson] = shapely.from_geojson(texts[is_geojson], on_invalid=on_invalid)
+    if not is_geojson.all():
+        geometries[~is_geojson] = shapely.from_wkt(texts[~is_geojson], on_invalid=on_invalid)
+    return geometries
+
+
+def geometry_bounds(values: List[Any]) -> List[Optional[Tuple[float, float, float, float]]]:
+    """
+    Bounding box of each stored geometry value.
+    
+    Args:
+        values: Stored geometry values
+    
+    Returns:
+        (minx, miny, maxx, maxy) of each value, or None where it can't be
+        parsed or is empty
+    """
+    if not values:
+        return []
+    bounds = shapely.bounds(to_geometries(values, on_invalid='ignore'))
+    return [None if math.isnan(box[0]) else tuple(box) for box in bounds.tolist()]
+
+
+def haversine_km(lon: float, lat: float, lons: np.ndarray, lats: np.ndarray) -> np.ndarray:
+    """
+    Great-circle distances in km from one point to arrays of points.
+    
+    Args:
+        lon, lat: Origin in degrees
+        lons, lats: Destinations in degrees
+    
+    Returns:
+        Array of distances in kilometers
+    """
+    lat1 = np.radians(lat)
+    lat2 = np.radians(lats)
+    dlat = lat2 - lat1
+    dlon = np.radians(lons) - np.radians(lon)
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _bfs_hops(
+    seed_groups: List[List[int]],
+    get_neighbors: Callable[[List[int]], Dict[int, List[int]]],
+    max_depth: int
+) -> List[Dict[int, int]]:
+    """
+    Hop distance from the nearest seed of every node reached within max_depth hops.
+    
+    Relationships are followed in both directions. Every group advances
+    one hop at a time, so each hop looks up the neighbours of all groups'
+    frontiers with a single get_neighbors call.
+    
+    Args:
+        seed_groups: Seed node IDs of each group
+        get_neighbors: Maps a list of node IDs to their neighbour IDs
+        max_depth: Maximum hops from the seeds
+    
+    Returns:
+        Hop distance of each reached node, excluding seeds, for each group
+    """
+    visited = [set(seeds) for seeds in seed_groups]
+    frontiers = [list(dict.fromkeys(seeds)) for seeds in seed_groups]
+    hops = [{} for _ in seed_groups]
+    for hop in range(1, max_depth + 1):
+        wanted = list(dict.fromkeys(node for frontier in frontiers for node in frontier))
+        if not wanted:
+            break
+        
+        neighbors = get_neighbors(wanted)
+        for i, frontier in enumerate(frontiers):
+            next_frontier = []
+            for node in frontier:
+                for neighbor in neighbors.get(node, ()):
+                    if neighbor not in visited[i]:
+                        visited[i].add(neighbor)
+                        hops[i][neighbor] = hop
+                        next_frontier.append(neighbor)
+            frontiers[i] = next_frontier
+    return hops
+
+
+def _bfs_impact_scores(hops: Dict[int, int], decay_factor: float) -> Dict[int, float]:
+    """
+    Impact score of every node from its hop distance to the nearest seed.
+    
+    Args:
+        hops: Hop distance of each node, as returned by _bfs_hops
+        decay_factor: Impact multiplier per hop
+    
+    Returns:
+        Dictionary mapping entity IDs to impact scores
+    """
+    # Hop 1 covers direct neighbours, which get full impact
+    return {node: decay_factor ** (hop - 1) for node, hop in hops.items()}
+
 
 class SpatialOperations:
     """
@@ -27,6 +173,14 @@ class SpatialOperations:
         self.db = falkordb_client
         self.config = config or {}
         self.default_crs = self.config.get('crs', 'EPSG:4326')  # WGS84
+        # LRU caches keyed by entity ID; they are not invalidated on graph
+        # writes, so call clear_cache() after mutating geometries or edges
+        self.cache_size = self.config.get('cache_size', 4096)
+        self._geometry_cache: OrderedDict[int, Optional[Dict[str, Any]]] = OrderedDict()
+        self._neighbor_cache: OrderedDict[Tuple[int, int], List[int]] = OrderedDict()
+        # Parsed Shapely geometries keyed by their stored string, so an
+        # entity whose geometry changes is parsed again
+        self._shape_cache: OrderedDict[str, Any] = OrderedDict()
     
     def find_intersecting_geographies(
         self,
@@ -96,28 +250,7 @@ class SpatialOperations:
             # Convert GeoJSON to Shapely geometry
             query_geom = shape(geometry)
             
-            # Build query to fetch entities with geometries
-            query = self._build_spatial_query(entity_types, "has_geometry")
-            
-            # Execute query
-            results = self.db.execute_query(query) if hasattr(self.db, 'execute_query') else []
-            
-            intersecting = []
-            for record in results:
-                if 'geometry' in record:
-                    entity_geom = shape(record['geometry'])
-                    if query_geom.intersects(entity_geom):
-                        intersecting.append({
-                            'entity_id': record.get('id'),
-                            'entity_type': record.get('type'),
-                            'geometry': record.get('geometry'),
-                            'properties': record.get('properties', {})
-                        })
-                
-                if len(intersecting) >= max_results:
-                    break
-            
-            return intersecting
+            return self._match_entity_geometries(query_geom, entity_types, 'intersects', max_results)
         
         except Exception as e:
             logger.error(f"Error finding intersecting entities: {e}")
@@ -144,25 +277,7 @@ class SpatialOperations:
         
         try:
             query_geom = shape(geometry)
-            query = self._build_spatial_query(entity_types, "has_geometry")
-            results = self.db.execute_query(query) if hasattr(self.db, 'execute_query') else []
-            
-            within = []
-            for record in results:
-                if 'geometry' in record:
-                    entity_geom = shape(record['geometry'])
-                    if query_geom.contains(entity_geom):
-                        within.append({
-                            'entity_id': record.get('id'),
-                            'entity_type': record.get('type'),
-                            'geometry': record.get('geometry'),
-                            'properties': record.get('properties', {})
-                        })
-                
-                if len(within) >= max_results:
-                    break
-            
-            return within
+            return self._match_entity_geometries(query_geom, entity_types, 'contains', max_results)
         
         except Exception as e:
             logger.error(f"Error finding entities within: {e}")
@@ -193,10 +308,11 @@ class SpatialOperations:
             # Create point geometry
             query_point = Point(point)
             
-            # Create buffer (approximate, for WGS84)
-            # 1 degree ≈ 111 km at equator
-            radius_degrees = radius_km / 111.0
-            buffer_geom = query_point.buffer(radius_degrees)
+            # A degree of longitude shrinks with cos(latitude), so the search
+            # area is an ellipse stretched east-west rather than a circle
+            dlat = radius_km / KM_PER_DEGREE_LAT
+            cos_lat = max(math.cos(math.radians(query_point.y)), 0.01)
+            buffer_geom = affinity.scale(query_point.buffer(dlat), xfact=1.0 / cos_lat, yfact=1.0)
             
             # Find intersecting entities
             entities = self.find_intersecting_entities(
@@ -205,21 +321,22 @@ class SpatialOperations:
                 max_results=max_results
             )
             
-            # Calculate actual distances
-            for entity in entities:
-                if 'geometry' in entity:
-                    entity_geom = shape(entity['geometry'])
-                    # Get centroid for distance calculation
-                    entity_point = entity_geom.centroid
-                    # Approximate distance in km
-                    distance_degrees = query_point.distance(entity_point)
-                    distance_km = distance_degrees * 111.0
-                    entity['distance_km'] = round(distance_km, 2)
+            if not entities:
+                return entities
             
-            # Sort by distance
-            entities.sort(key=lambda x: x.get('distance_km', float('inf')))
+            # Great-circle distances in km from all centroids at once
+            centroids = shapely.centroid(self._parse_geometries([entity['geometry'] for entity in entities]))
+            distances_km = haversine_km(
+                query_point.x,
+                query_point.y,
+                shapely.get_x(centroids),
+                shapely.get_y(centroids)
+            )
+            for entity, distance_km in zip(entities, distances_km):
+                entity['distance_km'] = round(float(distance_km), 2)
             
-            return entities
+            # Sort by distance
+            return [entities[i] for i in np.argsort(distances_km, kind='stable')]
         
         except Exception as e:
             logger.error(f"Error finding nearby entities: {e}")
@@ -244,11 +361,64 @@ class SpatialOperations:
         Returns:
             Dictionary with impacted entities and relationships
         """
-        logger.info(f"Calculating impact area for {event_type} event")
+        return self.calculate_impact_areas([(event_geometry, event_type)], max_hops, impact_threshold)[0]
+    
+    def calculate_impact_areas(
+        self,
+        events: List[Tuple[Dict[str, Any], str]],
+        max_hops: int = 5,
+        impact_threshold: float = 0.1
+    ) -> List[Dict[str, Any]]:
+        """
+        Calculate impact areas for several spatial events at once.
+        
+        Directly affected entities are looked up once per event. Impact is
+        then propagated for all events together, with one batched neighbour
+        query per hop instead of one per event and hop. If that fails, events
+        are propagated one at a time so one bad event doesn't fail the rest.
+        
+        Args:
+            events: (GeoJSON geometry, event type) pairs
+            max_hops: Maximum graph hops for impact propagation
+            impact_threshold: Minimum impact score to include
+        
+        Returns:
+            Impact area dictionaries, one per event
+        """
+        for _, event_type in events:
+            logger.info(f"Calculating impact area for {event_type} event")
+        
+        # Find directly affected entities
+        affected_groups = [self.find_intersecting_entities(geometry) for geometry, _ in events]
+        errors: List[Optional[str]] = [None] * len(events)
         
+        # Propagate impact through graph relationships
         try:
-            # Find directly affected entities
-            directly_affected = self.find_intersecting_entities(event_geometry)
+            propagated_groups = self._propagate_impact_many(affected_groups, max_hops, impact_threshold)
+        except Exception as e:
+            logger.warning(f"Batched impact propagation failed, propagating events one at a time: {e}")
+            propagated_groups = []
+            for i, directly_affected in enumerate(affected_groups):
+                try:
+                    propagated_groups.append(self._propagate_impact(directly_affected, max_hops, impact_threshold))
+                except Exception as event_error:
+                    logger.error(f"Error calculating impact area: {event_error}")
+                    errors[i] = str(event_error)
+                    propagated_groups.append({})
+        
+        areas = []
+        for (_, event_type), directly_affected, propagated_impacts, error in zip(
+            events, affected_groups, propagated_groups, errors
+        ):
+            if error is not None:
+                areas.append({
+                    'error': error,
+                    'directly_affected_count': 0,
+                    'total_impacted_count': 0,
+                    'impact_scores': {},
+                    'directly_affected': []
+                })
+                continue
             
             # Initialize impact scores
             impact_scores = {}
@@ -256,13 +426,6 @@ class SpatialOperations:
                 entity_id = entity.get('entity_id')
                 impact_scores[entity_id] = 1.0  # Direct impact
             
-            # Propagate impact through graph relationships
-            propagated_impacts = self._propagate_impact(
-                directly_affected,
-                max_hops,
-                impact_threshold
-            )
-            
             impact_scores.update(propagated_impacts)
             
             # Filter by threshold
@@ -272,23 +435,15 @@ class SpatialOperations:
                 if score >= impact_threshold
             }
             
-            return {
+            areas.append({
                 'event_type': event_type,
                 'directly_affected_count': len(directly_affected),
                 'total_impacted_count': len(filtered_impacts),
                 'impact_scores': filtered_impacts,
                 'directly_affected': directly_affected
-            }
+            })
         
-        except Exception as e:
-            logger.error(f"Error calculating impact area: {e}")
-            return {
-                'error': str(e),
-                'directly_affected_count': 0,
-                'total_impacted_count': 0,
-                'impact_scores': {},
-                'directly_affected': []
-            }
+        return areas
     
     def _propagate_impact(
         self,
@@ -299,6 +454,10 @@ class SpatialOperations:
         """
         Propagate impact through graph relationships.
         
+        Impact spreads along relationships in either direction, to at most
+        50 neighbours per entity. An entity's score decays with its hop
+        distance from the nearest seed.
+        
         Args:
             initial_entities: Initially affected entities
             max_hops: Maximum hops for propagation
@@ -307,83 +466,268 @@ class SpatialOperations:
         Returns:
             Dictionary mapping entity IDs to impact scores
         """
-        impact_scores = {}
+        return self._propagate_impact_many([initial_entities], max_hops, threshold)[0]
+    
+    def _propagate_impact_many(
+        self,
+        entity_groups: List[List[Dict[str, Any]]],
+        max_hops: int,
+        threshold: float
+    ) -> List[Dict[str, float]]:
+        """
+        Propagate impact independently for several groups of seed entities.
+        
+        The groups are traversed breadth-first together, with one batched
+        neighbour query per hop for every group's frontier.
+        
+        Args:
+            entity_groups: Initially affected entities of each group
+            max_hops: Maximum hops for propagation
+            threshold: Minimum impact score
+        
+        Returns:
+            Impact scores for each group, in order
+        """
         decay_factor = 0.5  # Impact decays by 50% per hop
         
-        current_entities = [e.get('entity_id') for e in initial_entities if e.get('entity_id')]
+        seed_groups = [
+            [int(e['entity_id']) for e in group if e.get('entity_id') is not None]
+            for group in entity_groups
+        ]
         
-        for hop in range(max_hops):
-            if not current_entities:
-                break
-            
-            # Calculate impact for current hop
-            current_impact = (decay_factor ** hop)
-            
-            if current_impact < threshold:
-                break
-            
-            # Find connected entities
-            next_entities = []
-            for entity_id in current_entities:
-                connected = self._get_connected_entities(entity_id)
-                for conn_id in connected:
-                    if conn_id not in impact_scores or impact_scores[conn_id] < current_impact:
-                        impact_scores[conn_id] = current_impact
-                        next_entities.append(conn_id)
-            
-            current_entities = next_entities
+        # Only traverse as deep as the impact stays above the threshold
+        depth = 0
+        while depth < max_hops and decay_factor ** depth >= threshold:
+            depth += 1
         
-        return impact_scores
+        hops = _bfs_hops(seed_groups, self._get_connected_entities_batch, depth)
+        return [_bfs_impact_scores(group_hops, decay_factor) for group_hops in hops]
     
-    def _get_connected_entities(self, entity_id: str) -> List[str]:
-        """Get entities connected to the given entity"""
-        query = f"""
-        MATCH (n)-[r]-(m)
-        WHERE id(n) = '{entity_id}'
-        RETURN id(m) as connected_id
-        LIMIT 50
-        """
+    def _get_connected_entities_batch(
+        self,
+        entity_ids: List[str],
+        limit_per_entity: int = 50
+    ) -> Dict[int, List[int]]:
+        """Get up to limit_per_entity connected entities for each entity in one query"""
+        connected_by_entity = {}
+        missing = []
+        for entity_id in map(int, entity_ids):
+            key = (entity_id, limit_per_entity)
+            if key in self._neighbor_cache:
+                self._neighbor_cache.move_to_end(key)
+                connected_by_entity[entity_id] = self._neighbor_cache[key]
+            else:
+                missing.append(entity_id)
+        
+        if not missing:
+            return connected_by_entity
+        
+        query = CONNECTED_ENTITIES_QUERY
+        params = {'ids': missing, 'limit': limit_per_entity}
         
         try:
-            results = self.db.execute_query(query) if hasattr(self.db, 'execute_query') else []
-            return [r.get('connected_id') for r in results if r.get('connected_id')]
+            results = self.db.execute_query(query, params) if hasattr(self.db, 'execute_query') else []
         except Exception as e:
             logger.error(f"Error getting connected entities: {e}")
+            return connected_by_entity
+        
+        fetched = {entity_id: [] for entity_id in missing}
+        fetched.update({r['source']: r['connected'] for r in results})
+        for entity_id, connected in fetched.items():
+            self._remember(self._neighbor_cache, (entity_id, limit_per_entity), connected)
+            if connected:
+                connected_by_entity[entity_id] = connected
+        return connected_by_entity
+    
+    def _match_entity_geometries(
+        self,
+        query_geom: Any,
+        entity_types: Optional[List[str]],
+        predicate: str,
+        max_results: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch entity geometries and keep those matching a spatial predicate.
+        
+        Candidates go into an STRtree, so the predicate is evaluated in
+        GEOS only for geometries whose bounding boxes overlap the query.
+        
+        Args:
+            query_geom: Shapely geometry to test against
+            entity_types: Optional list of entity types to filter
+            predicate: Shapely predicate, evaluated as query_geom.<predicate>(entity_geom)
+            max_results: Maximum number of results
+        
+        Returns:
+            Matching entities in query result order
+        """
+        query, params = self._build_spatial_query(entity_types, "has_geometry", bbox=query_geom.bounds)
+        results = self.db.execute_query(query, params) if hasattr(self.db, 'execute_query') else []
+        
+        records = [record for record in results if 'geometry' in record]
+        if not records:
             return []
+        
+        tree = shapely.STRtree(self._parse_geometries([record['geometry'] for record in records]))
+        hits = np.sort(tree.query(query_geom, predicate=predicate))[:max_results]
+        
+        return [
+            {
+                'entity_id': records[i].get('id'),
+                'entity_type': records[i].get('type'),
+                'geometry': records[i].get('geometry'),
+                'properties': records[i].get('properties', {})
+            }
+            for i in hits
+        ]
+    
+    def _parse_geometries(self, values: List[Any]) -> np.ndarray:
+        """
+        Parse stored geometries, reusing Shapely objects parsed on earlier calls.
+        
+        Args:
+            values: Stored geometry values; strings are cached by their text
+        
+        Returns:
+            Array of Shapely geometries
+        """
+        geometries = np.empty(len(values), dtype=object)
+        missing = []
+        for i, value in enumerate(values):
+            if isinstance(value, str) and value in self._shape_cache:
+                self._shape_cache.move_to_end(value)
+                geometries[i] = self._shape_cache[value]
+            else:
+                missing.append(i)
+        
+        if missing:
+            parsed = to_geometries([values[i] for i in missing])
+            for i, geometry in zip(missing, parsed):
+                geometries[i] = geometry
+                if isinstance(values[i], str):
+                    self._remember(self._shape_cache, values[i], geometry)
+        
+        return geometries
     
     def _build_spatial_query(
         self,
         entity_types: Optional[List[str]],
-        relationship_type: str
-    ) -> str:
-        """Build a Cypher query for spatial operations"""
+        relationship_type: str,
+        bbox: Optional[Tuple[float, float, float, float]] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build a Cypher query for spatial operations.
+        
+        When bbox (minx, miny, maxx, maxy) is given, geometries whose stored
+        bounds don't overlap it are dropped server-side. Geometries without
+        stored bounds are always returned.
+        """
+        # Labels and relationship types can't be parameters, so validate them
         type_filter = ""
         if entity_types:
-            types_str = "|".join(entity_types)
+            types_str = "|".join(map(validate_identifier, entity_types))
             type_filter = f":{types_str}"
+        validate_identifier(relationship_type)
+        
+        bbox_filter = ""
+        params = {}
+        if bbox is not None:
+            bbox_filter = """
+        AND (g.minx IS NULL OR (g.maxx >= $minx AND g.minx <= $maxx
+                                AND g.maxy >= $miny AND g.miny <= $maxy))"""
+            params = dict(zip(('minx', 'miny', 'maxx', 'maxy'), map(float, bbox)))
         
         query = f"""
         MATCH (n{type_filter})-[:{relationship_type}]->(g)
-        WHERE exists(g.geometry)
+        WHERE exists(g.geometry){bbox_filter}
         RETURN id(n) as id, labels(n)[0] as type, g.geometry as geometry, properties(n) as properties
         LIMIT 1000
         """
         
-        return query
+        return query, params
     
-    def get_entity_geometry(self, entity_id: str) -> Optional[Dict[str, Any]]:
-        """Get the geometry of a specific entity"""
+    def store_geometry_bounds(self, batch_size: int = 1000, refresh: bool = False) -> int:
+        """
+        Store bounding boxes on geometry nodes.
+        
+        Sets g.minx, g.miny, g.maxx, g.maxy so spatial queries can discard
+        non-overlapping geometries before they are sent to the client.
+        FalkorDBClient.create_entities_bulk stores bounds as nodes are
+        created; this backfills nodes written before that or by other means.
+        
+        Args:
+            batch_size: Number of geometry nodes updated per query
+            refresh: Recompute bounds of every geometry node, e.g. after
+                geometries were updated in place; by default only nodes
+                without bounds are updated
+        
+        Returns:
+            Number of geometry nodes updated
+        """
         query = f"""
-        MATCH (n)-[:has_geometry]->(g)
-        WHERE id(n) = '{entity_id}'
-        RETURN g.geometry as geometry
+        MATCH (g)
+        WHERE exists(g.geometry){'' if refresh else ' AND g.minx IS NULL'}
+        RETURN id(g) as id, g.geometry as geometry
+        """
+        update_query = """
+        UNWIND $rows AS row
+        MATCH (g)
+        WHERE id(g) = row.id
+        SET g.minx = row.minx, g.miny = row.miny, g.maxx = row.maxx, g.maxy = row.maxy
         """
         
         try:
             results = self.db.execute_query(query) if hasattr(self.db, 'execute_query') else []
-            if results and 'geometry' in results[0]:
-                return results[0]['geometry']
+            
+            rows = []
+            for record, box in zip(results, geometry_bounds([record['geometry'] for record in results])):
+                if box is None:
+                    logger.warning(f"Unreadable geometry on node {record['id']}")
+                    if not refresh:
+                        continue
+                    # Drop stale bounds so the node is never filtered out
+                    box = (None, None, None, None)
+                minx, miny, maxx, maxy = box
+                rows.append({'id': record['id'], 'minx': minx, 'miny': miny, 'maxx': maxx, 'maxy': maxy})
+            
+            for start in range(0, len(rows), batch_size):
+                self.db.execute_query(update_query, {'rows': rows[start:start + batch_size]})
+            
+            logger.info(f"Stored bounds for {len(rows)} geometries")
+            return len(rows)
+        
+        except Exception as e:
+            logger.error(f"Error storing geometry bounds: {e}")
+            return 0
+    
+    def get_entity_geometry(self, entity_id: str) -> Optional[Dict[str, Any]]:
+        """Get the geometry of a specific entity"""
+        entity_id = int(entity_id)
+        if entity_id in self._geometry_cache:
+            self._geometry_cache.move_to_end(entity_id)
+            return self._geometry_cache[entity_id]
+        
+        query = ENTITY_GEOMETRY_QUERY
+        
+        try:
+            results = self.db.execute_query(query, {'entity_id': entity_id}) if hasattr(self.db, 'execute_query') else []
+            geometry = results[0].get('geometry') if results else None
+            return self._remember(self._geometry_cache, entity_id, geometry)
         except Exception as e:
             logger.error(f"Error getting entity geometry: {e}")
         
         return None
+    
+    def clear_cache(self):
+        """Clear cached geometries, parsed shapes and neighbour lists."""
+        self._geometry_cache.clear()
+        self._neighbor_cache.clear()
+        self._shape_cache.clear()
+    
+    def _remember(self, cache: OrderedDict, key: Hashable, value: Any) -> Any:
+        """Store a value in an LRU cache, evicting the oldest entry when full"""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return value
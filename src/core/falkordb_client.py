@@ -2,12 +2,175 @@
 FalkorDB Client for graph database operations
 """
 
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterator, List, Optional, Any, Tuple
+import numbers
+import threading
 import falkordb
+import redis
+import redis.asyncio
+from falkordb import QueryResult
 import logging
 
+from ..analytics.spatial_ops import geometry_bounds
+
 logger = logging.getLogger(__name__)
 
+# Rows sent per UNWIND query by the bulk creation methods
+BULK_BATCH_SIZE = 1000
+
+# Bounding box properties stored next to a node's geometry
+GEOMETRY_BOUND_PROPERTIES = ('minx', 'miny', 'maxx', 'maxy')
+
+# Number of query texts whose result column names are remembered
+COLUMN_CACHE_SIZE = 256
+
+DEFAULT_MAX_CONNECTIONS = 32
+
+
+def create_connection_pool(
+    host: str,
+    port: int,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    ssl: bool = False,
+    max_connections: Optional[int] = None
+) -> redis.BlockingConnectionPool:
+    """
+    Create a thread-safe Redis connection pool for a FalkorDB client.
+    
+    Each query checks out its own connection, so concurrent callers don't
+    serialize on one socket; once max_connections are busy, callers wait for
+    one to be released instead of failing.
+    
+    Args:
+        host: FalkorDB host
+        port: FalkorDB port
+        username: Optional username
+        password: Optional password
+        ssl: Use SSL connections
+        max_connections: Pool size (default: DEFAULT_MAX_CONNECTIONS)
+    
+    Returns:
+        Pool to pass as falkordb.FalkorDB(connection_pool=...)
+    """
+    connection_kwargs = {}
+    if ssl:
+        connection_kwargs['connection_class'] = redis.SSLConnection
+    return redis.BlockingConnectionPool(
+        host=host,
+        port=port,
+        username=username,
+        password=password,
+        max_connections=max_connections or DEFAULT_MAX_CONNECTIONS,
+        decode_responses=True,  # FalkorDB parses decoded replies
+        **connection_kwargs
+    )
+
+
+def create_async_connection_pool(
+    host: str,
+    port: int,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    ssl: bool = False,
+    max_connections: Optional[int] = None
+) -> redis.asyncio.BlockingConnectionPool:
+    """
+    Create an asyncio Redis connection pool for falkordb.asyncio clients.
+    
+    Takes the same arguments as create_connection_pool.
+    
+    Returns:
+        Pool to pass as falkordb.asyncio.FalkorDB(connection_pool=...)
+    """
+    connection_kwargs = {}
+    if ssl:
+        connection_kwargs['connection_class'] = redis.asyncio.SSLConnection
+    return redis.asyncio.BlockingConnectionPool(
+        host=host,
+        port=port,
+        username=username,
+        password=password,
+        max_connections=max_connections or DEFAULT_MAX_CONNECTIONS,
+        decode_responses=True,
+        **connection_kwargs
+    )
+
+
+@lru_cache(maxsize=256)
+def _type_filter(types: FrozenSet[str]) -> str:
+    """
+    Pattern filter matching any of the given labels or relationship types.
+    
+    Types are sorted so every ordering renders the same query text and
+    reuses FalkorDB's cached plan for it.
+    """
+    return ":" + "|".join(sorted(types)) if types else ""
+
+
+def _cypher_literal(value: Any) -> str:
+    """
+    Render a query parameter as a Cypher literal for a CYPHER header.
+    
+    Accepts the values JSON would: strings, numbers, booleans, None, and
+    lists and dicts of them.
+    """
+    if isinstance(value, str):
+        return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(_cypher_literal(v) for v in value) + "]"
+    if isinstance(value, dict):
+        return "{" + ",".join(f"{_cypher_key(k)}:{_cypher_literal(v)}" for k, v in value.items()) + "}"
+    if isinstance(value, numbers.Real):
+        return str(value)
+    raise TypeError(f"Unsupported query parameter type: {type(value).__name__}")
+
+
+def _cypher_key(key: Any) -> str:
+    """Backtick-quote a parameter or map key."""
+    key = str(key)
+    if not key or '`' in key:
+        raise ValueError(f"Invalid query parameter name: {key!r}")
+    return f"`{key}`"
+
+
+def _with_geometry_bounds(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Add minx/miny/maxx/maxy to property maps that set a geometry.
+    
+    Spatial queries prune candidates on these bounds, so they are written
+    together with the geometry. Maps whose geometry can't be parsed get null
+    bounds, so the node is never pruned.
+    """
+    indices = [i for i, row in enumerate(rows) if row.get('geometry') is not None]
+    if not indices:
+        return rows
+    
+    rows = list(rows)
+    for i, box in zip(indices, geometry_bounds([rows[i]['geometry'] for i in indices])):
+        rows[i] = {**rows[i], **dict(zip(GEOMETRY_BOUND_PROPERTIES, box or (None,) * 4))}
+    return rows
+
+
+def _query_command(query: str, parameters: Optional[Dict[str, Any]]) -> str:
+    """
+    GRAPH.QUERY text for a query, with its parameters in a CYPHER header.
+    
+    This is the command Graph.query sends, built here so pipelined queries
+    don't depend on falkordb-py internals.
+    """
+    if not parameters:
+        return query
+    return "CYPHER " + " ".join(
+        f"{_cypher_key(k)}={_cypher_literal(v)}" for k, v in parameters.items()
+    ) + " " + query
+
 
 class FalkorDBClient:
     """Client for interacting with FalkorDB graph database."""
@@ -17,30 +180,70 @@ class FalkorDBClient:
         self.config = config
         self.graph_name = config['graph_name']
         
-        # Connect to FalkorDB
-        self.client = falkordb.FalkorDB(
+        # Connect to FalkorDB; the connection pool is shared by every thread
+        # and component using this client
+        self.pool = create_connection_pool(
             host=config['host'],
             port=config['port'],
             username=config.get('username'),
             password=config.get('password'),
-            ssl=config.get('ssl', False)
+            ssl=config.get('ssl', False),
+            max_connections=config.get('max_connections')
         )
+        self.client = falkordb.FalkorDB(connection_pool=self.pool)
         
         self.graph = self.client.select_graph(self.graph_name)
+        # A query's RETURN clause fixes its columns, so names are parsed once
+        # per query text
+        self._column_cache: OrderedDict[str, List[str]] = OrderedDict()
+        self._column_cache_lock = threading.Lock()
         logger.info(f"Connected to FalkorDB graph: {self.graph_name}")
     
     def create_entity(self, entity_type: str, properties: Dict[str, Any]) -> str:
         """Create a new entity node in the graph."""
-        # Build property string for Cypher
-        props_str = ", ".join([f"{k}: ${k}" for k in properties.keys()])
+        return self.create_entities_bulk(entity_type, [properties])[0]
+    
+    def create_entities_bulk(
+        self,
+        entity_type: str,
+        rows: List[Dict[str, Any]],
+        batch_size: int = BULK_BATCH_SIZE,
+        shared_properties: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """
+        Create many entity nodes of one type with one query per batch.
+        
+        Nodes with a geometry property also get its bounding box, see
+        _with_geometry_bounds.
+        
+        Args:
+            entity_type: Label of the new nodes
+            rows: Property map of each node
+            batch_size: Rows sent per query
+            shared_properties: Properties set on every node, sent once per
+                batch and taking precedence over row properties
+        
+        Returns:
+            IDs of the created nodes, in input order
+        """
+        rows = _with_geometry_bounds(rows)
+        shared = _with_geometry_bounds([shared_properties or {}])[0]
         
         query = f"""
-        CREATE (n:{entity_type} {{{props_str}}})
+        UNWIND $rows AS row
+        CREATE (n:{entity_type})
+        SET n = row, n += $shared
         RETURN id(n) as entity_id
         """
         
-        result = self.graph.query(query, properties)
-        return str(result.result_set[0][0])
+        entity_ids = []
+        for start in range(0, len(rows), batch_size):
+            result = self.graph.query(query, {
+                'rows': rows[start:start + batch_size],
+                'shared': shared
+            })
+            entity_ids.extend(str(row[0]) for row in result.result_set)
+        return entity_ids
     
     def create_relationship(
         self,
@@ -64,24 +267,121 @@ class FalkorDBClient:
         result = self.graph.query(query, params)
         return str(result.result_set[0][0])
     
+    def create_relationships_bulk(
+        self,
+        relationships: List[Dict[str, Any]],
+        batch_size: int = BULK_BATCH_SIZE
+    ) -> List[Optional[str]]:
+        """
+        Create many relationships with one query per type and batch.
+        
+        Relationship types can't be query parameters, so relationships are
+        grouped by type and each group is sent with UNWIND; the queries for
+        all groups are pipelined into one round trip.
+        
+        Args:
+            relationships: Dicts with source_id, target_id, relationship_type
+                and optional properties
+            batch_size: Rows sent per query
+        
+        Returns:
+            IDs of the created relationships in input order; None where an
+            endpoint was not found
+        """
+        rows_by_type = defaultdict(list)
+        for i, rel in enumerate(relationships):
+            rows_by_type[rel['relationship_type']].append({
+                'i': i,
+                'source_id': int(rel['source_id']),
+                'target_id': int(rel['target_id']),
+                'props': rel.get('properties') or {}
+            })
+        
+        queries = []
+        for relationship_type, rows in rows_by_type.items():
+            query = f"""
+            UNWIND $rows AS row
+            MATCH (a), (b)
+            WHERE id(a) = row.source_id AND id(b) = row.target_id
+            CREATE (a)-[r:{relationship_type}]->(b)
+            SET r = row.props
+            RETURN row.i as i, id(r) as rel_id
+            """
+            for start in range(0, len(rows), batch_size):
+                queries.append((query, {'rows': rows[start:start + batch_size]}))
+        
+        rel_ids = [None] * len(relationships)
+        for result in self.execute_pipeline(queries):
+            for row in result:
+                rel_ids[row['i']] = str(row['rel_id'])
+        return rel_ids
+    
     def execute_query(self, query: str, parameters: Optional[Dict] = None) -> List[Dict]:
         """Execute raw Cypher query."""
         result = self.graph.query(query, parameters or {})
-        results = []
+        return self._result_to_dicts(result, query)
+    
+    def execute_pipeline(self, queries: List[Tuple[str, Optional[Dict]]]) -> List[List[Dict]]:
+        """
+        Execute several Cypher queries in one round trip.
+        
+        The queries are sent back to back on a Redis pipeline before any
+        reply is read, so independent queries share a single network round
+        trip. They are not run as a transaction.
+        
+        Args:
+            queries: (query, parameters) pairs
+        
+        Returns:
+            Result rows for each query, in order
+        """
+        pipe = self.client.connection.pipeline(transaction=False)
+        for query, parameters in queries:
+            pipe.execute_command("GRAPH.QUERY", self.graph_name, _query_command(query, parameters), "--compact")
+        
+        # Compact replies are parsed as Graph.query parses them; the client
+        # version is pinned in requirements.txt for this
+        return [
+            self._result_to_dicts(QueryResult(self.graph, response), query)
+            for (query, _), response in zip(queries, pipe.execute())
+        ]
+    
+    def iter_query_rows(self, query: str, parameters: Optional[Dict] = None) -> Iterator[Dict]:
+        """
+        Execute a Cypher query and yield its row dicts one at a time.
+        
+        The whole result is still fetched by one query; only the row dicts
+        are built as they are consumed, so callers that read rows once
+        don't hold a list of them alongside the raw result.
+        """
+        result = self.graph.query(query, parameters or {})
+        column_names = self._column_names(result, query)
+        for row in result.result_set:
+            yield dict(zip(column_names, row))
+    
+    def _column_names(self, result: QueryResult, query: str) -> List[str]:
+        """Column names of a query result, cached per query text."""
+        with self._column_cache_lock:
+            column_names = self._column_cache.get(query)
+            if column_names is not None:
+                self._column_cache.move_to_end(query)
+                return column_names
         
         # FalkorDB header is a list of [column_id, column_name] pairs
         # Extract just the column names
         column_names = [header_item[1] if isinstance(header_item, list) else header_item 
                         for header_item in result.header]
         
-        for row in result.result_set:
-            row_dict = {}
-            for i in range(len(column_names)):
-                key = column_names[i]
-                value = row[i]
-                row_dict[key] = value
-            results.append(row_dict)
-        return results
+        with self._column_cache_lock:
+            self._column_cache[query] = column_names
+            if len(self._column_cache) > COLUMN_CACHE_SIZE:
+                self._column_cache.popitem(last=False)
+        return column_names
+    
+    def _result_to_dicts(self, result: QueryResult, query: str) -> List[Dict]:
+        """Convert a query result to a list of row dicts keyed by column name."""
+        column_names = self._column_names(result, query)
+        return [dict(zip(column_names, row)) for row in result.result_set]
     
     def get_subgraph(self, filters: Dict[str, Any]) -> Any:
         """Extract subgraph based on filters."""
@@ -104,9 +404,7 @@ class FalkorDBClient:
         relationship_types: Optional[List[str]] = None
     ) -> List[Dict]:
         """Traverse relationships from a starting node."""
-        rel_filter = ""
-        if relationship_types:
-            rel_filter = ":" + "|".join(relationship_types)
+        rel_filter = _type_filter(frozenset(relationship_types or ()))
         
         query = f"""
         MATCH path = (start)-[{rel_filter}*1..{max_depth}]-(connected)
@@ -123,18 +421,17 @@ class FalkorDBClient:
         limit: int = 20
     ) -> List[Dict[str, Any]]:
         """Search entities by text."""
-        type_filter = ""
-        if entity_types:
-            type_filter = ":" + "|".join(entity_types)
+        type_filter = _type_filter(frozenset(entity_types or ()))
         
+        # limit is a parameter so the query text, and its plan, is shared
         query = f"""
         MATCH (n{type_filter})
         WHERE n.name CONTAINS $search_term OR n.description CONTAINS $search_term
         RETURN n
-        LIMIT {limit}
+        LIMIT $limit
         """
         
-        return self.execute_query(query, {'search_term': search_term})
+        return self.execute_query(query, {'search_term': search_term, 'limit': limit})
     
     def get_entity_history(
         self,
@@ -155,20 +452,20 @@ class FalkorDBClient:
         """Get graph statistics."""
         stats = {}
         
-        # Node counts by type
+        # Node and relationship counts by type, fetched in one round trip
         node_query = "MATCH (n) RETURN labels(n) as type, count(n) as count"
-        node_counts = self.execute_query(node_query)
+        rel_query = "MATCH ()-[r]->() RETURN type(r) as type, count(r) as count"
+        node_counts, rel_counts = self.execute_pipeline([(node_query, None), (rel_query, None)])
+        
         stats['nodes'] = {}
-        for r in node_counts:
-            if r['type'] and len(r['type']) > 0:
+        for row in node_counts:
+            labels = row['type']
+            if labels and len(labels) > 0:
                 # Use first label as the type
-                label = r['type'][0] if isinstance(r['type'], list) else str(r['type'])
-                stats['nodes'][label] = r['count']
+                label = labels[0] if isinstance(labels, list) else str(labels)
+                stats['nodes'][label] = row['count']
         
-        # Relationship counts
-        rel_query = "MATCH ()-[r]->() RETURN type(r) as type, count(r) as count"
-        rel_counts = self.execute_query(rel_query)
-        stats['relationships'] = {r['type']: r['count'] for r in rel_counts}
+        stats['relationships'] = {row['type']: row['count'] for row in rel_counts}
         
         return stats
     
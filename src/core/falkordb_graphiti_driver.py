@@ -3,13 +3,162 @@ FalkorDB Driver for Graphiti
 Adapter that allows Graphiti to use FalkorDB as its graph backend instead of Neo4j
 """
 
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 import logging
+import re
 from graphiti_core.driver.driver import GraphDriver
-import falkordb
+from falkordb.asyncio import FalkorDB as AsyncFalkorDB
+
+from ..analytics.dimensional_extract import validate_identifier
+from .falkordb_client import create_async_connection_pool
 
 logger = logging.getLogger(__name__)
 
+# Integer parameters that are inlined into the query text
+INTEGER_PARAMS = ('limit', 'skip', 'offset', 'num_results', 'top_k')
+
+# Patterns compiled once rather than on every execute_query call
+_INTEGER_PARAM_PATTERNS = {
+    key: (re.compile(rf'\${key}\b', re.IGNORECASE), re.compile(rf'\$\{{{key}\}}', re.IGNORECASE))
+    for key in INTEGER_PARAMS
+}
+_LIMIT_PARAM_PATTERN = re.compile(r'LIMIT\s+\$\w+', re.IGNORECASE)
+_SKIP_PARAM_PATTERN = re.compile(r'SKIP\s+\$\w+', re.IGNORECASE)
+
+
+@lru_cache(maxsize=1024)
+def _prepare_query(query: str, inlined_keys: Tuple[str, ...]) -> str:
+    """
+    Rewrite a query once so its integer parameters can be inlined cheaply.
+    
+    FalkorDB sometimes has issues with parameterized LIMIT clauses, so the
+    integer parameters in inlined_keys become str.format fields and any
+    other LIMIT/SKIP parameter gets a fixed default.
+    
+    Args:
+        query: Cypher query string
+        inlined_keys: Integer parameters present in the call's parameters
+    
+    Returns:
+        The rewritten query; a str.format template when inlined_keys is set
+    """
+    if inlined_keys:
+        # Mark $key and ${key} with sentinels that survive brace escaping
+        for key in inlined_keys:
+            plain_pattern, braced_pattern = _INTEGER_PARAM_PATTERNS[key]
+            query = plain_pattern.sub(f"\x00{key}\x00", query)
+            query = braced_pattern.sub(f"\x00{key}\x00", query)
+    
+    # Also handle LIMIT/SKIP with direct numeric parameters that might be None or invalid
+    query = _LIMIT_PARAM_PATTERN.sub('LIMIT 10', query)
+    query = _SKIP_PARAM_PATTERN.sub('SKIP 0', query)
+    
+    if inlined_keys:
+        query = query.replace('{', '{{').replace('}', '}}')
+        for key in inlined_keys:
+            query = query.replace(f"\x00{key}\x00", f"{{{key}}}")
+    return query
+
+
+# Properties covered by the fulltext indexes behind the search methods
+FULLTEXT_PROPERTIES = ('content', 'description')
+
+# Graphiti node labels and relationship types given fulltext indexes by
+# build_fulltext_indexes unless the driver is configured otherwise
+FULLTEXT_NODE_LABELS = ('Entity', 'Episodic', 'Community')
+FULLTEXT_RELATIONSHIP_TYPES = ('RELATES_TO',)
+
+# RediSearch query-syntax characters, such as '-' for negation and '|' for
+# union. The fulltext indexer splits text on them as well, so search text
+# is matched as plain terms by replacing them with spaces
+_FULLTEXT_SYNTAX_PATTERN = re.compile(r'[,.<>{}\[\]"\':;!@#$%^&*()\-+=~|/\\?]+')
+
+
+def _fulltext_terms(search_text: str) -> List[str]:
+    """Lower-cased terms of search text, without query syntax"""
+    return _FULLTEXT_SYNTAX_PATTERN.sub(" ", search_text).lower().split()
+
+
+@lru_cache(maxsize=512)
+def _fulltext_query(node_label: Optional[str], property_name: str) -> str:
+    """Fulltext query template for a label and property; search text is a parameter"""
+    label_filter = f":{validate_identifier(node_label)}" if node_label else ""
+    validate_identifier(property_name)
+    
+    # FalkorDB fulltext search using CONTAINS or regex
+    return f"""
+    MATCH (n{label_filter})
+    WHERE n.{property_name} CONTAINS $search_text
+    RETURN n
+    """
+
+
+def _terms_match(variable: str) -> str:
+    """
+    Condition that every $terms entry occurs in a node or relationship's
+    content or description, ignoring case.
+    
+    This is how the fulltext indexes match, so scans and index searches
+    return the same kind of results.
+    """
+    fields = " OR ".join(
+        f"toLower(coalesce({variable}.{name}, '')) CONTAINS term" for name in FULLTEXT_PROPERTIES
+    )
+    return f"ALL(term IN $terms WHERE {fields})"
+
+
+@lru_cache(maxsize=512)
+def _edge_search_query(relationship_types: Optional[Tuple[str, ...]]) -> str:
+    """Edge search template scanning relationships of a tuple of types"""
+    rel_type_filter = ":" + "|".join(map(validate_identifier, relationship_types)) if relationship_types else ""
+    return f"""
+    MATCH (a)-[r{rel_type_filter}]->(b)
+    WHERE {_terms_match('r')}
+    RETURN r, a, b
+    LIMIT $limit
+    """
+
+
+@lru_cache(maxsize=512)
+def _edge_index_search_query(relationship_types: Tuple[str, ...]) -> str:
+    """Edge search template reading the fulltext index of each relationship type"""
+    branches = " UNION ".join(
+        f"CALL db.idx.fulltext.queryRelationships('{validate_identifier(rel_type)}', $search_text) "
+        f"YIELD relationship AS r RETURN r"
+        for rel_type in relationship_types
+    )
+    return f"""
+    CALL {{ {branches} }}
+    RETURN r, startNode(r) AS a, endNode(r) AS b
+    LIMIT $limit
+    """
+
+
+@lru_cache(maxsize=512)
+def _node_index_search_query(index_label: str, node_labels: Tuple[str, ...]) -> str:
+    """Node search template reading index_label's fulltext index, filtered to node_labels"""
+    other_labels = [validate_identifier(label) for label in node_labels if label != index_label]
+    label_filter = "WHERE n:" + ":".join(other_labels) if other_labels else ""
+    return f"""
+    CALL db.idx.fulltext.queryNodes('{validate_identifier(index_label)}', $search_text) YIELD node AS n
+    {label_filter}
+    RETURN n
+    LIMIT $limit
+    """
+
+
+@lru_cache(maxsize=512)
+def _node_search_query(node_labels: Optional[Tuple[str, ...]]) -> str:
+    """Node search template scanning nodes with a tuple of labels"""
+    label_filter = ":" + ":".join(map(validate_identifier, node_labels)) if node_labels else ""
+    return f"""
+    MATCH (n{label_filter})
+    WHERE {_terms_match('n')}
+    RETURN n
+    LIMIT $limit
+    """
+
 
 class FalkorDBGraphitiDriver(GraphDriver):
     """
@@ -24,7 +173,10 @@ class FalkorDBGraphitiDriver(GraphDriver):
         graph_name: str = "graphiti",
         username: Optional[str] = None,
         password: Optional[str] = None,
-        ssl: bool = False
+        ssl: bool = False,
+        max_connections: Optional[int] = None,
+        fulltext_node_labels: Sequence[str] = FULLTEXT_NODE_LABELS,
+        fulltext_relationship_types: Sequence[str] = FULLTEXT_RELATIONSHIP_TYPES
     ):
         """
         Initialize FalkorDB driver for Graphiti.
@@ -36,21 +188,35 @@ class FalkorDBGraphitiDriver(GraphDriver):
             username: Optional username
             password: Optional password
             ssl: Use SSL connection
+            max_connections: Size of the connection pool queries draw from
+            fulltext_node_labels: Node labels build_fulltext_indexes indexes
+            fulltext_relationship_types: Relationship types
+                build_fulltext_indexes indexes
         """
         self.host = host
         self.port = port
         self.graph_name = graph_name
         self.provider = "falkordb"  # Required by Graphiti
+        # Validated up front since they are interpolated into index DDL
+        self.fulltext_node_labels = tuple(map(validate_identifier, fulltext_node_labels))
+        self.fulltext_relationship_types = tuple(map(validate_identifier, fulltext_relationship_types))
+        # Fulltext indexes in place, as ('NODE' | 'RELATIONSHIP', label);
+        # filled by build_fulltext_indexes
+        self._fulltext_indexes: Set[Tuple[str, str]] = set()
         
         # Connect to FalkorDB
         try:
-            self.client = falkordb.FalkorDB(
+            # The asyncio client awaits replies without blocking the event
+            # loop, so concurrent queries overlap on pooled connections
+            self.pool = create_async_connection_pool(
                 host=host,
                 port=port,
                 username=username,
                 password=password,
-                ssl=ssl
+                ssl=ssl,
+                max_connections=max_connections
             )
+            self.client = AsyncFalkorDB(connection_pool=self.pool)
             self.graph = self.client.select_graph(graph_name)
             logger.info(f"FalkorDB Graphiti driver connected to graph: {graph_name}")
         except Exception as e:
@@ -79,7 +245,7 @@ class FalkorDBGraphitiDriver(GraphDriver):
             if parameters:
                 for key, value in parameters.items():
                     # Convert values to appropriate types for FalkorDB
-                    if key in ['limit', 'skip', 'offset', 'num_results', 'top_k']:
+                    if key in INTEGER_PARAMS:
                         # Ensure integer parameters are actually integers
                         try:
                             cleaned_params[key] = int(value) if value is not None else 10
@@ -92,45 +258,33 @@ class FalkorDBGraphitiDriver(GraphDriver):
                         # Keep other types as-is
                         cleaned_params[key] = value
             
-            # FalkorDB sometimes has issues with parameterized LIMIT clauses
-            # Replace $limit, $skip, etc. in the query with actual values
-            import re
-            modified_query = query
-            keys_to_remove = []
-            
-            if cleaned_params:
-                for key in ['limit', 'skip', 'offset', 'num_results', 'top_k']:
-                    if key in cleaned_params:
-                        value = cleaned_params[key]
-                        # Replace $key or ${key} with the actual integer value (case-insensitive)
-                        modified_query = re.sub(rf'\${key}\b', str(value), modified_query, flags=re.IGNORECASE)
-                        modified_query = re.sub(rf'\$\{{{key}\}}', str(value), modified_query, flags=re.IGNORECASE)
-                        # Mark for removal
-                        keys_to_remove.append(key)
-                
+            # Replace $limit, $skip, etc. in the query with actual values; the
+            # rewrite is prepared once per query and set of integer keys
+            inlined_keys = tuple(key for key in INTEGER_PARAMS if key in cleaned_params)
+            modified_query = _prepare_query(query, inlined_keys)
+            if inlined_keys:
+                modified_query = modified_query.format_map(cleaned_params)
                 # Remove keys that were inlined into the query
-                for key in keys_to_remove:
+                for key in inlined_keys:
                     del cleaned_params[key]
             
-            # Also handle LIMIT/SKIP with direct numeric parameters that might be None or invalid
-            # Replace "LIMIT $variable" patterns
-            modified_query = re.sub(r'LIMIT\s+\$\w+', 'LIMIT 10', modified_query, flags=re.IGNORECASE)
-            modified_query = re.sub(r'SKIP\s+\$\w+', 'SKIP 0', modified_query, flags=re.IGNORECASE)
-            
             # Log the query for debugging
-            logger.info(f"Executing query (first 300 chars): {modified_query[:300]}...")
-            logger.info(f"With parameters: {cleaned_params}")
+            # %-style arguments so the messages are only built when logged
+            logger.info("Executing query (first 300 chars): %s...", modified_query[:300])
+            logger.info("With parameters: %s", cleaned_params)
             
-            result = self.graph.query(modified_query, cleaned_params)
+            result = await self.graph.query(modified_query, cleaned_params)
             
             # Convert FalkorDB result to list of dicts
             if hasattr(result, 'result_set') and hasattr(result, 'header'):
                 if result.header and result.result_set:
                     try:
-                        return [dict(zip(result.header, row)) for row in result.result_set]
+                        # Header items are [column_type, column_name] pairs
+                        column_names = [item[1] if isinstance(item, list) else item for item in result.header]
+                        return [dict(zip(column_names, row)) for row in result.result_set]
                     except Exception as e:
                         logger.warning(f"Error converting result to dict: {e}")
-                        logger.debug(f"Header: {result.header}, Result set length: {len(result.result_set) if result.result_set else 0}")
+                        logger.debug("Header: %s, Result set length: %d", result.header, len(result.result_set))
                         return []
                 return []
             
@@ -149,11 +303,10 @@ class FalkorDBGraphitiDriver(GraphDriver):
         """
         return FalkorDBSessionContext(self)
     
-    def close(self):
-        """Close the FalkorDB connection."""
+    async def close(self):
+        """Close the FalkorDB connection pool."""
         try:
-            if hasattr(self.client, 'close'):
-                self.client.close()
+            await self.client.aclose()
             logger.info("FalkorDB connection closed")
         except Exception as e:
             logger.error(f"Error closing FalkorDB connection: {e}")
@@ -162,11 +315,15 @@ class FalkorDBGraphitiDriver(GraphDriver):
         """
         Switch to a different graph/database.
         
+        The new graph's fulltext indexes are not known until
+        build_fulltext_indexes runs again, so searches scan until then.
+        
         Args:
             database: Name of the graph to switch to
         """
         self.graph_name = database
         self.graph = self.client.select_graph(database)
+        self._fulltext_indexes = set()
         return self
     
     def delete_all_indexes(self):
@@ -203,16 +360,33 @@ class FalkorDBGraphitiDriver(GraphDriver):
         Returns:
             Cypher query string
         """
-        label_filter = f":{node_label}" if node_label else ""
+        return _fulltext_query(node_label, property_name)
+    
+    async def build_fulltext_indexes(self) -> None:
+        """
+        Create the fulltext indexes the search methods read.
         
-        # FalkorDB fulltext search using CONTAINS or regex
-        query = f"""
-        MATCH (n{label_filter})
-        WHERE n.{property_name} CONTAINS $search_text
-        RETURN n
+        Call once after constructing the driver, before searching. Indexes
+        are never created from the search path; labels whose index can't be
+        created are searched by scanning, which matches the same way.
         """
+        properties = ", ".join(f"e.{name}" for name in FULLTEXT_PROPERTIES)
+        targets = [('NODE', label) for label in self.fulltext_node_labels]
+        targets += [('RELATIONSHIP', rel_type) for rel_type in self.fulltext_relationship_types]
         
-        return query
+        indexes = set()
+        for entity_type, label in targets:
+            pattern = f"(e:{label})" if entity_type == 'NODE' else f"()-[e:{label}]-()"
+            try:
+                await self.graph.query(f"CREATE FULLTEXT INDEX FOR {pattern} ON ({properties})")
+            except Exception as e:
+                if "already indexed" not in str(e):
+                    logger.warning(f"Could not create fulltext index on {label}, searches will scan: {e}")
+                    continue
+            indexes.add((entity_type, label))
+        
+        self._fulltext_indexes = indexes
+        logger.info(f"Fulltext indexes in place for {sorted(label for _, label in indexes)}")
     
     @property
     def fulltext_syntax(self) -> str:
@@ -238,7 +412,7 @@ class FalkorDBGraphitiDriver(GraphDriver):
         """
         return self
     
-    def edge_fulltext_search(
+    async def edge_fulltext_search(
         self,
         search_text: str,
         relationship_types: Optional[List[str]] = None,
@@ -247,6 +421,9 @@ class FalkorDBGraphitiDriver(GraphDriver):
         """
         Perform fulltext search on relationship properties.
         
+        Matches relationships whose content or description contains every
+        term of search_text, ignoring case and query syntax.
+        
         Args:
             search_text: Text to search for
             relationship_types: Optional list of relationship types to filter
@@ -256,28 +433,33 @@ class FalkorDBGraphitiDriver(GraphDriver):
             List of matching relationships
         """
         try:
-            # Build relationship type filter
-            rel_type_filter = ""
-            if relationship_types:
-                rel_type_filter = ":" + "|".join(relationship_types)
+            terms = _fulltext_terms(search_text)
+            if not terms:
+                return []
             
-            # Search in relationship properties
-            query = f"""
-            MATCH (a)-[r{rel_type_filter}]->(b)
-            WHERE r.content CONTAINS $search_text OR r.description CONTAINS $search_text
-            RETURN r, a, b
-            LIMIT $limit
-            """
+            # Sorted so the same types in any order share one cached template
+            rel_types = tuple(sorted(relationship_types)) if relationship_types else None
             
-            return self.execute_query(query, {
-                'search_text': search_text,
+            # Each type's fulltext index answers the search without scanning
+            # every relationship; untyped searches have no index to use
+            if rel_types and all(('RELATIONSHIP', rel_type) in self._fulltext_indexes for rel_type in rel_types):
+                try:
+                    return await self.execute_query(_edge_index_search_query(rel_types), {
+                        'search_text': " ".join(terms),
+                        'limit': limit
+                    })
+                except Exception as e:
+                    logger.warning(f"Edge fulltext index search failed, scanning instead: {e}")
+            
+            return await self.execute_query(_edge_search_query(rel_types), {
+                'terms': terms,
                 'limit': limit
             })
         except Exception as e:
             logger.warning(f"Edge fulltext search failed: {e}")
             return []
     
-    def node_fulltext_search(
+    async def node_fulltext_search(
         self,
         search_text: str,
         node_labels: Optional[List[str]] = None,
@@ -286,6 +468,9 @@ class FalkorDBGraphitiDriver(GraphDriver):
         """
         Perform fulltext search on node properties.
         
+        Matches nodes whose content or description contains every term of
+        search_text, ignoring case and query syntax.
+        
         Args:
             search_text: Text to search for
             node_labels: Optional list of node labels to filter
@@ -295,21 +480,29 @@ class FalkorDBGraphitiDriver(GraphDriver):
             List of matching nodes
         """
         try:
-            # Build label filter
-            label_filter = ""
-            if node_labels:
-                label_filter = ":" + ":".join(node_labels)
+            terms = _fulltext_terms(search_text)
+            if not terms:
+                return []
             
-            # Search in node properties
-            query = f"""
-            MATCH (n{label_filter})
-            WHERE n.content CONTAINS $search_text OR n.description CONTAINS $search_text
-            RETURN n
-            LIMIT $limit
-            """
+            labels = tuple(sorted(node_labels)) if node_labels else None
             
-            return self.execute_query(query, {
-                'search_text': search_text,
+            # An indexed label's fulltext index answers the search; other
+            # searches scan the matching nodes
+            index_label = next(
+                (label for label in labels or () if ('NODE', label) in self._fulltext_indexes),
+                None
+            )
+            if index_label:
+                try:
+                    return await self.execute_query(_node_index_search_query(index_label, labels), {
+                        'search_text': " ".join(terms),
+                        'limit': limit
+                    })
+                except Exception as e:
+                    logger.warning(f"Node fulltext index search failed, scanning instead: {e}")
+            
+            return await self.execute_query(_node_search_query(labels), {
+                'terms': terms,
                 'limit': limit
             })
         except Exception as e:
@@ -332,14 +525,17 @@ class FalkorDBSessionContext:
     def __exit__(self, exc_type, exc_val, exc_tb):
         pass
     
-    async def run(self, query: str, parameters: Optional[Dict[str, Any]] = None):
-        """Execute a query in the session context."""
-        return await self.driver.execute_query(query, parameters)
+    # These return the underlying coroutine for the caller to await rather
+    # than wrapping it in another coroutine frame
+    
+    def run(self, query: str, parameters: Optional[Dict[str, Any]] = None):
+        """Execute a query in the session context; returns an awaitable."""
+        return self.driver.execute_query(query, parameters)
     
-    async def execute_read(self, transaction_function, *args, **kwargs):
-        """Execute a read transaction."""
-        return await transaction_function(self, *args, **kwargs)
+    def execute_read(self, transaction_function, *args, **kwargs):
+        """Execute a read transaction; returns an awaitable."""
+        return transaction_function(self, *args, **kwargs)
     
-    async def execute_write(self, transaction_function, *args, **kwargs):
-        """Execute a write transaction."""
-        return await transaction_function(self, *args, **kwargs)
+    def execute_write(self, transaction_function, *args, **kwargs):
+        """Execute a write transaction; returns an awaitable."""
+        return transaction_function(self, *args, **kwargs)
@@ -3,14 +3,161 @@ Graphiti Engine for GraphRAG capabilities
 Integrates Graphiti for semantic search and LLM-powered knowledge retrieval
 """
 
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from datetime import datetime
+from operator import attrgetter
+from typing import Callable, Dict, List, Any, Optional, Tuple
+import asyncio
 import logging
+import time
+import traceback
 from graphiti_core import Graphiti
 from graphiti_core.nodes import EpisodeType
 from graphiti_core.driver.falkordb_driver import FalkorDriver
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of add_episode calls in flight while indexing
+INDEX_CONCURRENCY = 16
+
+# add_entity_episode calls are collected into batches of up to this many
+# episodes, waiting at most this long for a batch to fill
+EPISODE_BATCH_SIZE = 16
+EPISODE_BATCH_TIMEOUT_SECONDS = 0.05
+
+# Single-text embedding requests made within this window are sent as one
+# create_batch request of up to EMBEDDING_BATCH_SIZE texts
+EMBEDDING_BATCH_SIZE = 64
+EMBEDDING_BATCH_TIMEOUT_SECONDS = 0.01
+
+# Number of semantic search results remembered and for how long
+SEARCH_CACHE_SIZE = 1024
+SEARCH_CACHE_TTL_SECONDS = 60
+
+# Attributes read from Graphiti search results, in order of preference
+RESULT_ID_ATTRIBUTES = ('uuid', 'id', 'entity_id')
+RESULT_CONTENT_ATTRIBUTES = ('content', 'fact', 'summary')
+RESULT_SCORE_ATTRIBUTES = ('score', 'distance')
+
+
+def _build_result_formatter(sample: Any) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Build a function that formats search results shaped like sample.
+    
+    Which attributes exist is decided once from sample, so formatting each
+    result is a fixed sequence of attrgetter calls.
+    
+    Args:
+        sample: A search result of the class the formatter will handle
+    
+    Returns:
+        Function mapping a search result to a result dict
+    """
+    def first_getter(names):
+        for name in names:
+            if hasattr(sample, name):
+                return attrgetter(name)
+        return None
+    
+    get_id = first_getter(RESULT_ID_ATTRIBUTES)
+    content_getters = tuple(attrgetter(name) for name in RESULT_CONTENT_ATTRIBUTES if hasattr(sample, name))
+    get_name = first_getter(('name',))
+    get_score = first_getter(RESULT_SCORE_ATTRIBUTES)
+    get_metadata = first_getter(('metadata',))
+    
+    def format_result(r: Any) -> Dict[str, Any]:
+        entity_id = get_id(r) if get_id else 'unknown'
+        
+        # First non-empty content field, falling back to the name
+        content = None
+        for get_content in content_getters:
+            content = get_content(r)
+            if content:
+                break
+        if not content:
+            content = get_name(r) if get_name else 'No content'
+        
+        score = get_score(r) if get_score else 0.0
+        
+        # Metadata should contain source information
+        metadata = get_metadata(r) if get_metadata else {}
+        if not isinstance(metadata, dict):
+            metadata = {}
+        source_name = metadata.get('source', metadata.get('source_description', 'Knowledge Graph'))
+        
+        return {
+            'entity_id': str(entity_id),
+            'content': str(content) if content else '',
+            'score': float(score) if score else 0.0,
+            'metadata': {
+                'source': source_name,
+                **metadata
+            }
+        }
+    
+    return format_result
+
+
+class _EmbeddingCoalescer:
+    """
+    Coalesce an embedder's single-text create calls into create_batch calls.
+    
+    Installed over the embedder's create method, so every Graphiti code path
+    using that embedder shares the batches.
+    """
+    
+    def __init__(self, embedder: Any, batch_size: int, timeout: float):
+        self.embedder = embedder
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self._create = embedder.create
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Batch requests in flight, referenced until they finish
+        self._tasks: set = set()
+    
+    def install(self) -> None:
+        """Route the embedder's create calls through this coalescer."""
+        self.embedder.create = self.create
+    
+    async def create(self, input_data: Any) -> List[float]:
+        """Embed input_data, batching plain strings with concurrent calls."""
+        if not isinstance(input_data, str):
+            return await self._create(input_data)
+        
+        loop = asyncio.get_running_loop()
+        embedded = loop.create_future()
+        self._pending.append((input_data, embedded))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.timeout, self._flush)
+        return await embedded
+    
+    def _flush(self) -> None:
+        """Send the pending texts as one create_batch request."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if pending:
+            task = asyncio.ensure_future(self._embed(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _embed(self, pending: List[Tuple[str, asyncio.Future]]) -> None:
+        """Embed the pending texts and resolve their futures."""
+        try:
+            embeddings = await self.embedder.create_batch([text for text, _ in pending])
+        except Exception as e:
+            for _, embedded in pending:
+                if not embedded.done():
+                    embedded.set_exception(e)
+            return
+        for (_, embedded), embedding in zip(pending, embeddings):
+            if not embedded.done():
+                embedded.set_result(embedding)
+
 
 class GraphitiEngine:
     """Engine for GraphRAG using Graphiti."""
@@ -43,14 +190,45 @@ class GraphitiEngine:
                 graph_driver=falkordb_driver
             )
             
+            # Concurrent episodes share embedding requests
+            embedder = getattr(self.client, 'embedder', None)
+            if hasattr(embedder, 'create_batch'):
+                _EmbeddingCoalescer(
+                    embedder,
+                    config.get('embedding_batch_size', EMBEDDING_BATCH_SIZE),
+                    config.get('embedding_batch_timeout_seconds', EMBEDDING_BATCH_TIMEOUT_SECONDS)
+                ).install()
+            
             logger.info(f"Graphiti client initialized with FalkorDB at {falkordb_config.get('host', 'localhost')}:{falkordb_config.get('port', 6379)}")
         except Exception as e:
             logger.warning(f"Could not initialize Graphiti client: {e}. GraphRAG features will be limited.")
             logger.info("To enable Graphiti, ensure FalkorDB is running and OPENAI_API_KEY is set.")
             self.client = None
         
+        # Recent search results keyed by (generation, query, top_k, filters).
+        # Writes bump the generation so results from before them are never
+        # served, and concurrent identical searches share one in-flight task
+        self._search_cache: OrderedDict[Tuple, Tuple[float, List[Dict[str, Any]]]] = OrderedDict()
+        self._search_cache_size = config.get('search_cache_size', SEARCH_CACHE_SIZE)
+        self._search_cache_ttl = config.get('search_cache_ttl_seconds', SEARCH_CACHE_TTL_SECONDS)
+        self._search_generation = 0
+        self._search_inflight: Dict[Tuple, asyncio.Future] = {}
+        # Search result formatters, built once per result class
+        self._result_formatters: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+        # Fire-and-forget episode writes, referenced until they finish
+        self._background_tasks: set = set()
+        # Pending add_entity_episode calls and the task writing them in
+        # batches, started on first use in the running event loop
+        self._episode_queue: Optional[asyncio.Queue] = None
+        self._episode_flusher: Optional[asyncio.Task] = None
+        
         logger.info("Graphiti engine initialized")
     
+    def clear_cache(self) -> None:
+        """Drop cached search results, e.g. after the graph has changed."""
+        self._search_generation += 1
+        self._search_cache.clear()
+    
     async def index_entities(self, entity_ids: List[str]) -> None:
         """Index entities for semantic search."""
         # In production, fetch entity details from FalkorDB and add to Graphiti
@@ -60,19 +238,29 @@ class GraphitiEngine:
             logger.warning("Graphiti client not initialized, skipping indexing")
             return
         
+        self.clear_cache()
+        
         # Example: Add episodes to Graphiti
-        from datetime import datetime
-        for entity_id in entity_ids:
-            try:
-                await self.client.add_episode(
-                    name=f"entity_{entity_id}",
-                    episode_body=f"Entity {entity_id}",  # Fetch actual content
-                    source=EpisodeType.text,
-                    source_description="FalkorDB",
-                    reference_time=datetime.now()
-                )
-            except Exception as e:
-                logger.error(f"Failed to index entity {entity_id}: {e}")
+        reference_time = datetime.now()
+        
+        # Episodes are independent, so their embedding and database round
+        # trips overlap; the semaphore caps how many run at once
+        semaphore = asyncio.Semaphore(self.config.get('index_concurrency', INDEX_CONCURRENCY))
+        
+        async def index_one(entity_id: str) -> None:
+            async with semaphore:
+                try:
+                    await self.client.add_episode(
+                        name=f"entity_{entity_id}",
+                        episode_body=f"Entity {entity_id}",  # Fetch actual content
+                        source=EpisodeType.text,
+                        source_description="FalkorDB",
+                        reference_time=reference_time
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to index entity {entity_id}: {e}")
+        
+        await asyncio.gather(*(index_one(entity_id) for entity_id in entity_ids))
     
     async def add_entity_episode(
         self,
@@ -80,45 +268,136 @@ class GraphitiEngine:
         content: str,
         metadata: Optional[Dict[str, Any]] = None
     ) -> None:
-        """Add an entity as a Graphiti episode with embeddings."""
+        """
+        Add an entity as a Graphiti episode with embeddings.
+        
+        Calls made close together are written as one batch: each episode is
+        added with its own add_episode call, run concurrently so their
+        embedding requests are coalesced. This returns once the episode has
+        been written.
+        """
         if not self.client:
             logger.warning("Graphiti client not initialized, skipping episode creation")
             return
         
-        try:
-            # Create episode with the entity content
-            # Graphiti will automatically generate embeddings using OpenAI
-            await self.client.add_episode(
-                name=f"entity_{entity_id}",
-                episode_body=content,
-                source=EpisodeType.text,
-                source_description=metadata.get('source', 'FalkorDB') if metadata else 'FalkorDB',
-                reference_time=None  # Can add timestamp if needed
-            )
-            logger.info(f"Added entity {entity_id} to Graphiti with content: {content[:100]}...")
-        except Exception as e:
-            logger.error(f"Failed to add entity episode {entity_id}: {e}")
+        self.clear_cache()
+        
+        # Create episode with the entity content
+        # Graphiti will automatically generate embeddings using OpenAI
+        episode = {
+            'name': f"entity_{entity_id}",
+            'episode_body': content,
+            'source': EpisodeType.text,
+            'source_description': metadata.get('source', 'FalkorDB') if metadata else 'FalkorDB',
+            'reference_time': datetime.now()
+        }
+        
+        loop = asyncio.get_running_loop()
+        if self._episode_flusher is None or self._episode_flusher.done() or self._episode_flusher.get_loop() is not loop:
+            self._episode_queue = asyncio.Queue()
+            self._episode_flusher = asyncio.create_task(self._flush_episodes(self._episode_queue))
+        
+        written = loop.create_future()
+        await self._episode_queue.put((episode, written))
+        if await written:
+            logger.info("Added entity %s to Graphiti with content: %s...", entity_id, content[:100])
+    
+    async def _flush_episodes(self, queue: asyncio.Queue) -> None:
+        """Write queued episodes in batches until cancelled by close()."""
+        batch_size = self.config.get('episode_batch_size', EPISODE_BATCH_SIZE)
+        timeout = self.config.get('episode_batch_timeout_seconds', EPISODE_BATCH_TIMEOUT_SECONDS)
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await queue.get()]
+            try:
+                deadline = loop.time() + timeout
+                while len(batch) < batch_size:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                
+                # add_episode rather than add_episode_bulk, which skips edge
+                # invalidation and fails the whole batch when one episode fails
+                results = await asyncio.gather(
+                    *(self.client.add_episode(**episode) for episode, _ in batch),
+                    return_exceptions=True
+                )
+                
+                # Searches that ran during the write may have cached old results
+                self.clear_cache()
+                for (episode, written), result in zip(batch, results):
+                    if isinstance(result, Exception):
+                        logger.error(f"Failed to add entity episode {episode['name']}: {result}")
+                    if not written.done():
+                        written.set_result(not isinstance(result, Exception))
+            finally:
+                # Callers of a batch cut short, e.g. by close(), are failed
+                # instead of waiting forever
+                for episode, written in batch:
+                    if not written.done():
+                        written.set_exception(RuntimeError(f"Episode {episode['name']} was not written"))
+    
+    async def close(self) -> None:
+        """
+        Stop the episode writer.
+        
+        Episodes still queued or being written are not written; their
+        add_entity_episode calls raise instead of waiting forever. Must be
+        awaited in the event loop the episodes were added in.
+        """
+        flusher, queue = self._episode_flusher, self._episode_queue
+        self._episode_flusher = None
+        self._episode_queue = None
+        if flusher is None:
+            return
+        
+        flusher.cancel()
+        await asyncio.gather(flusher, return_exceptions=True)
+        
+        while not queue.empty():
+            episode, written = queue.get_nowait()
+            if not written.done():
+                written.set_exception(RuntimeError(f"Episode {episode['name']} was not written"))
     
     async def extract_entities_from_text(
         self,
-        text: str
+        text: str,
+        index: bool = False
     ) -> List[Dict[str, Any]]:
-        """Extract entities from text using Graphiti's entity extraction."""
+        """
+        Extract entities from text using Graphiti's entity extraction.
+        
+        Args:
+            text: Text to extract entities from
+            index: Also store the text as a Graphiti episode. The write runs
+                in the background; the search does not wait for it
+        
+        Returns:
+            Entities related to the text
+        """
         if not self.client:
             logger.warning("Graphiti client not initialized, returning empty entities")
             return []
         
         try:
-            # Use Graphiti to extract entities from text
-            # This uses LLM to identify entities, relationships, and facts
-            from datetime import datetime
-            await self.client.add_episode(
-                name="query_context",
-                episode_body=text,
-                source=EpisodeType.text,
-                source_description="user_query",
-                reference_time=datetime.now()
-            )
+            if index:
+                # Use Graphiti to extract entities from text
+                # This uses LLM to identify entities, relationships, and facts
+                self.clear_cache()
+                task = asyncio.create_task(self.client.add_episode(
+                    name="query_context",
+                    episode_body=text,
+                    source=EpisodeType.text,
+                    source_description="user_query",
+                    reference_time=datetime.now()
+                ))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._episode_task_done)
             
             # Search for related entities
             results = await self.client.search(
@@ -141,70 +420,82 @@ class GraphitiEngine:
             logger.error(f"Entity extraction failed: {e}")
             return []
     
+    def _episode_task_done(self, task: asyncio.Task) -> None:
+        """Release a background episode write and log its failure, if any."""
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Failed to add query episode: {task.exception()}")
+    
     async def semantic_search(
         self,
         query: str,
         top_k: int = 10,
         filters: Optional[Dict[str, Any]] = None
     ) -> List[Dict[str, Any]]:
-        """Perform semantic search over the knowledge graph."""
+        """
+        Perform semantic search over the knowledge graph.
+        
+        Results are cached for search_cache_ttl_seconds; identical searches
+        issued while one is running wait for it instead of searching again.
+        """
         if not self.client:
             logger.warning("Graphiti client not initialized")
             return []
         
+        # Queries differing only in whitespace share a cache entry and an
+        # in-flight search
+        key = (
+            self._search_generation,
+            " ".join(query.split()),
+            top_k,
+            tuple(sorted((k, repr(v)) for k, v in filters.items())) if filters else ()
+        )
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            stored_at, results = cached
+            if time.monotonic() - stored_at < self._search_cache_ttl:
+                self._search_cache.move_to_end(key)
+                return list(results)
+            del self._search_cache[key]
+        
+        task = self._search_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._search(query, top_k))
+            self._search_inflight[key] = task
+            task.add_done_callback(lambda _: self._search_inflight.pop(key, None))
+        
         try:
-            # Search using Graphiti
-            results = await self.client.search(
-                query=query,
-                num_results=top_k
-            )
-            
-            logger.info(f"Graphiti search returned {len(results)} results for query: {query[:50]}...")
-            
-            formatted_results = []
-            for r in results:
-                # Handle different possible attribute names from Graphiti
-                entity_id = getattr(r, 'uuid', getattr(r, 'id', getattr(r, 'entity_id', 'unknown')))
-                
-                # Try multiple content fields
-                content = getattr(r, 'content', None)
-                if not content:
-                    content = getattr(r, 'fact', None)
-                if not content:
-                    content = getattr(r, 'summary', None)
-                if not content:
-                    content = getattr(r, 'name', 'No content')
-                
-                # Get score
-                score = getattr(r, 'score', getattr(r, 'distance', 0.0))
-                
-                # Get metadata - this should contain source information
-                metadata = getattr(r, 'metadata', {})
-                if not isinstance(metadata, dict):
-                    metadata = {}
-                
-                # Extract source from metadata or node properties
-                source_name = metadata.get('source', metadata.get('source_description', 'Knowledge Graph'))
-                
-                formatted_result = {
-                    'entity_id': str(entity_id),
-                    'content': str(content) if content else '',
-                    'score': float(score) if score else 0.0,
-                    'metadata': {
-                        'source': source_name,
-                        **metadata
-                    }
-                }
-                
-                formatted_results.append(formatted_result)
-                logger.debug(f"Formatted result: id={entity_id}, source={source_name}, score={score}, content_len={len(str(content))}")
-            
-            return formatted_results
+            # Shielded so one cancelled caller doesn't cancel the others
+            results = await asyncio.shield(task)
         except Exception as e:
             logger.error(f"Semantic search failed: {e}")
-            import traceback
             logger.error(f"Traceback: {traceback.format_exc()}")
             return []
+        
+        self._search_cache[key] = (time.monotonic(), results)
+        if len(self._search_cache) > self._search_cache_size:
+            self._search_cache.popitem(last=False)
+        return list(results)
+    
+    async def _search(self, query: str, top_k: int) -> List[Dict[str, Any]]:
+        """Run a Graphiti search and format its results."""
+        # Search using Graphiti
+        results = await self.client.search(
+            query=query,
+            num_results=top_k
+        )
+        
+        logger.info("Graphiti search returned %d results for query: %s...", len(results), query[:50])
+        
+        return [self._result_formatter(r)(r) for r in results]
+    
+    def _result_formatter(self, r: Any) -> Callable[[Any], Dict[str, Any]]:
+        """Formatter for search results of r's class, built on first use."""
+        format_result = self._result_formatters.get(type(r))
+        if format_result is None:
+            format_result = _build_result_formatter(r)
+            self._result_formatters[type(r)] = format_result
+        return format_result
     
     async def build_context(
         self,
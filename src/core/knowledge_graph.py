@@ -3,15 +3,28 @@ Tijara Knowledge Graph - Main Interface
 Integrates FalkorDB for graph storage and Graphiti for GraphRAG capabilities
 """
 
-from typing import Dict, List, Optional, Any, Union
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
 from datetime import datetime, timezone
+import asyncio
+import json
 import logging
+import time
+
+import numpy as np
+import pandas as pd
 
 from .falkordb_client import FalkorDBClient
 from .graphiti_engine import GraphitiEngine
 from ..ontology.schema import OntologySchema
 from ..analytics.graph_algorithms import GraphAnalytics
 from ..analytics.spatial_ops import SpatialOperations
+from ..analytics.dimensional_extract import DimensionalExtractor
+from ..analytics.impact_scoring import (
+    IMPACT_COLUMNS, IMPACTS_PER_GEOGRAPHY, geography_impacts_query, impact_dict, scored_impacts
+)
 from ..rag.query_engine import QueryEngine
 from ..repositories import (
     CommodityRepository,
@@ -22,6 +35,144 @@ from ..repositories import (
 
 logger = logging.getLogger(__name__)
 
+# Node label of each kind of concept node
+CONCEPT_LABELS = {
+    'commodity': 'Commodity',
+    'geography': 'Geography',
+    'indicator': 'Indicator',
+    'source': 'Source',
+}
+
+# Relationship from ingested entities to each kind of concept node
+CONCEPT_RELATIONSHIP_TYPES = (
+    ('commodity', 'HAS_COMMODITY'),
+    ('geography', 'HAS_GEOGRAPHY'),
+    ('indicator', 'HAS_INDICATOR'),
+    ('source', 'HAS_SOURCE'),
+)
+
+# Entity fields returned by search_entities for each searchable type
+SEARCH_RESULT_FIELDS = {
+    'Commodity': ('name', 'level', 'category'),
+    'Geography': ('name', 'level', 'gid_code'),
+    'BalanceSheet': ('balance_sheet_id', 'product_name', 'season'),
+    'ProductionArea': ('name',),
+}
+
+# Case-insensitive match and result order of each searchable type, as in
+# the repositories' search_case_insensitive queries
+SEARCH_CONDITIONS = {
+    'Commodity': ("toLower(n.name) CONTAINS toLower($search_term)", "n.level, n.name"),
+    'Geography': (
+        "toLower(n.name) CONTAINS toLower($search_term) OR toLower(n.gid_code) = toLower($search_term)",
+        "n.level, n.name"
+    ),
+    'BalanceSheet': ("toLower(n.balance_sheet_id) CONTAINS toLower($search_term)", "n.balance_sheet_id"),
+    'ProductionArea': ("toLower(n.name) CONTAINS toLower($search_term)", "n.name"),
+}
+
+# Gets or creates the concept nodes of one label, given as $concepts maps
+# of name and properties for new nodes
+CONCEPT_UNWIND_QUERY = """
+UNWIND $concepts AS c
+MERGE (n:{label} {{name: c.name}})
+ON CREATE SET n += c.props
+RETURN c.name as name, id(n) as id
+"""
+
+# Number of concept node ids remembered between ingest calls
+CONCEPT_CACHE_SIZE = 4096
+
+# Month names indexed by month number, for entity descriptions
+MONTH_NAMES = ('', 'January', 'February', 'March', 'April', 'May', 'June',
+               'July', 'August', 'September', 'October', 'November', 'December')
+
+# Seconds explore_schema reuses the relationship types found in the graph
+SCHEMA_CACHE_TTL_SECONDS = 60
+
+RELATIONSHIP_TYPES_QUERY = "MATCH ()-[r]->() RETURN DISTINCT type(r) as rel_type"
+
+# Nodes deleted per query by clear_all_data. Deleting in chunks lets the
+# server run other queries in between instead of one long lock-up
+CLEAR_BATCH_SIZE = 10000
+
+CLEAR_BATCH_QUERY = f"MATCH (n) WITH n LIMIT {CLEAR_BATCH_SIZE} DETACH DELETE n RETURN count(n) AS deleted"
+
+# Maximum number of Graphiti add_episode calls in flight during ingestion
+GRAPHITI_CONCURRENCY = 8
+
+
+def _metadata_concepts(metadata: Dict[str, Any]) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+    """Concept name and the properties a new concept node is created with, by kind of concept."""
+    concepts = {}
+    if metadata.get('commodity'):
+        concepts['commodity'] = (metadata['commodity'], {'type': 'commodity'})
+    
+    # Geography concept (country or region)
+    geo_name = metadata.get('region') or metadata.get('country')
+    if geo_name:
+        concepts['geography'] = (geo_name, {'type': 'geography', 'country': metadata.get('country')})
+    
+    if metadata.get('type'):
+        concepts['indicator'] = (metadata['type'], {'type': 'indicator'})
+    if metadata.get('source'):
+        concepts['source'] = (metadata['source'], {'type': 'source'})
+    return concepts
+
+
+def _entity_metadata_properties(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Properties an ingested entity node takes from its metadata."""
+    return {
+        'commodity': metadata.get('commodity'),
+        'country': metadata.get('country'),
+        'region': metadata.get('region'),
+        'indicator_type': metadata.get('type'),
+        'unit': metadata.get('unit'),
+        'data_source': metadata.get('source'),
+    }
+
+
+def _deleted_count(result: Any) -> int:
+    """Read the count from a CLEAR_BATCH_QUERY result, as rows or a (rows, header, summary) tuple."""
+    rows = result[0] if isinstance(result, tuple) else result
+    return rows[0]['deleted'] if rows else 0
+
+
+@lru_cache(maxsize=None)
+def _concept_merge_query(concepts: Tuple[str, ...]) -> str:
+    """
+    Query getting or creating the given kinds of concept nodes.
+    
+    Each concept kind takes $<concept>_name and $<concept>_props parameters
+    and its node id is returned in a column named after it. There are at
+    most 15 combinations of concept kinds, so every query is rendered once.
+    """
+    clauses = []
+    columns = []
+    for concept in concepts:
+        var = f"c_{concept}"
+        clauses.append(
+            f"MERGE ({var}:{CONCEPT_LABELS[concept]} {{name: ${concept}_name}}) "
+            f"ON CREATE SET {var} += ${concept}_props"
+        )
+        columns.append(f"id({var}) as {concept}")
+    return "\n".join(clauses) + "\nRETURN " + ", ".join(columns) + " LIMIT 1"
+
+
+@lru_cache(maxsize=None)
+def _entity_search_query(entity_types: Tuple[str, ...]) -> str:
+    """Query searching the given entity types at once, limit rows per type."""
+    branches = []
+    for entity_type in entity_types:
+        condition, order = SEARCH_CONDITIONS[entity_type]
+        projection = ", ".join(f".{field}" for field in SEARCH_RESULT_FIELDS[entity_type])
+        branches.append(
+            f"MATCH (n:{entity_type}) WHERE {condition} "
+            f"RETURN '{entity_type}' as type, n {{{projection}}} as fields "
+            f"ORDER BY {order} LIMIT $limit"
+        )
+    return "CALL {\n" + "\nUNION ALL\n".join(branches) + "\n}\nRETURN type, fields"
+
 
 class TijaraKnowledgeGraph:
     """
@@ -52,6 +203,7 @@ class TijaraKnowledgeGraph:
         # Initialize analytics modules
         self.analytics = GraphAnalytics(self.falkordb)
         self.spatial = SpatialOperations(self.falkordb, config.get('spatial', {}))
+        self.extractor = DimensionalExtractor(self.falkordb)
         
         # Initialize RAG engine
         self.query_engine = QueryEngine(
@@ -71,8 +223,29 @@ class TijaraKnowledgeGraph:
         self.balance_sheet_repo = BalanceSheetRepository(self.falkordb.graph, BalanceSheet)
         self.production_area_repo = ProductionAreaRepository(self.falkordb.graph, ProductionArea)
         
+        # Concept node ids by (label, name). Ingestion never deletes concept
+        # nodes, so ids stay valid until clear_cache() or clear_all_data()
+        self._concept_cache: OrderedDict[Tuple[str, str], str] = OrderedDict()
+        self._concept_cache_size = config.get('concept_cache_size', CONCEPT_CACHE_SIZE)
+        
+        # (monotonic time, relationship types) of the last schema scan
+        self._schema_cache: Optional[Tuple[float, List[str]]] = None
+        self._schema_cache_ttl = config.get('schema_cache_ttl', SCHEMA_CACHE_TTL_SECONDS)
+        
         logger.info("Tijara Knowledge Graph initialized successfully")
     
+    def clear_cache(self):
+        """
+        Forget cached concept node ids, schema, geometries and extractions.
+        
+        Call after deleting nodes: FalkorDB reuses deleted node ids, so
+        id-keyed caches would otherwise describe old nodes.
+        """
+        self._concept_cache.clear()
+        self._schema_cache = None
+        self.spatial.clear_cache()
+        self.extractor.clear_cache()
+    
     # ========== Natural Language Query Interface ==========
     
     async def query_natural_language(
@@ -119,7 +292,8 @@ class TijaraKnowledgeGraph:
         self,
         data: Union[Dict, List[Dict]],
         metadata: Dict[str, Any],
-        validate: bool = True
+        validate: bool = True,
+        records_metadata: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
         Ingest data with automatic ontology placement.
@@ -134,95 +308,119 @@ class TijaraKnowledgeGraph:
             data: Data to ingest (single record or list)
             metadata: Metadata including source, geography, indicator type
             validate: Whether to validate against ontology
+            records_metadata: Per-record metadata overriding metadata, one
+                dict per record. Entity placement still follows metadata
             
         Returns:
-            Ingestion result with entity IDs and relationships created
+            Ingestion result with entity IDs and relationships created.
+            With records_metadata, concept_ids lists each record's concept IDs
         """
         logger.info(f"Ingesting data with metadata: {metadata}")
         
+        data_list = data if isinstance(data, list) else [data]
+        if records_metadata is not None and len(records_metadata) != len(data_list):
+            raise ValueError(f"Expected {len(data_list)} records_metadata entries, got {len(records_metadata)}")
+        
+        # Metadata of each record
+        if records_metadata is None:
+            metadata_list = [metadata] * len(data_list)
+        else:
+            metadata_list = [{**metadata, **record_metadata} for record_metadata in records_metadata]
+        
         # Validate against ontology if requested
         if validate:
-            validation_result = self.ontology.validate_data(data, metadata)
-            if not validation_result['valid']:
-                raise ValueError(f"Data validation failed: {validation_result['errors']}")
+            errors = self.ontology.validate_data(data, metadata)['errors']
+            if records_metadata is not None:
+                # Each distinct record metadata is checked once. Keyed on its
+                # JSON form since values may be lists or dicts
+                distinct_metadata = {json.dumps(m, sort_keys=True, default=str): m for m in metadata_list}
+                for record_metadata in distinct_metadata.values():
+                    errors.extend(self.ontology.validate_data({}, record_metadata)['errors'])
+            if errors:
+                raise ValueError(f"Data validation failed: {errors}")
         
         # Determine ontology placement
         placement = self.ontology.determine_placement(metadata)
         
         # Create or get concept nodes (Commodity, Geography, Indicator, Source)
-        concept_ids = self._get_or_create_concepts(metadata)
+        # FalkorDB calls run in a worker thread so ingestion doesn't block
+        # the event loop
+        if records_metadata is None:
+            concept_ids = await asyncio.to_thread(self._get_or_create_concepts, metadata)
+            record_concept_ids = [concept_ids] * len(data_list)
+        else:
+            record_concept_ids = await asyncio.to_thread(self._get_or_create_concepts_bulk, metadata_list)
+            concept_ids = record_concept_ids
+        
+        # Entity nodes with embedded metadata properties. Properties common
+        # to the whole batch, including its one ingestion timestamp, are
+        # sent once per query rather than copied into every row
+        shared_properties = {
+            'ingestion_timestamp': datetime.now(timezone.utc).isoformat(),
+            'is_active': True
+        }
+        if records_metadata is None:
+            shared_properties.update(_entity_metadata_properties(metadata))
+            entity_rows = data_list
+        else:
+            entity_rows = [
+                {**record, **_entity_metadata_properties(record_metadata)}
+                for record, record_metadata in zip(data_list, metadata_list)
+            ]
+        
+        # One UNWIND query per batch of entities and per relationship type,
+        # rather than a round trip per entity and relationship
+        entities_created = await asyncio.to_thread(
+            self.falkordb.create_entities_bulk,
+            entity_type=placement['entity_type'],
+            rows=entity_rows,
+            shared_properties=shared_properties
+        )
         
-        # Create entities in FalkorDB
-        entities_created = []
+        # Create relationships to concept nodes
         relationships_created = []
-        
-        data_list = data if isinstance(data, list) else [data]
-        
-        for record in data_list:
-            # Create entity node with embedded metadata properties
-            entity_props = {
-                **record,
-                'commodity': metadata.get('commodity'),
-                'country': metadata.get('country'),
-                'region': metadata.get('region'),
-                'indicator_type': metadata.get('type'),
-                'unit': metadata.get('unit'),
-                'data_source': metadata.get('source'),
-                'ingestion_timestamp': datetime.utcnow().isoformat(),
-                'is_active': True
+        relationships = [
+            {
+                'source_id': entity_id,
+                'target_id': entity_concept_ids[concept],
+                'relationship_type': relationship_type
             }
+            for entity_id, entity_concept_ids in zip(entities_created, record_concept_ids)
+            for concept, relationship_type in CONCEPT_RELATIONSHIP_TYPES
+            if concept in entity_concept_ids
+        ]
+        try:
+            rel_ids = await asyncio.to_thread(self.falkordb.create_relationships_bulk, relationships)
+            relationships_created = [rel_id for rel_id in rel_ids if rel_id is not None]
             
-            entity_id = self.falkordb.create_entity(
-                entity_type=placement['entity_type'],
-                properties=entity_props
-            )
-            entities_created.append(entity_id)
-            
-            # Create relationships to concept nodes
-            try:
-                if 'commodity' in concept_ids:
-                    rel_id = self.falkordb.create_relationship(
-                        source_id=entity_id,
-                        target_id=concept_ids['commodity'],
-                        relationship_type='HAS_COMMODITY'
-                    )
-                    relationships_created.append(rel_id)
-                
-                if 'geography' in concept_ids:
-                    rel_id = self.falkordb.create_relationship(
-                        source_id=entity_id,
-                        target_id=concept_ids['geography'],
-                        relationship_type='HAS_GEOGRAPHY'
-                    )
-                    relationships_created.append(rel_id)
-                
-                if 'indicator' in concept_ids:
-                    rel_id = self.falkordb.create_relationship(
-                        source_id=entity_id,
-                        target_id=concept_ids['indicator'],
-                        relationship_type='HAS_INDICATOR'
-                    )
-                    relationships_created.append(rel_id)
-                
-                if 'source' in concept_ids:
-                    rel_id = self.falkordb.create_relationship(
-                        source_id=entity_id,
-                        target_id=concept_ids['source'],
-                        relationship_type='HAS_SOURCE'
-                    )
-                    relationships_created.append(rel_id)
-            except Exception as e:
-                logger.warning(f"Failed to create some relationships: {e}")
+            # A relationship type new to the graph makes the cached schema stale
+            if self._schema_cache and relationships_created and not (
+                {rel['relationship_type'] for rel in relationships} <= set(self._schema_cache[1])
+            ):
+                self._schema_cache = None
+        except Exception as e:
+            logger.warning(f"Failed to create some relationships: {e}")
+        
+        # New nodes and relationships change every node's pagerank and
+        # betweenness, so materialized scores are recomputed on next use;
+        # cached neighbours and geometries are dropped for the same reason
+        if entities_created:
+            self.analytics.invalidate_materialized_scores()
+            self.spatial.clear_cache()
+        
+        # Add to Graphiti as episodes with embeddings
+        # This creates semantic search capability for structured data
+        if self.graphiti and self.graphiti.is_ready():
+            from graphiti_core.nodes import EpisodeType
             
-            # Create text description for Graphiti episode
-            text_description = self._create_entity_description(entity_props, metadata)
+            # Episodes are independent, so their embedding and LLM calls
+            # overlap; the semaphore caps how many run at once
+            semaphore = asyncio.Semaphore(self.config.get('graphiti_concurrency', GRAPHITI_CONCURRENCY))
             
-            # Add to Graphiti as an episode with embeddings
-            # This creates semantic search capability for structured data
-            if self.graphiti and self.graphiti.is_ready():
-                try:
-                    from graphiti_core.nodes import EpisodeType
-                    
+            async def add_episode(entity_id: str, entity_props: Dict[str, Any], metadata: Dict[str, Any]) -> None:
+                # Create text description for Graphiti episode
+                text_description = self._create_entity_description(entity_props, metadata)
+                async with semaphore:
                     await self.graphiti.client.add_episode(
                         name=f"entity_{placement['entity_type']}_{entity_id}",
                         episode_body=text_description,
@@ -230,9 +428,19 @@ class TijaraKnowledgeGraph:
                         source_description=f"{metadata.get('source', 'structured_data')}",
                         reference_time=datetime.now(timezone.utc)
                     )
+            
+            results = await asyncio.gather(
+                *(
+                    add_episode(entity_id, entity_props, record_metadata)
+                    for entity_id, entity_props, record_metadata in zip(entities_created, entity_rows, metadata_list)
+                ),
+                return_exceptions=True
+            )
+            for entity_id, result in zip(entities_created, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Graphiti episode creation failed for entity {entity_id}: {result}")
+                else:
                     logger.info(f"Added entity {entity_id} to Graphiti with embeddings")
-                except Exception as e:
-                    logger.warning(f"Graphiti episode creation failed for entity {entity_id}: {e}")
         
         return {
             'entities_created': len(entities_created),
@@ -244,7 +452,7 @@ class TijaraKnowledgeGraph:
     
     # ========== Graph Analytics Interface ==========
     
-    def analyze_graph(
+    async def analyze_graph(
         self,
         algorithm: str,
         filters: Optional[Dict[str, Any]] = None,
@@ -254,7 +462,7 @@ class TijaraKnowledgeGraph:
         Execute graph algorithms for analysis.
         
         Example:
-            exporters = kg.analyze_graph(
+            exporters = await kg.analyze_graph(
                 algorithm="pagerank",
                 filters={"commodity": "Corn", "indicator": "Exports"}
             )
@@ -269,18 +477,24 @@ class TijaraKnowledgeGraph:
         """
         logger.info(f"Running graph algorithm: {algorithm}")
         
-        # Execute algorithm with filters
+        # Execute algorithm with filters. The analytics queries block on the
+        # database, so they run in a worker thread to keep the event loop free
         if algorithm == 'pagerank':
-            return self.analytics.pagerank(filters=filters, parameters=parameters)
+            return await asyncio.to_thread(self.analytics.pagerank, filters=filters, parameters=parameters)
         elif algorithm == 'centrality':
-            return self.analytics.centrality(algorithm='betweenness', filters=filters, parameters=parameters)
+            return await asyncio.to_thread(
+                self.analytics.centrality, algorithm='betweenness', filters=filters, parameters=parameters
+            )
         elif algorithm == 'community':
-            return self.analytics.community_detection(algorithm='louvain', filters=filters, parameters=parameters)
+            return await asyncio.to_thread(
+                self.analytics.community_detection, algorithm='louvain', filters=filters, parameters=parameters
+            )
         elif algorithm == 'pathfinding':
             # Pathfinding needs source and target from parameters
             if not parameters or 'source' not in parameters or 'target' not in parameters:
                 raise ValueError("Pathfinding requires 'source' and 'target' in parameters")
-            return self.analytics.shortest_path(
+            return await asyncio.to_thread(
+                self.analytics.shortest_path,
                 source=parameters['source'],
                 target=parameters['target'],
                 filters=filters,
@@ -324,18 +538,19 @@ class TijaraKnowledgeGraph:
     
     # ========== Impact Analysis Interface ==========
     
-    def find_impacts(
+    async def find_impacts(
         self,
         event_geometry: Any,
         event_type: str,
         max_hops: int = 5,
-        impact_threshold: float = 0.1
+        impact_threshold: float = 0.1,
+        as_dicts: bool = True
     ) -> Dict[str, Any]:
         """
         Find impacts of an event through the graph.
         
         Example:
-            impacts = kg.find_impacts(
+            impacts = await kg.find_impacts(
                 event_geometry=weather_event_polygon,
                 event_type="drought"
             )
@@ -345,64 +560,36 @@ class TijaraKnowledgeGraph:
             event_type: Type of event (weather, policy, etc.)
             max_hops: Maximum relationship hops to traverse
             impact_threshold: Minimum impact score to include
+            as_dicts: Return impacted entities as a list of dicts with paths;
+                if False, as a DataFrame with one column per field and
+                float32 impact scores
             
         Returns:
             Impacted entities with scores and paths
         """
         logger.info(f"Analyzing impacts for event type: {event_type}")
         
-        # Find intersecting geographies
-        affected_geographies = self.spatial.find_intersecting_geographies(
+        # Find intersecting geographies; database calls run in a worker thread
+        # so concurrent requests don't block the event loop
+        affected_geographies = await asyncio.to_thread(
+            self.spatial.find_intersecting_geographies,
             geometry=event_geometry
         )
         
-        # Traverse graph to find impacts
-        impacts = []
-        for geo_id in affected_geographies:
-            try:
-                # Find data nodes connected to this geography via various relationships
-                # FOR_GEOGRAPHY: BalanceSheet -> Geography
-                # PRODUCES: ProductionArea -> Commodity
-                # TRADES_WITH: Geography -> Geography
-                query = f"""
-                MATCH (g:Geography)
-                WHERE id(g) = {geo_id}
-                OPTIONAL MATCH (bs:BalanceSheet)-[:FOR_GEOGRAPHY]->(g)
-                OPTIONAL MATCH (g)-[t:TRADES_WITH]->(dest:Geography)
-                WITH g,
-                     [bs IN collect(DISTINCT bs) WHERE bs IS NOT NULL | {{type: 'BalanceSheet', id: id(bs), product: bs.product_name, season: bs.season}}] as balance_sheets,
-                     [t IN collect(DISTINCT t) WHERE t IS NOT NULL | {{type: 'Trade', from: g.name, to: dest.name, commodity: t.commodity}}] as trades
-                WITH balance_sheets + trades as all_entities
-                UNWIND all_entities as entity
-                RETURN entity
-                LIMIT 50
-                """
-                connected = self.falkordb.execute_query(query)
-                
-                for row in connected:
-                    entity = row.get('entity', {})
-                    if not entity:
-                        continue
-                        
-                    impact_score = self._calculate_impact_score(
-                        entity=entity,
-                        event_type=event_type,
-                        geography_id=geo_id
-                    )
-                    
-                    if impact_score >= impact_threshold:
-                        impacts.append({
-                            'entity_id': entity.get('id'),
-                            'entity_type': entity.get('type'),
-                            'commodity': entity.get('commodity') or entity.get('product'),
-                            'season': entity.get('season'),
-                            'trade_info': f"{entity.get('from')} -> {entity.get('to')}" if entity.get('from') else None,
-                            'impact_score': impact_score,
-                            'affected_geography': geo_id,
-                            'path': [geo_id]
-                        })
-            except Exception as e:
-                logger.warning(f"Error finding impacts for geography {geo_id}: {e}")
+        # Traverse graph to find impacts of every affected geography at once.
+        # This is a single query, so if it fails no geography has impacts
+        try:
+            impacted = await asyncio.to_thread(
+                lambda: list(self._iter_scored_impacts(affected_geographies, event_type, impact_threshold, max_hops))
+            )
+        except Exception as e:
+            logger.warning(f"Error finding impacts for geographies {affected_geographies}: {e}")
+            impacted = []
+        
+        impacts = [impact_dict(geo_id, entity, score) for geo_id, entity, score in impacted]
+        if not as_dicts:
+            impacts = pd.DataFrame(impacts, columns=IMPACT_COLUMNS)
+            impacts['impact_score'] = impacts['impact_score'].astype(np.float32)
         
         return {
             'total_impacts': len(impacts),
@@ -414,138 +601,168 @@ class TijaraKnowledgeGraph:
             }
         }
     
-    def _calculate_impact_score(
+    def iter_impacts(
         self,
-        entity: Dict[str, Any],
+        event_geometry: Any,
         event_type: str,
-        geography_id: str
-    ) -> float:
-        """Calculate impact score based on entity type and event."""
-        # Simple scoring logic - can be enhanced with ML models
-        base_score = 0.5
-        
-        # Get entity type
-        entity_type = entity.get('type', entity.get('entity_type', ''))
-        
-        # Adjust based on LDC entity types
-        if entity_type == 'BalanceSheet':
-            base_score += 0.3  # Balance sheets track critical supply/demand data
-        elif entity_type == 'ProductionArea':
-            base_score += 0.35  # Production areas directly affected by weather
-        elif entity_type == 'Trade':
-            base_score += 0.2  # Trade flows can be disrupted
-        
-        # Adjust based on event type
-        if event_type in ['drought', 'flood', 'storm'] and entity_type == 'ProductionArea':
-            base_score += 0.3  # Weather events heavily impact production
-        elif event_type in ['drought', 'flood'] and entity_type == 'BalanceSheet':
-            base_score += 0.2  # Weather affects supply tracked in balance sheets
-        elif event_type in ['policy', 'tariff', 'embargo'] and entity_type == 'Trade':
-            base_score += 0.3  # Policy events affect trade flows
-        
-        return min(base_score, 1.0)
+        impact_threshold: float = 0.1,
+        max_results: Optional[int] = None,
+        max_hops: int = 5
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield impacts of an event one at a time.
+        
+        Like find_impacts, but impact dicts are built as they are consumed,
+        so callers can pass them on or stop early without building every
+        one. The impacts query result itself is fetched whole.
+        
+        Args:
+            event_geometry: Spatial geometry of event (Shapely geometry)
+            event_type: Type of event (weather, policy, etc.)
+            impact_threshold: Minimum impact score to include
+            max_results: Stop after this many impacts
+            max_hops: Maximum relationship hops to traverse
+        
+        Yields:
+            Impacted entity dicts with scores and paths, as in find_impacts
+        """
+        affected_geographies = self.spatial.find_intersecting_geographies(
+            geometry=event_geometry
+        )
+        impacted = self._iter_scored_impacts(affected_geographies, event_type, impact_threshold, max_hops)
+        for geo_id, entity, score in islice(impacted, max_results):
+            yield impact_dict(geo_id, entity, score)
+    
+    def _iter_scored_impacts(
+        self,
+        affected_geographies: List[str],
+        event_type: str,
+        impact_threshold: float,
+        max_hops: int
+    ) -> Iterator[Tuple[str, Dict[str, Any], float]]:
+        """
+        Yield (geography id, entity, score) for entities above the threshold.
+        
+        Connected entities are read from the query result and scored in
+        chunks.
+        Every entity is at least one hop from its geography, so max_hops
+        below 1 yields nothing.
+        """
+        if max_hops < 1 or not affected_geographies:
+            return
+        connected = self.falkordb.iter_query_rows(geography_impacts_query(max_hops), {
+            'geo_ids': [int(geo_id) for geo_id in affected_geographies],
+            'limit': IMPACTS_PER_GEOGRAPHY
+        })
+        yield from scored_impacts(connected, event_type, impact_threshold)
     
     def _get_or_create_concepts(self, metadata: Dict[str, Any]) -> Dict[str, str]:
-        """Get or create concept nodes and return their IDs using ORM."""
+        """
+        Get or create concept nodes and return their IDs.
+        
+        Concepts whose ids are cached are not queried; the rest are looked
+        up or created by one query of MERGE clauses, keyed by name.
+        """
+        concepts = _metadata_concepts(metadata)
         concept_ids = {}
+        for concept, (name, _) in list(concepts.items()):
+            key = (CONCEPT_LABELS[concept], name)
+            node_id = self._concept_cache.get(key)
+            if node_id is not None:
+                self._concept_cache.move_to_end(key)
+                concept_ids[concept] = node_id
+                del concepts[concept]
+        
+        if not concepts:
+            return concept_ids
+        
+        params = {}
+        for concept, (name, props) in concepts.items():
+            params[f"{concept}_name"] = name
+            params[f"{concept}_props"] = props
         
         try:
-            # Commodity concept
-            if metadata.get('commodity'):
-                commodity_name = metadata['commodity']
-                commodity = self.commodity_repo.find_by_name(commodity_name)
-                if commodity:
-                    # Get ID using raw query (ORM entities don't expose internal node ID)
-                    query = f'MATCH (n:Commodity {{name: "{commodity_name}"}}) RETURN id(n) as id LIMIT 1'
-                    result = self.falkordb.execute_query(query)
-                    if result:
-                        concept_ids['commodity'] = str(result[0]['id'])
-                else:
-                    # Create it using raw client (not ORM-managed concept)
-                    concept_ids['commodity'] = self.falkordb.create_entity(
-                        'Commodity',
-                        {'name': commodity_name, 'type': 'commodity'}
-                    )
-            
-            # Geography concept (country or region)
-            geo_name = metadata.get('region') or metadata.get('country')
-            if geo_name:
-                geography = self.geography_repo.find_by_name(geo_name)
-                if geography:
-                    query = f'MATCH (n:Geography {{name: "{geo_name}"}}) RETURN id(n) as id LIMIT 1'
-                    result = self.falkordb.execute_query(query)
-                    if result:
-                        concept_ids['geography'] = str(result[0]['id'])
-                else:
-                    concept_ids['geography'] = self.falkordb.create_entity(
-                        'Geography',
-                        {'name': geo_name, 'type': 'geography', 'country': metadata.get('country')}
-                    )
-            
-            # Indicator concept (not an ORM entity)
-            if metadata.get('type'):
-                indicator = metadata['type']
-                query = f'MATCH (n:Indicator {{name: "{indicator}"}}) RETURN id(n) as id LIMIT 1'
-                result = self.falkordb.execute_query(query)
-                if result:
-                    concept_ids['indicator'] = str(result[0]['id'])
-                else:
-                    concept_ids['indicator'] = self.falkordb.create_entity(
-                        'Indicator',
-                        {'name': indicator, 'type': 'indicator'}
-                    )
-            
-            # Source concept (not an ORM entity)
-            if metadata.get('source'):
-                source = metadata['source']
-                query = f'MATCH (n:Source {{name: "{source}"}}) RETURN id(n) as id LIMIT 1'
-                result = self.falkordb.execute_query(query)
-                if result:
-                    concept_ids['source'] = str(result[0]['id'])
-                else:
-                    concept_ids['source'] = self.falkordb.create_entity(
-                        'Source',
-                        {'name': source, 'type': 'source'}
-                    )
-        
+            result = self.falkordb.execute_query(_concept_merge_query(tuple(concepts)), params)
+            for concept, node_id in (result[0].items() if result else ()):
+                concept_ids[concept] = str(node_id)
+                self._concept_cache[(CONCEPT_LABELS[concept], concepts[concept][0])] = str(node_id)
+                if len(self._concept_cache) > self._concept_cache_size:
+                    self._concept_cache.popitem(last=False)
         except Exception as e:
             logger.error(f"Error creating/getting concept nodes: {e}")
         
         return concept_ids
     
+    def _get_or_create_concepts_bulk(self, metadata_list: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """
+        Get or create the concept nodes of many metadata dicts at once.
+        
+        Uncached concepts are deduplicated by (label, name) and looked up or
+        created by one UNWIND query per label, all sent in one round trip.
+        
+        Returns:
+            Concept IDs for each metadata dict, in order
+        """
+        record_concepts = [_metadata_concepts(metadata) for metadata in metadata_list]
+        
+        node_ids: Dict[Tuple[str, str], str] = {}
+        missing: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for concepts in record_concepts:
+            for concept, (name, props) in concepts.items():
+                key = (CONCEPT_LABELS[concept], name)
+                if key in node_ids or name in missing.get(key[0], ()):
+                    continue
+                node_id = self._concept_cache.get(key)
+                if node_id is not None:
+                    self._concept_cache.move_to_end(key)
+                    node_ids[key] = node_id
+                else:
+                    missing.setdefault(key[0], {})[name] = props
+        
+        if missing:
+            queries = [
+                (CONCEPT_UNWIND_QUERY.format(label=label), {
+                    'concepts': [{'name': name, 'props': props} for name, props in names.items()]
+                })
+                for label, names in missing.items()
+            ]
+            try:
+                for label, rows in zip(missing, self.falkordb.execute_pipeline(queries)):
+                    for row in rows:
+                        node_ids[(label, row['name'])] = str(row['id'])
+                        self._concept_cache[(label, row['name'])] = str(row['id'])
+                        if len(self._concept_cache) > self._concept_cache_size:
+                            self._concept_cache.popitem(last=False)
+            except Exception as e:
+                logger.error(f"Error creating/getting concept nodes: {e}")
+        
+        return [
+            {
+                concept: node_ids[(CONCEPT_LABELS[concept], name)]
+                for concept, (name, _) in concepts.items()
+                if (CONCEPT_LABELS[concept], name) in node_ids
+            }
+            for concepts in record_concepts
+        ]
+    
     def _create_entity_description(self, entity_props: Dict[str, Any], metadata: Dict[str, Any]) -> str:
         """Create a text description of an entity for semantic search."""
-        parts = []
-        
         # Build descriptive text
         commodity = metadata.get('commodity', 'commodity')
-        indicator = metadata.get('type', 'data')
-        country = metadata.get('country', '')
-        region = metadata.get('region', '')
-        
-        location = region if region else country
+        indicator = metadata.get('type', 'data').lower()
+        location = metadata.get('region') or metadata.get('country', '')
+        source = metadata.get('source')
+        source_str = f" Source: {source}." if source else ""
         
         # Example: "Corn production in Iowa, USA for January 2023 was 384900 thousand metric tons"
         if 'value' in entity_props and 'year' in entity_props:
-            month = entity_props.get('month', '')
-            time_str = f"{entity_props['year']}"
-            if month:
-                months = ['', 'January', 'February', 'March', 'April', 'May', 'June', 
-                         'July', 'August', 'September', 'October', 'November', 'December']
-                time_str = f"{months[month]} {entity_props['year']}"
-            
-            value_str = f"{entity_props['value']}"
+            month = entity_props.get('month')
+            year = entity_props['year']
+            time_str = f"{MONTH_NAMES[month]} {year}" if month else f"{year}"
             unit = metadata.get('unit', '')
-            
-            description = f"{commodity} {indicator.lower()} in {location} for {time_str} was {value_str} {unit}."
-        else:
-            description = f"{commodity} {indicator.lower()} data for {location}."
+            return f"{commodity} {indicator} in {location} for {time_str} was {entity_props['value']} {unit}.{source_str}"
         
-        # Add source information
-        if metadata.get('source'):
-            description += f" Source: {metadata['source']}."
-        
-        return description
+        return f"{commodity} {indicator} data for {location}.{source_str}"
     
     # ========== Exploration Interface ==========
     
@@ -558,13 +775,19 @@ class TijaraKnowledgeGraph:
         """
         schema = self.ontology.get_schema()
         
-        # Query actual relationship types from the graph
+        # Query actual relationship types from the graph. Scanning every
+        # edge is expensive and new types are rare, so the list is reused
+        # for schema_cache_ttl seconds
         try:
-            query = "MATCH ()-[r]->() RETURN DISTINCT type(r) as rel_type"
-            results = self.falkordb.execute_query(query)
-            
-            # Extract relationship types from results
-            actual_relationships = [r['rel_type'] for r in results if 'rel_type' in r]
+            cached = self._schema_cache
+            if cached and time.monotonic() - cached[0] < self._schema_cache_ttl:
+                actual_relationships = list(cached[1])
+            else:
+                results = self.falkordb.execute_query(RELATIONSHIP_TYPES_QUERY)
+                
+                # Extract relationship types from results
+                actual_relationships = [r['rel_type'] for r in results if 'rel_type' in r]
+                self._schema_cache = (time.monotonic(), list(actual_relationships))
             
             # Replace static relationships with actual ones from graph
             if actual_relationships:
@@ -577,14 +800,17 @@ class TijaraKnowledgeGraph:
         
         return schema
     
-    def search_entities(
+    async def search_entities(
         self,
         search_term: str,
         entity_types: Optional[List[str]] = None,
         limit: int = 20
     ) -> List[Dict[str, Any]]:
         """
-        Search for entities by name or properties using ORM repositories.
+        Search for entities by name or properties.
+        
+        All requested entity types are searched by one UNION query with the
+        same matching and ordering as the repositories' searches.
         
         Args:
             search_term: Search query
@@ -594,52 +820,25 @@ class TijaraKnowledgeGraph:
         Returns:
             List of matching entities
         """
-        results = []
-        
         # If entity_types specified, only search those
         search_all = not entity_types or len(entity_types) == 0
+        searched_types = tuple(
+            entity_type for entity_type in SEARCH_CONDITIONS
+            if search_all or entity_type in entity_types
+        )
+        if not searched_types:
+            return []
         
-        # Search Commodity entities
-        if search_all or 'Commodity' in entity_types:
-            commodities = self.commodity_repo.search_case_insensitive(search_term, limit=limit)
-            for c in commodities:
-                results.append({
-                    'type': 'Commodity',
-                    'name': c.name,
-                    'level': c.level,
-                    'category': c.category
-                })
-        
-        # Search Geography entities
-        if search_all or 'Geography' in entity_types:
-            geographies = self.geography_repo.search_case_insensitive(search_term, limit=limit)
-            for g in geographies:
-                results.append({
-                    'type': 'Geography',
-                    'name': g.name,
-                    'level': g.level,
-                    'gid_code': g.gid_code
-                })
-        
-        # Search BalanceSheet entities
-        if search_all or 'BalanceSheet' in entity_types:
-            balance_sheets = self.balance_sheet_repo.search_case_insensitive(search_term, limit=limit)
-            for bs in balance_sheets:
-                results.append({
-                    'type': 'BalanceSheet',
-                    'balance_sheet_id': bs.balance_sheet_id,
-                    'product_name': bs.product_name,
-                    'season': bs.season
-                })
+        rows = await asyncio.to_thread(
+            self.falkordb.execute_query,
+            _entity_search_query(searched_types),
+            {'search_term': search_term, 'limit': limit}
+        )
         
-        # Search ProductionArea entities
-        if search_all or 'ProductionArea' in entity_types:
-            production_areas = self.production_area_repo.search_case_insensitive(search_term, limit=limit)
-            for pa in production_areas:
-                results.append({
-                    'type': 'ProductionArea',
-                    'name': pa.name
-                })
+        # Results are grouped by entity type in the order the types are searched
+        type_order = {entity_type: i for i, entity_type in enumerate(searched_types)}
+        rows.sort(key=lambda row: type_order[row['type']])
+        results = [{'type': row['type'], **row['fields']} for row in rows]
         
         return results[:limit]
     
@@ -711,17 +910,21 @@ class TijaraKnowledgeGraph:
             Summary of cleared data
         """
         logger.warning("Clearing all data from knowledge graph")
+        self.clear_cache()
         
-        # Clear FalkorDB data
+        # Clear FalkorDB data, one chunk of nodes per query
         try:
-            query = "MATCH (n) DETACH DELETE n"
-            self.falkordb.execute_query(query)
+            while _deleted_count(await asyncio.to_thread(self.falkordb.execute_query, CLEAR_BATCH_QUERY)):
+                pass
             logger.info("FalkorDB data cleared")
             falkordb_cleared = True
         except Exception as e:
             logger.error(f"Error clearing FalkorDB: {e}")
             falkordb_cleared = False
         
+        # Scores materialized on nodes a partial clear left behind are stale
+        self.analytics.invalidate_materialized_scores()
+        
         # Clear Graphiti data
         graphiti_cleared = False
         if self.graphiti and self.graphiti.is_ready():
@@ -729,10 +932,11 @@ class TijaraKnowledgeGraph:
                 # Access the underlying driver from the Graphiti client
                 driver = self.graphiti.client.driver
                 
-                # Delete all nodes in Graphiti (simple DETACH DELETE all)
+                # Delete all nodes in Graphiti in chunks
                 # This clears all Graphiti episodes and entities
-                delete_query = "MATCH (n) DETACH DELETE n"
-                driver.execute_query(delete_query)
+                while _deleted_count(await driver.execute_query(CLEAR_BATCH_QUERY)):
+                    await asyncio.sleep(0)
+                self.graphiti.clear_cache()
                 
                 logger.info("Graphiti data cleared")
                 graphiti_cleared = True
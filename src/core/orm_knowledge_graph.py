@@ -5,6 +5,7 @@ Uses FalkorDB ORM for cleaner, type-safe entity management
 
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime, timezone
+import asyncio
 import logging
 
 import falkordb
@@ -17,6 +18,9 @@ from .graphiti_engine import GraphitiEngine
 from ..ontology.schema import OntologySchema
 from ..analytics.graph_algorithms import GraphAnalytics
 from ..analytics.spatial_ops import SpatialOperations
+from ..analytics.impact_scoring import (
+    IMPACTS_PER_GEOGRAPHY, geography_impacts_query, impact_dict, scored_impacts
+)
 from ..rag.query_engine import QueryEngine
 
 logger = logging.getLogger(__name__)
@@ -206,6 +210,13 @@ class ORMKnowledgeGraph:
                     except Exception as e:
                         logger.warning(f"Graphiti episode creation failed: {e}")
         
+        # New balance sheets change pagerank and betweenness, so materialized
+        # scores are recomputed on next use; cached neighbours are dropped
+        # for the same reason
+        if entities_created:
+            self.analytics.invalidate_materialized_scores()
+            self.spatial.clear_cache()
+        
         return {
             'entities_created': len(entities_created),
             'relationships_created': len(entities_created) * 2,  # commodity + geography per entity
@@ -237,7 +248,7 @@ class ORMKnowledgeGraph:
     
     # ========== Graph Analytics Interface ==========
     
-    def analyze_graph(
+    async def analyze_graph(
         self,
         algorithm: str,
         filters: Optional[Dict[str, Any]] = None,
@@ -246,20 +257,26 @@ class ORMKnowledgeGraph:
         """
         Execute graph algorithms for analysis.
         
-        Same API as TijaraKnowledgeGraph.analyze_graph()
+        Same API as TijaraKnowledgeGraph.analyze_graph(); the analytics
+        queries run in a worker thread
         """
         logger.info(f"Running graph algorithm: {algorithm}")
         
         if algorithm == 'pagerank':
-            return self.analytics.pagerank(filters=filters, parameters=parameters)
+            return await asyncio.to_thread(self.analytics.pagerank, filters=filters, parameters=parameters)
         elif algorithm == 'centrality':
-            return self.analytics.centrality(algorithm='betweenness', filters=filters, parameters=parameters)
+            return await asyncio.to_thread(
+                self.analytics.centrality, algorithm='betweenness', filters=filters, parameters=parameters
+            )
         elif algorithm == 'community':
-            return self.analytics.community_detection(algorithm='louvain', filters=filters, parameters=parameters)
+            return await asyncio.to_thread(
+                self.analytics.community_detection, algorithm='louvain', filters=filters, parameters=parameters
+            )
         elif algorithm == 'pathfinding':
             if not parameters or 'source' not in parameters or 'target' not in parameters:
                 raise ValueError("Pathfinding requires 'source' and 'target' in parameters")
-            return self.analytics.shortest_path(
+            return await asyncio.to_thread(
+                self.analytics.shortest_path,
                 source=parameters['source'],
                 target=parameters['target'],
                 filters=filters,
@@ -268,6 +285,53 @@ class ORMKnowledgeGraph:
         else:
             raise ValueError(f"Unknown algorithm: {algorithm}")
     
+    async def find_impacts(
+        self,
+        event_geometry: Any,
+        event_type: str,
+        max_hops: int = 5,
+        impact_threshold: float = 0.1
+    ) -> Dict[str, Any]:
+        """
+        Find impacts of an event through the graph.
+        
+        Same API as TijaraKnowledgeGraph.find_impacts(), with impacted
+        entities returned as dicts and queries filtered by execute_query()
+        """
+        logger.info(f"Analyzing impacts for event type: {event_type}")
+        
+        affected_geographies = await asyncio.to_thread(
+            self.spatial.find_intersecting_geographies,
+            geometry=event_geometry
+        )
+        
+        # A single query covers every geography, so if it fails none has
+        # impacts. Every entity is at least one hop from its geography
+        rows = []
+        if max_hops >= 1 and affected_geographies:
+            try:
+                rows = await asyncio.to_thread(self.execute_query, geography_impacts_query(max_hops), {
+                    'geo_ids': [int(geo_id) for geo_id in affected_geographies],
+                    'limit': IMPACTS_PER_GEOGRAPHY
+                })
+            except Exception as e:
+                logger.warning(f"Error finding impacts for geographies {affected_geographies}: {e}")
+        
+        impacts = [
+            impact_dict(geo_id, entity, score)
+            for geo_id, entity, score in scored_impacts(rows, event_type, impact_threshold)
+        ]
+        
+        return {
+            'total_impacts': len(impacts),
+            'impacted_entities': impacts,
+            'affected_geographies': affected_geographies,
+            'event_summary': {
+                'type': event_type,
+                'geometry': str(event_geometry)
+            }
+        }
+    
     # ========== Helper Methods for Backward Compatibility ==========
     
     def execute_query(self, query: str, parameters: Optional[Dict] = None) -> List[Dict]:
@@ -352,7 +416,7 @@ class ORMKnowledgeGraph:
         """Get ontology schema for exploration."""
         return self.ontology.get_schema()
     
-    def search_entities(
+    async def search_entities(
         self,
         search_term: str,
         entity_types: Optional[List[str]] = None,
@@ -360,15 +424,23 @@ class ORMKnowledgeGraph:
     ) -> List[Dict[str, Any]]:
         """
         Search for entities by name using repositories.
-        """
-        results = []
         
+        Same API as TijaraKnowledgeGraph.search_entities(); the repository
+        searches run concurrently in worker threads
+        """
+        searches = []
         if not entity_types or 'Geography' in entity_types:
-            geographies = self.geography_repo.search_by_level_and_name(0, search_term)
-            results.extend([{'type': 'Geography', 'entity': g} for g in geographies[:limit]])
-        
+            searches.append(('Geography', asyncio.to_thread(
+                lambda: self.geography_repo.search_by_level_and_name(0, search_term)[:limit]
+            )))
         if not entity_types or 'Commodity' in entity_types:
-            commodities = self.commodity_repo.search_by_name(search_term, limit)
-            results.extend([{'type': 'Commodity', 'entity': c} for c in commodities])
+            searches.append(('Commodity', asyncio.to_thread(self.commodity_repo.search_by_name, search_term, limit)))
+        
+        found = await asyncio.gather(*(search for _, search in searches))
+        results = [
+            {'type': entity_type, 'entity': entity}
+            for (entity_type, _), entities in zip(searches, found)
+            for entity in entities
+        ]
         
         return results[:limit]
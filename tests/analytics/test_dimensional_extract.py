@@ -0,0 +1,123 @@
+"""
+Tests for DimensionalExtractor and BatchedExtractor
+"""
+
+import logging
+import pytest
+from concurrent.futures import CancelledError
+from src.analytics.dimensional_extract import DimensionalExtractor, ensure_indexes
+
+
+class MockDB:
+    """Mock client recording queries and returning fixed rows."""
+    def __init__(self, rows=None):
+        self.rows = rows or []
+        self.queries = []
+    
+    def execute_query(self, query, params=None):
+        """Record the query and return the fixed rows."""
+        self.queries.append((query, params))
+        return self.rows
+
+
+class FailingDB:
+    """Mock client whose queries fail with a fixed error."""
+    def __init__(self, message):
+        self.message = message
+    
+    def execute_query(self, query, params=None):
+        """Raise the fixed error."""
+        raise Exception(self.message)
+
+
+class TestEnsureIndexes:
+    """Test ensure_indexes error handling."""
+    
+    def test_existing_index_ignored(self, caplog):
+        """Test an existing index is not reported."""
+        with caplog.at_level(logging.WARNING):
+            ensure_indexes(FailingDB("Attribute 'commodity' is already indexed"), {'Production': ['commodity']})
+        
+        assert not caplog.records
+    
+    def test_other_errors_warned(self, caplog):
+        """Test other failures are logged as warnings."""
+        with caplog.at_level(logging.WARNING):
+            ensure_indexes(FailingDB("Connection refused"), {'Production': ['commodity']})
+        
+        assert [r.levelno for r in caplog.records] == [logging.WARNING]
+        assert 'Connection refused' in caplog.records[0].getMessage()
+
+
+class TestExtractPages:
+    """Test paged extraction."""
+    
+    def test_pages_ordered(self):
+        """Test every page query has a stable order before SKIP."""
+        db = MockDB([{'geography': 'France'}, {'geography': 'Egypt'}])
+        extractor = DimensionalExtractor(db)
+        
+        pages = list(extractor.extract_pages('Production', ['geography'], limit=5, page_size=2))
+        
+        assert len(pages) == 3
+        assert [params['skip'] for _, params in db.queries] == [0, 2, 4]
+        for query, _ in db.queries:
+            assert query.index('ORDER BY id(n)') < query.index('SKIP $skip')
+
+
+class TestBatchedExtractor:
+    """Test BatchedExtractor context manager."""
+    
+    def test_flush_resolves_futures(self):
+        """Test leaving the batch runs it and resolves every future."""
+        db = MockDB([{'origin': 0, 'row': ['France', 1.0]}, {'origin': 1, 'row': ['Egypt']}])
+        extractor = DimensionalExtractor(db)
+        
+        with extractor.batch() as batch:
+            first = batch.add('Production', ['geography', 'value'])
+            second = batch.add('Trade', ['geography'])
+        
+        assert len(db.queries) == 1
+        assert first.result(timeout=1).to_dict('records') == [{'geography': 'France', 'value': 1.0}]
+        assert second.result(timeout=1).to_dict('records') == [{'geography': 'Egypt'}]
+    
+    def test_exception_cancels_futures(self):
+        """Test an exception in the batch body cancels queued futures."""
+        db = MockDB()
+        extractor = DimensionalExtractor(db)
+        
+        with pytest.raises(ValueError):
+            with extractor.batch() as batch:
+                future = batch.add('Production', ['geography'])
+                raise ValueError("body failed")
+        
+        assert future.cancelled()
+        with pytest.raises(CancelledError):
+            future.result(timeout=1)
+        assert batch.queue == []
+        assert db.queries == []
+
+
+class TestExportToCsv:
+    """Test CSV export."""
+    
+    def test_export_written(self, tmp_path):
+        """Test the header and rows are written with no temporary file left."""
+        output = tmp_path / 'export.csv'
+        extractor = DimensionalExtractor(MockDB([{'geography': 'France'}]))
+        
+        assert extractor.export_to_csv('Production', ['geography'], str(output), limit=1)
+        
+        assert output.read_text().splitlines() == ['geography', 'France']
+        assert [p.name for p in tmp_path.iterdir()] == ['export.csv']
+    
+    def test_failed_export_keeps_existing_file(self, tmp_path):
+        """Test a failed export leaves the previous file untouched."""
+        output = tmp_path / 'export.csv'
+        output.write_text('geography\nEgypt\n')
+        extractor = DimensionalExtractor(FailingDB("Connection refused"))
+        
+        assert not extractor.export_to_csv('Production', ['geography'], str(output))
+        
+        assert output.read_text() == 'geography\nEgypt\n'
+        assert [p.name for p in tmp_path.iterdir()] == ['export.csv']
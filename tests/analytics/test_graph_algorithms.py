@@ -0,0 +1,111 @@
+"""
+Tests for GraphAnalytics score algorithms
+"""
+
+import logging
+import numpy as np
+from src.analytics.graph_algorithms import GraphAnalytics
+
+
+ROWS = [{'node_id': 1, 'score': 0.2}, {'node_id': 2, 'score': 0.5}, {'node_id': 3, 'score': 0.3}]
+
+
+class MockDB:
+    """Mock client returning fixed score rows."""
+    def __init__(self, rows):
+        self.rows = rows
+    
+    def execute_query(self, query, params=None):
+        """Return the fixed rows."""
+        return self.rows
+
+
+class TestScoreArrays:
+    """Test as_arrays results."""
+    
+    def test_pagerank_arrays(self):
+        """Test scores come back as sorted ID and score arrays."""
+        analytics = GraphAnalytics(MockDB(ROWS))
+        
+        ids, scores = analytics.pagerank(parameters={'as_arrays': True, 'sort': True})
+        
+        assert ids.tolist() == [2, 3, 1]
+        assert np.allclose(scores, [0.5, 0.3, 0.2])
+    
+    def test_pagerank_logs_node_count(self, caplog):
+        """Test the logged count is the number of nodes, not of arrays."""
+        analytics = GraphAnalytics(MockDB(ROWS))
+        
+        with caplog.at_level(logging.INFO):
+            analytics.pagerank(parameters={'as_arrays': True})
+        
+        assert "PageRank calculated for 3 nodes" in caplog.text
+    
+    def test_centrality_logs_node_count(self, caplog):
+        """Test the logged count is the number of nodes, not of arrays."""
+        analytics = GraphAnalytics(MockDB(ROWS))
+        
+        with caplog.at_level(logging.INFO):
+            analytics.centrality(parameters={'as_arrays': True})
+        
+        assert "Betweenness centrality calculated for 3 nodes" in caplog.text
+
+
+class RecordingDB(MockDB):
+    """Mock client also recording queries."""
+    def __init__(self, rows):
+        super().__init__(rows)
+        self.queries = []
+    
+    def execute_query(self, query, params=None):
+        """Record the query and return the fixed rows."""
+        self.queries.append((query, params))
+        return self.rows
+
+
+class TestMaterializedScores:
+    """Test materialized score invalidation."""
+    
+    def test_invalidate_runs_no_query(self):
+        """Test invalidating does not scan the graph."""
+        db = RecordingDB(ROWS)
+        analytics = GraphAnalytics(db)
+        
+        analytics.invalidate_materialized_scores()
+        
+        assert db.queries == []
+    
+    def test_read_skips_runs_before_invalidation(self):
+        """Test reads only accept runs computed after the last invalidation."""
+        db = RecordingDB(ROWS)
+        analytics = GraphAnalytics(db)
+        
+        analytics.invalidate_materialized_scores()
+        analytics.pagerank(parameters={'materialize': True})
+        
+        _, params = db.queries[0]
+        assert params['min_computed_at'] > analytics._invalidated_at
+
+
+class TestGetSubgraph:
+    """Test get_subgraph queries."""
+    
+    def test_filters_parameterized(self):
+        """Test filters constrain every node past the centre and are sent as parameters."""
+        db = RecordingDB([{'node_ids': [1, 2], 'rel_ids': [5]}])
+        analytics = GraphAnalytics(db)
+        
+        subgraph = analytics.get_subgraph('1', filters={'commodity': 'Wheat'})
+        
+        query, params = db.queries[0]
+        assert subgraph == {'nodes': [1, 2], 'relationships': [5]}
+        assert "all(v IN nodes(path)[1..] WHERE v.commodity = $f_commodity)" in query
+        assert params['f_commodity'] == 'Wheat'
+    
+    def test_invalid_filter_key(self):
+        """Test filter keys that are not identifiers are never interpolated."""
+        db = RecordingDB([])
+        analytics = GraphAnalytics(db)
+        
+        assert analytics.get_subgraph('1', filters={'x = 1 OR true': 1}) == {'nodes': [], 'relationships': []}
+        assert db.queries == []
@@ -0,0 +1,70 @@
+"""
+Tests for impact scoring shared by the knowledge graphs
+"""
+
+import pytest
+from src.analytics import impact_scoring
+from src.analytics.impact_scoring import (
+    IMPACT_EVENT_BONUS, IMPACT_TYPE_BONUS, geography_impacts_query, impact_scores, scored_impacts
+)
+
+
+class TestImpactScores:
+    """Test vectorized impact scoring."""
+    
+    @pytest.mark.parametrize('event_type', ['drought', 'flood', 'storm', 'policy', 'tariff', 'unknown'])
+    def test_matches_bonus_tables(self, event_type):
+        """Test each type scores 0.5 plus its IMPACT_* bonuses, capped at 1.0."""
+        entity_types = ['BalanceSheet', 'ProductionArea', 'Trade', 'Geography', '']
+        
+        scores = impact_scores(entity_types, event_type)
+        
+        expected = [
+            min(0.5 + IMPACT_TYPE_BONUS.get(t, 0.0) + IMPACT_EVENT_BONUS.get((event_type, t), 0.0), 1.0)
+            for t in entity_types
+        ]
+        assert scores.tolist() == pytest.approx(expected)
+    
+    def test_known_scores(self):
+        """Test scores for a weather and a policy event."""
+        types = ['BalanceSheet', 'ProductionArea', 'Trade', 'Geography']
+        
+        assert impact_scores(types, 'drought').tolist() == pytest.approx([1.0, 1.0, 0.7, 0.5])
+        assert impact_scores(types, 'policy').tolist() == pytest.approx([0.8, 0.85, 1.0, 0.5])
+    
+    def test_empty(self):
+        """Test no entities give no scores."""
+        assert impact_scores([], 'drought').tolist() == []
+
+
+class TestScoredImpacts:
+    """Test chunked scoring of impacts query rows."""
+    
+    def test_threshold_and_chunks(self, monkeypatch):
+        """Test rows are scored across chunks and filtered by the threshold."""
+        monkeypatch.setattr(impact_scoring, 'IMPACT_SCORE_CHUNK_SIZE', 2)
+        rows = iter([
+            {'geo_id': 1, 'entity': {'type': 'BalanceSheet', 'id': 7}},
+            {'geo_id': 1, 'entity': None},
+            {'geo_id': 2, 'entity': {'type': 'Geography'}},
+            {'geo_id': 2, 'entity': {'type': 'Trade', 'from': 'FR', 'to': 'EG'}},
+        ])
+        
+        impacts = list(scored_impacts(rows, 'drought', 0.6))
+        
+        assert [(geo_id, entity['type']) for geo_id, entity, _ in impacts] == [('1', 'BalanceSheet'), ('2', 'Trade')]
+        assert [score for _, _, score in impacts] == pytest.approx([1.0, 0.7])
+
+
+class TestGeographyImpactsQuery:
+    """Test the impacts query for a number of hops."""
+    
+    def test_one_trade_hop_per_further_hop(self):
+        """Test each hop past the first expands the trade frontier once."""
+        assert "OPTIONAL MATCH (f)-[:TRADES_WITH]->" not in geography_impacts_query(1)
+        assert geography_impacts_query(5).count("OPTIONAL MATCH (f)-[:TRADES_WITH]->") == 4
+    
+    def test_no_hops(self):
+        """Test fewer than one hop is rejected."""
+        with pytest.raises(ValueError):
+            geography_impacts_query(0)
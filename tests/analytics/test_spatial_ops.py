@@ -0,0 +1,173 @@
+"""
+Tests for impact propagation in SpatialOperations
+"""
+
+from src.analytics.spatial_ops import SpatialOperations, _bfs_hops, _bfs_impact_scores, geometry_bounds
+
+
+# Undirected adjacency of a small graph: BalanceSheet 2 and ProductionArea 3
+# point into Geography 1, and 2 points into Commodity 4
+ADJACENCY = {1: [2, 3], 2: [1, 4], 3: [1], 4: [2]}
+
+
+class MockDB:
+    """Mock client answering neighbour queries from an adjacency map."""
+    def __init__(self, adjacency):
+        self.adjacency = adjacency
+        self.queries = []
+    
+    def execute_query(self, query, params=None):
+        """Return connected entities of the requested IDs."""
+        self.queries.append(params['ids'])
+        return [
+            {'source': eid, 'connected': self.adjacency[eid][:params['limit']]}
+            for eid in params['ids'] if self.adjacency.get(eid)
+        ]
+
+
+class TestBfsHops:
+    """Test _bfs_hops traversal."""
+    
+    def test_hops_from_seed(self):
+        """Test nodes get their hop distance and the seed is excluded."""
+        hops = _bfs_hops([[1]], lambda ids: {i: ADJACENCY[i] for i in ids}, 5)
+        
+        assert hops == [{2: 1, 3: 1, 4: 2}]
+    
+    def test_max_depth(self):
+        """Test traversal stops at max_depth."""
+        hops = _bfs_hops([[1]], lambda ids: {i: ADJACENCY[i] for i in ids}, 1)
+        
+        assert hops == [{2: 1, 3: 1}]
+    
+    def test_nearest_seed(self):
+        """Test a node reachable from several seeds keeps its nearest hop."""
+        hops = _bfs_hops([[1, 4]], lambda ids: {i: ADJACENCY[i] for i in ids}, 5)
+        
+        assert hops == [{2: 1, 3: 1}]
+    
+    def test_groups_share_neighbour_lookups(self):
+        """Test each hop looks up every group's frontier at once."""
+        calls = []
+        
+        def get_neighbors(ids):
+            calls.append(sorted(ids))
+            return {i: ADJACENCY[i] for i in ids}
+        
+        hops = _bfs_hops([[1], [4], []], get_neighbors, 2)
+        
+        assert hops == [{2: 1, 3: 1, 4: 2}, {2: 1, 1: 2}, {}]
+        assert calls == [[1, 4], [2, 3]]
+
+
+class TestBfsImpactScores:
+    """Test _bfs_impact_scores decay."""
+    
+    def test_decay_per_hop(self):
+        """Test direct neighbours get full impact, decaying per further hop."""
+        scores = _bfs_impact_scores({2: 1, 4: 2, 5: 3}, 0.5)
+        
+        assert scores == {2: 1.0, 4: 0.5, 5: 0.25}
+    
+    def test_empty(self):
+        """Test no hops give no scores."""
+        assert _bfs_impact_scores({}, 0.5) == {}
+
+
+class TestPropagateImpact:
+    """Test SpatialOperations impact propagation."""
+    
+    def test_follows_incoming_relationships(self):
+        """Test impact on a geography reaches entities pointing into it."""
+        spatial = SpatialOperations(MockDB(ADJACENCY))
+        
+        scores = spatial._propagate_impact([{'entity_id': '1'}], max_hops=5, threshold=0.1)
+        
+        assert scores == {2: 1.0, 3: 1.0, 4: 0.5}
+    
+    def test_threshold_limits_depth(self):
+        """Test hops whose impact is below the threshold are not traversed."""
+        db = MockDB(ADJACENCY)
+        spatial = SpatialOperations(db)
+        
+        scores = spatial._propagate_impact([{'entity_id': '1'}], max_hops=5, threshold=0.6)
+        
+        assert scores == {2: 1.0, 3: 1.0}
+        assert db.queries == [[1]]
+    
+    def test_neighbours_capped(self):
+        """Test at most 50 neighbours of a hub entity are followed."""
+        spatial = SpatialOperations(MockDB({1: list(range(2, 200))}))
+        
+        scores = spatial._propagate_impact([{'entity_id': '1'}], max_hops=1, threshold=0.1)
+        
+        assert len(scores) == 50
+    
+    def test_neighbours_cached(self):
+        """Test neighbour lookups are reused across propagations."""
+        db = MockDB(ADJACENCY)
+        spatial = SpatialOperations(db)
+        
+        spatial._propagate_impact([{'entity_id': '1'}], max_hops=5, threshold=0.1)
+        queries = len(db.queries)
+        spatial._propagate_impact([{'entity_id': '1'}], max_hops=5, threshold=0.1)
+        
+        assert len(db.queries) == queries
+        
+        spatial.clear_cache()
+        spatial._propagate_impact([{'entity_id': '1'}], max_hops=5, threshold=0.1)
+        assert len(db.queries) > queries
+
+
+class TestCalculateImpactAreas:
+    """Test SpatialOperations.calculate_impact_areas."""
+    
+    def test_bad_event_isolated(self):
+        """Test an event that fails to propagate doesn't fail the others."""
+        spatial = SpatialOperations(MockDB(ADJACENCY))
+        affected = {'good': [{'entity_id': '1'}], 'bad': [{'entity_id': 'not-an-id'}]}
+        spatial.find_intersecting_entities = lambda geometry: affected[geometry]
+        
+        good, bad = spatial.calculate_impact_areas([('good', 'drought'), ('bad', 'flood')])
+        
+        assert good['impact_scores'] == {'1': 1.0, 2: 1.0, 3: 1.0, 4: 0.5}
+        assert 'error' not in good
+        assert 'error' in bad
+        assert bad['total_impacted_count'] == 0
+
+
+class TestParseGeometries:
+    """Test SpatialOperations geometry parsing cache."""
+    
+    def test_reuses_parsed_geometry(self):
+        """Test the same stored geometry is parsed once."""
+        spatial = SpatialOperations(MockDB({}))
+        
+        first = spatial._parse_geometries(['POINT (1 2)'])
+        second = spatial._parse_geometries(['POINT (1 2)'])
+        
+        assert second[0] is first[0]
+    
+    def test_changed_geometry_parsed(self):
+        """Test an entity's updated geometry is not served from the cache."""
+        spatial = SpatialOperations(MockDB({}))
+        spatial._parse_geometries(['POINT (1 2)'])
+        
+        geometries = spatial._parse_geometries(['POINT (3 4)', {'type': 'Point', 'coordinates': [5, 6]}])
+        
+        assert [(g.x, g.y) for g in geometries] == [(3.0, 4.0), (5.0, 6.0)]
+
+
+class TestGeometryBounds:
+    """Test geometry_bounds."""
+    
+    def test_bounds(self):
+        """Test WKT and GeoJSON values get their bounding boxes."""
+        assert geometry_bounds([
+            'POLYGON ((0 0, 2 0, 2 1, 0 1, 0 0))',
+            {'type': 'Point', 'coordinates': [5, 6]}
+        ]) == [(0.0, 0.0, 2.0, 1.0), (5.0, 6.0, 5.0, 6.0)]
+    
+    def test_unreadable(self):
+        """Test unreadable and empty geometries have no bounds."""
+        assert geometry_bounds(['not a geometry', 'POINT EMPTY']) == [None, None]
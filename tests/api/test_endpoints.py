@@ -0,0 +1,153 @@
+"""
+Tests for API endpoints served by ORMKnowledgeGraph
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+pytest.importorskip("httpx")
+
+import falkordb
+from fastapi.testclient import TestClient
+
+from src.core.orm_knowledge_graph import ORMKnowledgeGraph
+
+
+class StubAnalytics:
+    """Stub analytics returning fixed scores."""
+    def pagerank(self, filters=None, parameters=None):
+        return {'1': 0.6, '2': 0.4}
+
+
+class StubSpatial:
+    """Stub spatial operations where every event hits geography 1."""
+    def find_intersecting_geographies(self, geometry):
+        return ['1']
+
+
+class StubRepository:
+    """Stub repository returning fixed search results."""
+    def __init__(self, results):
+        self.results = results
+    
+    def search_by_level_and_name(self, level, search_term):
+        return self.results
+    
+    def search_by_name(self, search_term, limit):
+        return self.results[:limit]
+
+
+def make_stub_graph():
+    """ORMKnowledgeGraph whose database calls are stubbed."""
+    kg = ORMKnowledgeGraph.__new__(ORMKnowledgeGraph)
+    kg.analytics = StubAnalytics()
+    kg.spatial = StubSpatial()
+    kg.geography_repo = StubRepository(['France'])
+    kg.commodity_repo = StubRepository(['Wheat'])
+    kg.queries = []
+    
+    def execute_query(query, parameters=None):
+        kg.queries.append(query)
+        return [
+            {'geo_id': 1, 'entity': {'id': 7, 'type': 'BalanceSheet', 'product': 'Wheat', 'season': '2024/25'}},
+            {'geo_id': 1, 'entity': {'id': 8, 'type': 'Trade', 'from': 'FR', 'to': 'EG', 'commodity': 'Wheat'}},
+        ]
+    
+    kg.execute_query = execute_query
+    return kg
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Test client for the API with a stub knowledge graph and superuser."""
+    # api.main connects to FalkorDB on import, so import it without connecting
+    monkeypatch.setattr(falkordb, 'FalkorDB', MagicMock())
+    monkeypatch.setattr(ORMKnowledgeGraph, '__init__', lambda self, config, security_context=None: None)
+    import api.main as main
+    from api.dependencies import get_current_user
+    
+    monkeypatch.setattr(main, 'kg', make_stub_graph())
+    main.app.dependency_overrides[get_current_user] = lambda: {'sub': 'admin', 'is_superuser': True}
+    yield TestClient(main.app)
+    main.app.dependency_overrides.clear()
+
+
+class TestAnalyticsEndpoint:
+    """Test /analytics endpoint."""
+    
+    def test_pagerank(self, client):
+        """Test running an algorithm returns its results."""
+        response = client.post("/analytics", json={'algorithm': 'pagerank'})
+        
+        assert response.status_code == 200
+        assert response.json() == {'algorithm': 'pagerank', 'results': {'1': 0.6, '2': 0.4}}
+    
+    def test_unknown_algorithm(self, client):
+        """Test unknown algorithms are rejected."""
+        response = client.post("/analytics", json={'algorithm': 'unknown'})
+        
+        assert response.status_code == 400
+        assert 'Unknown algorithm' in response.json()['detail']
+
+
+class TestImpactEndpoint:
+    """Test /impact endpoint."""
+    
+    def test_impacts_scored(self, client):
+        """Test impacted entities are scored for the event type."""
+        response = client.post("/impact", json={
+            'event_geometry': {'type': 'Point', 'coordinates': [2.0, 49.0]},
+            'event_type': 'drought'
+        })
+        
+        assert response.status_code == 200
+        result = response.json()
+        assert result['total_impacts'] == 2
+        assert result['affected_geographies'] == ['1']
+        assert [e['impact_score'] for e in result['impacted_entities']] == [1.0, 0.7]
+        assert result['impacted_entities'][1]['trade_info'] == 'FR -> EG'
+    
+    def test_impact_threshold(self, client):
+        """Test entities below the threshold are dropped."""
+        response = client.post("/impact", json={
+            'event_geometry': {'type': 'Point', 'coordinates': [2.0, 49.0]},
+            'event_type': 'drought',
+            'impact_threshold': 0.8
+        })
+        
+        assert response.status_code == 200
+        assert [e['entity_id'] for e in response.json()['impacted_entities']] == [7]
+    
+    def test_max_hops(self, client):
+        """Test max_hops sets how far trade flows are followed."""
+        import api.main as main
+        
+        response = client.post("/impact", json={
+            'event_geometry': {'type': 'Point', 'coordinates': [2.0, 49.0]},
+            'event_type': 'drought',
+            'max_hops': 2
+        })
+        
+        assert response.status_code == 200
+        assert main.kg.queries[0].count("OPTIONAL MATCH (f)-[:TRADES_WITH]->") == 1
+
+
+class TestSearchEndpoint:
+    """Test /search endpoint."""
+    
+    def test_search_all_types(self, client):
+        """Test every entity type is searched."""
+        response = client.get("/search", params={'q': 'fr'})
+        
+        assert response.status_code == 200
+        assert response.json()['results'] == [
+            {'type': 'Geography', 'entity': 'France'},
+            {'type': 'Commodity', 'entity': 'Wheat'}
+        ]
+    
+    def test_search_entity_types_and_limit(self, client):
+        """Test entity_types filters the search and limit caps results."""
+        response = client.get("/search", params={'q': 'fr', 'entity_types': 'Commodity', 'limit': 1})
+        
+        assert response.status_code == 200
+        assert response.json()['results'] == [{'type': 'Commodity', 'entity': 'Wheat'}]
@@ -0,0 +1,52 @@
+"""
+Shared test setup: stand-in modules for optional heavy dependencies
+
+graphiti_core and the langchain packages are only needed to talk to a real
+LLM, so when they are not installed the pieces src.core imports from them
+are replaced with inert stubs. Tests use their own stub clients throughout.
+"""
+
+import importlib.util
+import sys
+import types
+
+
+def _missing(name):
+    """Whether the top-level package of a module cannot be imported."""
+    package = name.split('.')[0]
+    return package not in sys.modules and importlib.util.find_spec(package) is None
+
+
+def _stub_module(name, **attrs):
+    """Register a stub module under name, creating parent modules as needed."""
+    parent, _, child = name.rpartition('.')
+    if parent and parent not in sys.modules:
+        _stub_module(parent)
+    module = sys.modules.setdefault(name, types.ModuleType(name))
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    for attr, value in attrs.items():
+        setattr(module, attr, value)
+    return module
+
+
+def _unavailable(*args, **kwargs):
+    """Stand-in for a client class that tests must never construct."""
+    raise RuntimeError("Optional dependency is not installed")
+
+
+if _missing('graphiti_core'):
+    _stub_module('graphiti_core', Graphiti=_unavailable)
+    _stub_module('graphiti_core.nodes', EpisodeType=types.SimpleNamespace(text='text'))
+    _stub_module('graphiti_core.driver.driver', GraphDriver=object)
+    _stub_module('graphiti_core.driver.falkordb_driver', FalkorDriver=_unavailable)
+    _stub_module('graphiti_core.utils.bulk_utils', RawEpisode=types.SimpleNamespace)
+
+if _missing('langchain_openai'):
+    _stub_module('langchain_openai', ChatOpenAI=_unavailable)
+
+if _missing('langchain_core'):
+    _stub_module(
+        'langchain_core.prompts',
+        ChatPromptTemplate=types.SimpleNamespace(from_messages=lambda messages: None)
+    )
@@ -0,0 +1,166 @@
+"""
+Tests for FalkorDBClient pipelined and bulk writes
+"""
+
+import pytest
+import threading
+from collections import OrderedDict
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from src.core.falkordb_client import FalkorDBClient, _cypher_literal, _query_command
+
+
+# Node IDs present in the stub graph
+NODES = {1, 2, 3}
+
+
+def make_client():
+    """FalkorDBClient whose pipeline creates relationships between NODES."""
+    client = FalkorDBClient.__new__(FalkorDBClient)
+    client.queries = []
+    
+    def execute_pipeline(queries):
+        client.queries.extend(queries)
+        results = []
+        for _, params in queries:
+            # Rows come back grouped by query, not in input order
+            rows = [row for row in reversed(params['rows']) if {row['source_id'], row['target_id']} <= NODES]
+            results.append([{'i': row['i'], 'rel_id': 100 + row['i']} for row in rows])
+        return results
+    
+    client.execute_pipeline = execute_pipeline
+    return client
+
+
+# Compact GRAPH.QUERY reply to "RETURN $x AS x, 1 AS i" with x = [1, 'a"b']
+COMPACT_REPLY = [
+    [[1, 'x'], [1, 'i']],
+    [[[6, [[3, 1], [2, 'a"b']]], [3, 1]]],
+    ['Cached execution: 0', 'Query internal execution time: 0.1 milliseconds']
+]
+
+
+class StubPipeline:
+    """Stub Redis pipeline recording commands and replying with COMPACT_REPLY."""
+    def __init__(self):
+        self.commands = []
+    
+    def execute_command(self, *args):
+        self.commands.append(args)
+    
+    def execute(self):
+        return [COMPACT_REPLY for _ in self.commands]
+
+
+class TestQueryCommand:
+    """Test CYPHER parameter header rendering."""
+    
+    def test_literals(self):
+        """Test each parameter type renders as a Cypher literal."""
+        assert _cypher_literal('say "hi" \\o/') == '"say \\"hi\\" \\\\o/"'
+        assert _cypher_literal(None) == 'null'
+        assert _cypher_literal(True) == 'true'
+        assert _cypher_literal([1, 2.5, 'a']) == '[1,2.5,"a"]'
+        assert _cypher_literal({'@type': 'x', 'n': [1]}) == '{`@type`:"x",`n`:[1]}'
+    
+    def test_unsupported_value(self):
+        """Test values with no Cypher literal are rejected."""
+        with pytest.raises(TypeError):
+            _cypher_literal(object())
+    
+    def test_header(self):
+        """Test parameters are sent in a CYPHER header before the query."""
+        assert _query_command("RETURN $a", {'a': 1, 'b': 'x'}) == 'CYPHER `a`=1 `b`="x" RETURN $a'
+        assert _query_command("RETURN 1", None) == "RETURN 1"
+
+
+class TestExecutePipeline:
+    """Test execute_pipeline."""
+    
+    def test_replies_parsed_in_order(self):
+        """Test every query is sent on one pipeline and each reply becomes row dicts."""
+        pipeline = StubPipeline()
+        client = FalkorDBClient.__new__(FalkorDBClient)
+        client.graph_name = 'test'
+        client.graph = MagicMock()
+        client.client = SimpleNamespace(connection=SimpleNamespace(pipeline=lambda transaction: pipeline))
+        client._column_cache = OrderedDict()
+        client._column_cache_lock = threading.Lock()
+        
+        results = client.execute_pipeline([("RETURN $x AS x, 1 AS i", {'x': [1, 'a"b']}), ("RETURN 1", None)])
+        
+        assert results == [[{'x': [1, 'a"b'], 'i': 1}]] * 2
+        assert pipeline.commands[0] == (
+            "GRAPH.QUERY", 'test', 'CYPHER `x`=[1,"a\\"b"] RETURN $x AS x, 1 AS i', "--compact"
+        )
+
+
+class TestIterQueryRows:
+    """Test iter_query_rows."""
+    
+    def test_rows_built_lazily(self):
+        """Test one query runs and row dicts are yielded keyed by column."""
+        client = FalkorDBClient.__new__(FalkorDBClient)
+        client.graph = MagicMock()
+        client.graph.query.return_value = SimpleNamespace(header=[[1, 'a'], [1, 'b']], result_set=[[1, 2], [3, 4]])
+        client._column_cache = OrderedDict()
+        client._column_cache_lock = threading.Lock()
+        
+        rows = client.iter_query_rows("RETURN 1 AS a, 2 AS b")
+        
+        assert next(rows) == {'a': 1, 'b': 2}
+        assert list(rows) == [{'a': 3, 'b': 4}]
+        client.graph.query.assert_called_once()
+
+
+class TestCreateRelationshipsBulk:
+    """Test create_relationships_bulk."""
+    
+    def test_ids_in_input_order(self):
+        """Test relationship IDs follow the input order across types and batches."""
+        client = make_client()
+        relationships = [
+            {'source_id': '1', 'target_id': '2', 'relationship_type': 'TRADES_WITH'},
+            {'source_id': '2', 'target_id': '3', 'relationship_type': 'FOR_GEOGRAPHY'},
+            {'source_id': '3', 'target_id': '1', 'relationship_type': 'TRADES_WITH'},
+            {'source_id': '1', 'target_id': '3', 'relationship_type': 'TRADES_WITH', 'properties': {'commodity': 'Wheat'}},
+        ]
+        
+        rel_ids = client.create_relationships_bulk(relationships, batch_size=2)
+        
+        assert rel_ids == ['100', '101', '102', '103']
+        assert len(client.queries) == 3
+        assert ':TRADES_WITH]' in client.queries[0][0]
+        assert client.queries[1][1]['rows'][0]['props'] == {'commodity': 'Wheat'}
+    
+    def test_missing_endpoint(self):
+        """Test relationships whose endpoints don't exist get None."""
+        client = make_client()
+        relationships = [
+            {'source_id': '1', 'target_id': '9', 'relationship_type': 'TRADES_WITH'},
+            {'source_id': '1', 'target_id': '2', 'relationship_type': 'TRADES_WITH'},
+        ]
+        
+        assert client.create_relationships_bulk(relationships) == [None, '101']
+
+
+class TestCreateEntitiesBulk:
+    """Test create_entities_bulk."""
+    
+    def test_geometry_bounds_stored(self):
+        """Test nodes with a geometry are created with its bounding box."""
+        client = FalkorDBClient.__new__(FalkorDBClient)
+        client.graph = MagicMock()
+        client.graph.query.return_value = SimpleNamespace(result_set=[[1], [2], [3]])
+        
+        ids = client.create_entities_bulk('Geometry', [
+            {'geometry': 'POLYGON ((0 0, 2 0, 2 1, 0 1, 0 0))'},
+            {'geometry': 'not a geometry', 'minx': 5.0},
+            {'name': 'France'}
+        ])
+        
+        rows = client.graph.query.call_args[0][1]['rows']
+        assert ids == ['1', '2', '3']
+        assert rows[0] == {'geometry': 'POLYGON ((0 0, 2 0, 2 1, 0 1, 0 0))', 'minx': 0.0, 'miny': 0.0, 'maxx': 2.0, 'maxy': 1.0}
+        assert rows[1] == {'geometry': 'not a geometry', 'minx': None, 'miny': None, 'maxx': None, 'maxy': None}
+        assert rows[2] == {'name': 'France'}
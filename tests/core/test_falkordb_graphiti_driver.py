@@ -0,0 +1,130 @@
+"""
+Tests for FalkorDBGraphitiDriver fulltext search
+"""
+
+import asyncio
+
+import pytest
+
+from src.core.falkordb_graphiti_driver import FalkorDBGraphitiDriver, _fulltext_terms
+
+
+def make_driver(fail_index_query=False, indexes=(('NODE', 'Entity'), ('RELATIONSHIP', 'RELATES_TO'))):
+    """Driver with fulltext indexes in place and queries recorded instead of run."""
+    driver = FalkorDBGraphitiDriver.__new__(FalkorDBGraphitiDriver)
+    driver.graph_name = 'test'
+    driver._fulltext_indexes = set(indexes)
+    driver.queries = []
+    
+    async def execute_query(query, parameters=None, **kwargs):
+        driver.queries.append((query, parameters))
+        if fail_index_query and 'db.idx.fulltext' in query:
+            raise Exception("RediSearch: Syntax error")
+        return [{'query': query}]
+    
+    driver.execute_query = execute_query
+    return driver
+
+
+class StubGraph:
+    """Stub graph recording queries and failing index creation for chosen labels."""
+    def __init__(self, existing=(), failing=()):
+        self.existing = set(existing)
+        self.failing = set(failing)
+        self.queries = []
+    
+    async def query(self, query, params=None):
+        self.queries.append(query)
+        if any(f":{label})" in query or f":{label}]" in query for label in self.failing):
+            raise Exception("Unknown error")
+        if any(f":{label})" in query or f":{label}]" in query for label in self.existing):
+            raise Exception("Attribute 'content' is already indexed")
+
+
+class TestFulltextTerms:
+    """Test query-syntax removal from search text."""
+    
+    def test_syntax_characters_removed(self):
+        """Test RediSearch operators become term separators."""
+        assert _fulltext_terms("US-China") == ["us", "china"]
+        assert _fulltext_terms("(USD) up|down @home *star") == ["usd", "up", "down", "home", "star"]
+    
+    def test_plain_text_unchanged(self):
+        """Test plain search text is split into lower-cased terms."""
+        assert _fulltext_terms("Wheat  exports") == ["wheat", "exports"]
+    
+    def test_only_syntax(self):
+        """Test search text with no terms becomes empty."""
+        assert _fulltext_terms("--- |") == []
+
+
+class TestBuildFulltextIndexes:
+    """Test fulltext index creation at setup."""
+    
+    def test_indexes_created_once(self):
+        """Test each configured label gets an index, existing ones included."""
+        driver = FalkorDBGraphitiDriver.__new__(FalkorDBGraphitiDriver)
+        driver.fulltext_node_labels = ('Entity', 'Episodic')
+        driver.fulltext_relationship_types = ('RELATES_TO',)
+        driver.graph = StubGraph(existing={'Entity'}, failing={'Episodic'})
+        
+        asyncio.run(driver.build_fulltext_indexes())
+        
+        assert driver._fulltext_indexes == {('NODE', 'Entity'), ('RELATIONSHIP', 'RELATES_TO')}
+        assert driver.graph.queries[2] == "CREATE FULLTEXT INDEX FOR ()-[e:RELATES_TO]-() ON (e.content, e.description)"
+    
+    def test_invalid_label_rejected(self):
+        """Test labels that are not identifiers never reach the index DDL."""
+        with pytest.raises(ValueError):
+            FalkorDBGraphitiDriver(fulltext_node_labels=['Entity) ON (e.x'])
+
+
+class TestFulltextSearch:
+    """Test fulltext search query selection."""
+    
+    def test_index_search_uses_terms(self):
+        """Test the index query receives cleaned terms."""
+        driver = make_driver()
+        
+        asyncio.run(driver.node_fulltext_search("US-China", ['Entity']))
+        
+        query, params = driver.queries[0]
+        assert 'db.idx.fulltext.queryNodes' in query
+        assert params['search_text'] == "us china"
+    
+    def test_unindexed_label_scans(self):
+        """Test labels without an index are scanned with the same terms, creating nothing."""
+        driver = make_driver(indexes=())
+        
+        asyncio.run(driver.node_fulltext_search("US-China", ['Entity']))
+        
+        assert len(driver.queries) == 1
+        query, params = driver.queries[0]
+        assert 'db.idx.fulltext' not in query
+        assert params['terms'] == ["us", "china"]
+    
+    def test_index_failure_falls_back(self):
+        """Test a failing index query falls back to the scan."""
+        driver = make_driver(fail_index_query=True)
+        
+        results = asyncio.run(driver.edge_fulltext_search("US-China", ['RELATES_TO']))
+        
+        assert len(driver.queries) == 2
+        query, params = driver.queries[1]
+        assert 'ALL(term IN $terms' in query
+        assert params['terms'] == ["us", "china"]
+        assert results == [{'query': query}]
+    
+    def test_no_terms(self):
+        """Test search text with no terms matches nothing."""
+        driver = make_driver()
+        
+        assert asyncio.run(driver.node_fulltext_search("--", ['Entity'])) == []
+        assert driver.queries == []
+    
+    def test_invalid_label_not_queried(self):
+        """Test search labels that are not identifiers are never interpolated."""
+        driver = make_driver(indexes=())
+        
+        assert asyncio.run(driver.node_fulltext_search("wheat", ['Entity) DETACH DELETE (n'])) == []
+        assert driver.queries == []
@@ -0,0 +1,150 @@
+"""
+Tests for GraphitiEngine episode writes
+"""
+
+import asyncio
+
+from src.core.graphiti_engine import GraphitiEngine, _EmbeddingCoalescer
+
+
+class StubEmbedder:
+    """Stub embedder recording single and batch requests."""
+    def __init__(self):
+        self.single = []
+        self.batches = []
+    
+    async def create(self, input_data):
+        self.single.append(input_data)
+        return [0.0]
+    
+    async def create_batch(self, input_data_list):
+        self.batches.append(list(input_data_list))
+        return [[float(len(text))] for text in input_data_list]
+
+
+class StubClient:
+    """Stub Graphiti client whose add_episode fails for chosen names, or never returns."""
+    def __init__(self, failing=(), hang=False):
+        self.failing = set(failing)
+        self.hang = hang
+        self.episodes = []
+    
+    async def add_episode(self, **episode):
+        self.episodes.append(episode)
+        if self.hang:
+            await asyncio.Event().wait()
+        if episode['name'] in self.failing:
+            raise Exception("LLM extraction failed")
+
+
+def make_engine(client):
+    """GraphitiEngine using client and no database."""
+    engine = GraphitiEngine.__new__(GraphitiEngine)
+    engine.config = {'episode_batch_timeout_seconds': 0.01}
+    engine.client = client
+    engine._search_cache = {}
+    engine._search_generation = 0
+    engine._episode_queue = None
+    engine._episode_flusher = None
+    return engine
+
+
+class TestAddEntityEpisode:
+    """Test batched add_entity_episode writes."""
+    
+    def test_episodes_added_individually(self):
+        """Test each episode goes through add_episode."""
+        client = StubClient()
+        engine = make_engine(client)
+        
+        async def add():
+            await asyncio.gather(
+                engine.add_entity_episode('1', 'Wheat exports'),
+                engine.add_entity_episode('2', 'Corn imports', {'source': 'USDA'})
+            )
+        asyncio.run(add())
+        
+        assert [e['name'] for e in client.episodes] == ['entity_1', 'entity_2']
+        assert client.episodes[1]['source_description'] == 'USDA'
+    
+    def test_failure_isolated(self):
+        """Test one failing episode does not fail the rest of its batch."""
+        client = StubClient(failing={'entity_1'})
+        engine = make_engine(client)
+        
+        async def add():
+            return await asyncio.gather(
+                engine.add_entity_episode('1', 'Wheat exports'),
+                engine.add_entity_episode('2', 'Corn imports'),
+                return_exceptions=True
+            )
+        results = asyncio.run(add())
+        
+        assert results == [None, None]
+        assert len(client.episodes) == 2
+
+
+class TestClose:
+    """Test stopping the episode writer."""
+    
+    def test_pending_episodes_fail(self):
+        """Test close fails episodes being written and still queued."""
+        engine = make_engine(StubClient(hang=True))
+        engine.config['episode_batch_size'] = 1
+        
+        async def add_then_close():
+            adds = [asyncio.ensure_future(engine.add_entity_episode(str(i), 'Wheat')) for i in range(3)]
+            await asyncio.sleep(0.05)
+            await engine.close()
+            return await asyncio.gather(*adds, return_exceptions=True)
+        results = asyncio.run(asyncio.wait_for(add_then_close(), 1))
+        
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert engine._episode_flusher is None
+    
+    def test_close_unused(self):
+        """Test closing an engine that never wrote an episode."""
+        engine = make_engine(StubClient())
+        
+        asyncio.run(engine.close())
+        
+        assert engine._episode_queue is None
+
+
+class TestEmbeddingCoalescer:
+    """Test _EmbeddingCoalescer batching."""
+    
+    def test_concurrent_texts_batched(self):
+        """Test concurrent single-text requests share one batch request."""
+        embedder = StubEmbedder()
+        _EmbeddingCoalescer(embedder, batch_size=64, timeout=0.01).install()
+        
+        async def embed():
+            return await asyncio.gather(embedder.create("ab"), embedder.create("abc"))
+        embeddings = asyncio.run(embed())
+        
+        assert embeddings == [[2.0], [3.0]]
+        assert embedder.batches == [["ab", "abc"]]
+        assert embedder.single == []
+    
+    def test_batch_size(self):
+        """Test a full batch is sent without waiting for the timeout."""
+        embedder = StubEmbedder()
+        _EmbeddingCoalescer(embedder, batch_size=2, timeout=10).install()
+        
+        async def embed():
+            return await asyncio.gather(*(embedder.create(text) for text in ["a", "b", "c", "d"]))
+        embeddings = asyncio.run(asyncio.wait_for(embed(), 1))
+        
+        assert embeddings == [[1.0]] * 4
+        assert embedder.batches == [["a", "b"], ["c", "d"]]
+    
+    def test_non_text_passed_through(self):
+        """Test inputs other than a single string use the original create."""
+        embedder = StubEmbedder()
+        _EmbeddingCoalescer(embedder, batch_size=64, timeout=0.01).install()
+        
+        asyncio.run(embedder.create(["a", "b"]))
+        
+        assert embedder.single == [["a", "b"]]
+        assert embedder.batches == []
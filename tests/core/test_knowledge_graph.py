@@ -0,0 +1,165 @@
+"""
+Tests for TijaraKnowledgeGraph ingestion and maintenance
+"""
+
+import asyncio
+from collections import OrderedDict
+from unittest.mock import MagicMock
+
+from src.analytics.impact_scoring import IMPACT_COLUMNS
+from src.core.knowledge_graph import TijaraKnowledgeGraph
+
+
+def make_knowledge_graph():
+    """TijaraKnowledgeGraph with mocked components and no database."""
+    kg = TijaraKnowledgeGraph.__new__(TijaraKnowledgeGraph)
+    kg.config = {}
+    kg.falkordb = MagicMock()
+    kg.falkordb.execute_query.return_value = [{'deleted': 0}]
+    kg.falkordb.create_entities_bulk.return_value = ['10', '11']
+    kg.falkordb.create_relationships_bulk.return_value = []
+    kg.graphiti = MagicMock()
+    kg.graphiti.is_ready.return_value = False
+    kg.ontology = MagicMock()
+    kg.ontology.determine_placement.return_value = {'entity_type': 'Production'}
+    kg.analytics = MagicMock()
+    kg.spatial = MagicMock()
+    kg.extractor = MagicMock()
+    kg._concept_cache = OrderedDict()
+    kg._concept_cache_size = 16
+    kg._schema_cache = None
+    return kg
+
+
+class TestMaterializedScoreInvalidation:
+    """Test materialized scores and spatial caches are invalidated on writes."""
+    
+    def test_ingest_invalidates(self):
+        """Test ingesting entities invalidates materialized scores."""
+        kg = make_knowledge_graph()
+        
+        asyncio.run(kg.ingest_data([{'value': 1}, {'value': 2}], {'type': 'Production'}, validate=False))
+        
+        kg.analytics.invalidate_materialized_scores.assert_called_once()
+        kg.spatial.clear_cache.assert_called_once()
+    
+    def test_empty_ingest_keeps_scores(self):
+        """Test ingesting nothing leaves materialized scores alone."""
+        kg = make_knowledge_graph()
+        kg.falkordb.create_entities_bulk.return_value = []
+        
+        asyncio.run(kg.ingest_data([], {'type': 'Production'}, validate=False))
+        
+        kg.analytics.invalidate_materialized_scores.assert_not_called()
+        kg.spatial.clear_cache.assert_not_called()
+    
+    def test_clear_invalidates(self):
+        """Test clearing the graph invalidates materialized scores."""
+        kg = make_knowledge_graph()
+        
+        asyncio.run(kg.clear_all_data())
+        
+        kg.analytics.invalidate_materialized_scores.assert_called_once()
+
+
+class TestIngestValidation:
+    """Test ingest_data validation of per-record metadata."""
+    
+    def test_unhashable_metadata_validated_once(self):
+        """Test record metadata with list and dict values is checked once per distinct value."""
+        kg = make_knowledge_graph()
+        kg.ontology.validate_data.return_value = {'errors': []}
+        kg._get_or_create_concepts_bulk = lambda metadata_list: [{} for _ in metadata_list]
+        records_metadata = [
+            {'sources': ['USDA', 'FAO'], 'extra': {'unit': 't'}},
+            {'sources': ['USDA', 'FAO'], 'extra': {'unit': 't'}},
+            {'sources': ['FAO']}
+        ]
+        
+        asyncio.run(kg.ingest_data([{'value': 1}] * 3, {'type': 'Production'}, records_metadata=records_metadata))
+        
+        assert kg.ontology.validate_data.call_count == 3
+
+
+class TestClearAllData:
+    """Test clear_all_data."""
+    
+    def test_clears_caches(self):
+        """Test id-keyed caches are dropped along with the data."""
+        kg = make_knowledge_graph()
+        kg._concept_cache[('Commodity', 'Wheat')] = '1'
+        kg._schema_cache = (0.0, ['HAS_COMMODITY'])
+        
+        asyncio.run(kg.clear_all_data())
+        
+        assert not kg._concept_cache
+        assert kg._schema_cache is None
+        kg.spatial.clear_cache.assert_called_once()
+        kg.extractor.clear_cache.assert_called_once()
+
+
+class TestFindImpacts:
+    """Test find_impacts."""
+    
+    def test_impacts_scored(self):
+        """Test connected entities of affected geographies are scored."""
+        kg = make_knowledge_graph()
+        kg.spatial.find_intersecting_geographies.return_value = ['1']
+        kg.falkordb.iter_query_rows.return_value = iter([
+            {'geo_id': 1, 'entity': {'type': 'BalanceSheet', 'id': 7, 'product': 'Wheat'}},
+            {'geo_id': 1, 'entity': {'type': 'Trade', 'from': 'FR', 'to': 'EG', 'commodity': 'Wheat'}},
+        ])
+        
+        result = asyncio.run(kg.find_impacts({'type': 'Point'}, 'drought'))
+        
+        assert result['total_impacts'] == 2
+        assert [e['affected_geography'] for e in result['impacted_entities']] == ['1', '1']
+        assert result['impacted_entities'][1]['trade_info'] == 'FR -> EG'
+        assert result['impacted_entities'][0]['path'] == ['1']
+    
+    def test_as_dataframe(self):
+        """Test impacts can be returned as a DataFrame with float32 scores."""
+        kg = make_knowledge_graph()
+        kg.spatial.find_intersecting_geographies.return_value = ['1']
+        kg.falkordb.iter_query_rows.return_value = iter([
+            {'geo_id': 1, 'entity': {'type': 'BalanceSheet', 'id': 7, 'product': 'Wheat'}},
+        ])
+        
+        result = asyncio.run(kg.find_impacts({'type': 'Point'}, 'drought', as_dicts=False))
+        
+        impacts = result['impacted_entities']
+        assert list(impacts.columns) == IMPACT_COLUMNS
+        assert impacts['impact_score'].dtype == 'float32'
+        assert impacts.to_dict('records')[0]['commodity'] == 'Wheat'
+    
+    def test_max_hops(self):
+        """Test max_hops sets how far the query follows trade flows."""
+        kg = make_knowledge_graph()
+        kg.spatial.find_intersecting_geographies.return_value = ['1']
+        kg.falkordb.iter_query_rows.return_value = iter([])
+        
+        asyncio.run(kg.find_impacts({'type': 'Point'}, 'policy', max_hops=3))
+        
+        query = kg.falkordb.iter_query_rows.call_args[0][0]
+        assert query.count("OPTIONAL MATCH (f)-[:TRADES_WITH]->") == 2
+    
+    def test_zero_hops(self):
+        """Test max_hops below 1 reaches nothing without querying."""
+        kg = make_knowledge_graph()
+        kg.spatial.find_intersecting_geographies.return_value = ['1']
+        
+        result = asyncio.run(kg.find_impacts({'type': 'Point'}, 'policy', max_hops=0))
+        
+        assert result['total_impacts'] == 0
+        kg.falkordb.iter_query_rows.assert_not_called()
+    
+    def test_query_failure(self):
+        """Test a failing impacts query gives no impacts for any geography."""
+        kg = make_knowledge_graph()
+        kg.spatial.find_intersecting_geographies.return_value = ['1', '2']
+        kg.falkordb.iter_query_rows.side_effect = Exception("Query timed out")
+        
+        result = asyncio.run(kg.find_impacts({'type': 'Point'}, 'drought'))
+        
+        assert result['total_impacts'] == 0
+        assert result['affected_geographies'] == ['1', '2']